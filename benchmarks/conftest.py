@@ -0,0 +1,102 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import copy
+import inspect
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from vss_tools.main import get_trees
+from vss_tools.synthetic import SyntheticSpec, generate
+from vss_tools.tree import VSSNode
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("synthetic", "synthetic spec used for benchmarking")
+    group.addoption("--synthetic-nodes", type=int, default=500, help="Nodes of the unexpanded signal tree.")
+    group.addoption("--synthetic-branching", type=int, default=5, help="Children per branch.")
+    group.addoption("--synthetic-instance-density", type=float, default=0.05, help="Share of branches with instances.")
+    group.addoption("--synthetic-structs", type=int, default=10, help="Amount of structs in the types tree.")
+    group.addoption("--synthetic-overlays", type=int, default=1, help="Amount of stacked overlays.")
+    group.addoption("--synthetic-include-depth", type=int, default=1, help="Branch levels split into includes.")
+    group.addoption("--synthetic-seed", type=int, default=0, help="Seed of the generator.")
+
+
+def generate_spec(config: pytest.Config, target: Path, with_structs: bool = True) -> SyntheticSpec:
+    return generate(
+        target,
+        nodes=config.getoption("--synthetic-nodes"),
+        branching=config.getoption("--synthetic-branching"),
+        instance_density=config.getoption("--synthetic-instance-density"),
+        structs=config.getoption("--synthetic-structs") if with_structs else 0,
+        overlays=config.getoption("--synthetic-overlays"),
+        include_depth=config.getoption("--synthetic-include-depth"),
+        seed=config.getoption("--synthetic-seed"),
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_spec(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> SyntheticSpec:
+    return generate_spec(request.config, tmp_path_factory.mktemp("synthetic"))
+
+
+@pytest.fixture(scope="session")
+def synthetic_spec_without_structs(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> SyntheticSpec:
+    """
+    Same spec without struct datatypes for exporters that do not support types
+    """
+    return generate_spec(request.config, tmp_path_factory.mktemp("synthetic"), with_structs=False)
+
+
+@pytest.fixture(scope="session")
+def spec_args() -> Callable[[SyntheticSpec, bool], list[str]]:
+    """
+    Command line arguments of a synthetic spec, with its types if requested
+    """
+
+    def get_args(spec: SyntheticSpec, with_types: bool) -> list[str]:
+        args = ["--vspec", str(spec.vspec), "-u", str(spec.units), "-q", str(spec.quantities)]
+        for overlay in spec.overlays:
+            args.extend(["-l", str(overlay)])
+        for types in spec.types if with_types else ():
+            args.extend(["-t", str(types)])
+        return args
+
+    return get_args
+
+
+class LoadedTrees:
+    """
+    Stands in for 'get_trees' of an exporter, so that only the export is measured.
+    The trees are loaded once per arguments, 'prepare' copies them before every round,
+    since exporters may modify the tree
+    """
+
+    def __init__(self) -> None:
+        self.trees: dict[str, tuple[VSSNode, VSSNode | None]] = {}
+        self.copies: dict[str, tuple[VSSNode, VSSNode | None]] = {}
+
+    def __call__(self, *args: Any, **kwargs: Any) -> tuple[VSSNode, VSSNode | None]:
+        arguments = inspect.signature(get_trees).bind(*args, **kwargs).arguments
+        key = repr(sorted(arguments.items()))
+        if key not in self.trees:
+            self.trees[key] = get_trees(**arguments)
+        if key in self.copies:
+            return self.copies.pop(key)
+        return copy.deepcopy(self.trees[key])
+
+    def prepare(self) -> None:
+        self.copies = {key: copy.deepcopy(trees) for key, trees in self.trees.items()}
+
+
+@pytest.fixture
+def loaded_trees() -> LoadedTrees:
+    return LoadedTrees()
@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+# The exporters run in-process on trees loaded once before the measurement, so the runs measure the export
+# without interpreter startup, imports and loading the spec. Runs are done in the temporary directory, so
+# outputs without an explicit location stay there
+
+import shutil
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+import rich_click as click
+from click.testing import CliRunner
+from vss_tools.cli import export
+from vss_tools.synthetic import SyntheticSpec
+
+EXPORTERS = sorted(export.lazy_subcommands.keys())
+
+# Option taking the output location, by parameter name of the exporter
+OUTPUT_OPTIONS = {
+    "output": "--output",
+    "output_dir": "--output-dir",
+    "target_folder": "--target-folder",
+}
+
+# Option taking the output directory of the types, by parameter name of the exporter
+TYPES_OUTPUT_OPTIONS = {
+    "types_out_dir": "--types-out-dir",
+}
+
+# Optional dependency, by exporter
+OPTIONAL_DEPENDENCIES = {
+    "parquet": "pyarrow",
+}
+
+
+def get_params(exporter: str) -> set[str]:
+    return {p.name for p in export.get_command(None, exporter).params}
+
+
+def get_exporter_args(exporter: str, spec_args: list[str], output_dir: Path) -> list[str]:
+    params = get_params(exporter)
+    args = list(spec_args)
+    for name, option in OUTPUT_OPTIONS.items():
+        if name in params:
+            args.extend([option, str(output_dir / exporter)])
+            break
+    for name, option in TYPES_OUTPUT_OPTIONS.items():
+        if name in params:
+            args.extend([option, str(output_dir / f"{exporter}_types")])
+    return args
+
+
+def run_exporter(command: click.Command, args: list[str]) -> None:
+    result = CliRunner().invoke(command, args, catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+
+
+def remove_outputs(output_dir: Path) -> None:
+    """
+    Some exporters refuse to write into an existing output, so every round starts without one
+    """
+    for path in output_dir.iterdir():
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+
+@pytest.mark.parametrize("exporter", EXPORTERS)
+def test_exporter(
+    benchmark,
+    exporter: str,
+    synthetic_spec: SyntheticSpec,
+    synthetic_spec_without_structs: SyntheticSpec,
+    spec_args: Callable[[SyntheticSpec, bool], list[str]],
+    loaded_trees,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    if exporter in OPTIONAL_DEPENDENCIES:
+        pytest.importorskip(OPTIONAL_DEPENDENCIES[exporter])
+    with_types = "types" in get_params(exporter)
+    spec = synthetic_spec if with_types else synthetic_spec_without_structs
+    command = export.get_command(None, exporter)
+    monkeypatch.setattr(sys.modules[command.callback.__module__], "get_trees", loaded_trees)
+    monkeypatch.chdir(tmp_path)
+    args = get_exporter_args(exporter, spec_args(spec, with_types), tmp_path)
+    # The warmup round loads the trees
+    benchmark.pedantic(
+        run_exporter,
+        args=(command, args),
+        setup=loaded_trees.prepare,
+        teardown=lambda *_: remove_outputs(tmp_path),
+        rounds=10,
+        warmup_rounds=1,
+    )
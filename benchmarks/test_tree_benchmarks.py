@@ -0,0 +1,53 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from typing import Any
+
+import pytest
+from vss_tools.main import get_types_root, load_quantities_and_units
+from vss_tools.synthetic import SyntheticSpec
+from vss_tools.tree import VSSNode, build_tree
+from vss_tools.vspec import load_vspec
+
+
+@pytest.fixture(scope="module")
+def vspec_data(synthetic_spec: SyntheticSpec) -> dict[str, Any]:
+    load_quantities_and_units((synthetic_spec.quantities,), (synthetic_spec.units,), synthetic_spec.vspec.parent)
+    get_types_root(synthetic_spec.types, [])
+    return load_vspec([], [synthetic_spec.vspec, *synthetic_spec.overlays]).data
+
+
+def get_tree(data: dict[str, Any], expand: bool = False) -> VSSNode:
+    root, _ = build_tree(data, connect_orphans=True)
+    if expand:
+        root.expand_instances()
+    return root
+
+
+def test_load_vspec(benchmark, synthetic_spec: SyntheticSpec) -> None:
+    benchmark(load_vspec, [], [synthetic_spec.vspec, *synthetic_spec.overlays])
+
+
+def test_build_tree(benchmark, vspec_data: dict[str, Any]) -> None:
+    benchmark(build_tree, vspec_data, connect_orphans=True)
+
+
+def test_expand_instances(benchmark, vspec_data: dict[str, Any]) -> None:
+    benchmark.pedantic(
+        VSSNode.expand_instances,
+        setup=lambda: ((get_tree(vspec_data),), {}),
+        rounds=5,
+    )
+
+
+def test_resolve(benchmark, vspec_data: dict[str, Any]) -> None:
+    benchmark.pedantic(
+        VSSNode.resolve,
+        setup=lambda: ((get_tree(vspec_data, expand=True),), {}),
+        rounds=5,
+    )
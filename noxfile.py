@@ -19,3 +19,21 @@ def tests(session):
         "--cov-fail-under=88",
         *session.posargs,
     )
+
+
+@nox.session(python=PYTHON_VERSIONS[-1])
+def benchmarks(session):
+    session.run_install(
+        "uv",
+        "sync",
+        env={"UV_PROJECT_ENVIRONMENT": session.virtualenv.location},
+    )
+    session.install("pytest-benchmark")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "--benchmark-storage=benchmarks/baselines",
+        "--benchmark-compare",
+        "--benchmark-group-by=func",
+        *session.posargs,
+    )
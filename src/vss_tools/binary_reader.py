@@ -0,0 +1,522 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+# Reading binary trees exported by 'vspec export binary'.
+#
+# Both formats are memory mapped and decoded lazily,
+# strings are only decoded when they are accessed.
+#
+# The default format (v1) is a pre-order stream of nodes, see 'exporters/binary.py'.
+# It gets scanned once on opening to get the node offsets and children.
+# Its length prefixes count characters while only as many bytes are stored,
+# so non-ASCII strings are truncated in the file and decoded with replacement characters.
+#
+# The indexed format (v2) is designed to be memory mapped and
+# queried without parsing the whole file. All integers are little endian.
+#
+# header:  magic "VSSB", version (uint16), record size (uint16),
+#          node count, nodes offset, index offset,
+#          string table offset, string table size (uint32 each), reserved (uint32)
+# nodes:   fixed size records in breadth-first order (root is node 0),
+#          children of a node are contiguous:
+#          type (uint8), 3 bytes padding, parent (int32, -1 for the root),
+#          first child, child count (uint32 each),
+#          followed by (offset, length) string references (uint32 each) for
+#          name, description, datatype, min, max, unit, allowed, default, validate
+# index:   (hash (uint64), node (uint32), padding (uint32)) sorted by hash,
+#          hash is 64 bit FNV-1a of the utf-8 encoded fqn.
+#          fqns are not stored, a lookup is verified by comparing
+#          the names along the parent chain
+# strings: utf-8 string table, the strings are deduplicated
+from __future__ import annotations
+
+import mmap
+import struct
+from abc import ABC, abstractmethod
+from ast import literal_eval
+from pathlib import Path
+from typing import Any, Iterator
+
+from vss_tools.model import NodeType
+from vss_tools.tree import VSSNode
+
+MAGIC = b"VSSB"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHHIIIIII")
+STRING_FIELDS = ("name", "description", "datatype", "min", "max", "unit", "allowed", "default", "validate")
+RECORD = struct.Struct("<B3xiII" + "II" * len(STRING_FIELDS))
+INDEX_ENTRY = struct.Struct("<QI4x")
+NODE_TYPES = list(NodeType)
+SEPARATOR = "."
+
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+# Fields of the v1 format with the size of their length prefix
+STREAM_FIELDS = (
+    ("name", 1),
+    ("type", 1),
+    ("uuid", 1),
+    ("description", 2),
+    ("datatype", 1),
+    ("min", 1),
+    ("max", 1),
+    ("unit", 1),
+    ("allowed", 2),
+    ("default", 1),
+    ("validate", 1),
+)
+UINT8 = struct.Struct("B")
+UINT16 = struct.Struct("=H")
+
+
+class BinaryFormatException(Exception):
+    pass
+
+
+def fqn_hash(fqn: str) -> int:
+    """
+    64 bit FNV-1a hash of the fqn
+    """
+    h = FNV_OFFSET
+    for b in fqn.encode():
+        h = ((h ^ b) * FNV_PRIME) & MASK_64
+    return h
+
+
+def decode_allowed(allowed: str) -> list[str]:
+    """
+    Decodes allowed values, each value is prefixed
+    by its length as two hex characters
+    """
+    values = []
+    i = 0
+    while i < len(allowed):
+        length = int(allowed[i : i + 2], 16)
+        values.append(allowed[i + 2 : i + 2 + length])
+        i += 2 + length
+    return values
+
+
+def parse_value(value: str, datatype: str) -> Any:
+    """
+    Parses a value that got exported as a string
+    """
+    if not value:
+        return None
+    if datatype == "string":
+        return value
+    try:
+        return literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+class NodeView(ABC):
+    """
+    View on a single node of a binary tree.
+    Nothing gets decoded until an attribute is accessed
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree: TreeView, index: int) -> None:
+        self.tree = tree
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.fqn!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, NodeView) and other.tree is self.tree and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.tree), self.index))
+
+    @abstractmethod
+    def _string(self, field: str) -> str: ...
+
+    @property
+    @abstractmethod
+    def type(self) -> NodeType: ...
+
+    @property
+    @abstractmethod
+    def parent(self) -> NodeView | None: ...
+
+    @property
+    @abstractmethod
+    def children(self) -> list[NodeView]: ...
+
+    @property
+    def fqn(self) -> str:
+        names = []
+        node: NodeView | None = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return SEPARATOR.join(reversed(names))
+
+    def has_fqn(self, fqn: str) -> bool:
+        """
+        Compares the fqn name by name, starting at the node
+        """
+        node: NodeView | None = self
+        for name in reversed(fqn.split(SEPARATOR)):
+            if node is None or node.name != name:
+                return False
+            node = node.parent
+        return node is None
+
+    @property
+    def name(self) -> str:
+        return self._string("name")
+
+    @property
+    def description(self) -> str:
+        return self._string("description")
+
+    @property
+    def datatype(self) -> str:
+        return self._string("datatype")
+
+    @property
+    def min(self) -> str:
+        return self._string("min")
+
+    @property
+    def max(self) -> str:
+        return self._string("max")
+
+    @property
+    def unit(self) -> str:
+        return self._string("unit")
+
+    @property
+    def allowed(self) -> str:
+        return self._string("allowed")
+
+    @property
+    def default(self) -> str:
+        return self._string("default")
+
+    @property
+    def validate(self) -> str:
+        return self._string("validate")
+
+    def get_data(self) -> dict[str, Any]:
+        """
+        Attributes of the node as they would appear in a vspec
+        """
+        data: dict[str, Any] = {"type": self.type.value, "description": self.description}
+        datatype = self.datatype
+        if datatype:
+            data["datatype"] = datatype
+        scalar_datatype = datatype.removesuffix("[]")
+        for field in ("min", "max"):
+            value = parse_value(self._string(field), scalar_datatype)
+            if value is not None:
+                data[field] = value
+        if self.unit:
+            data["unit"] = self.unit
+        allowed = self.allowed
+        if allowed:
+            data["allowed"] = [parse_value(v, scalar_datatype) for v in decode_allowed(allowed)]
+        default = parse_value(self.default, "" if datatype.endswith("[]") else datatype)
+        if default is not None:
+            data["default"] = default
+        if self.validate:
+            data["validate"] = self.validate
+        return data
+
+    def to_vss_node(self) -> VSSNode:
+        """
+        Converts the subtree into a resolved 'VSSNode' tree.
+        Units, quantities and struct datatypes used by the tree need to be loaded
+        """
+        fqn = self.fqn
+        root = VSSNode(self.name, fqn, self.get_data())
+        stack = [(child, root, fqn) for child in reversed(self.children)]
+        while stack:
+            view, parent, parent_fqn = stack.pop()
+            fqn = f"{parent_fqn}{SEPARATOR}{view.name}"
+            node = VSSNode(view.name, fqn, view.get_data())
+            node.parent = parent
+            stack.extend((child, node, fqn) for child in reversed(view.children))
+        root.resolve()
+        return root
+
+
+class TreeView(ABC):
+    """
+    Memory mapped binary tree.
+    Use 'open_tree' to open a file of any format
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise BinaryFormatException(f"Empty binary tree: {path}") from None
+        self.buffer = memoryview(self._mmap)
+
+    def __enter__(self) -> TreeView:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def close(self) -> None:
+        self.buffer.release()
+        self._mmap.close()
+        self._file.close()
+
+    def get_string(self, offset: int, length: int) -> str:
+        return str(self.buffer[offset : offset + length], "utf-8")
+
+    @property
+    @abstractmethod
+    def root(self) -> NodeView: ...
+
+    def find(self, fqn: str) -> NodeView | None:
+        """
+        Looks up a node by walking down the tree name by name
+        """
+        names = fqn.split(SEPARATOR)
+        node: NodeView | None = self.root
+        if node is None or node.name != names[0]:
+            return None
+        for name in names[1:]:
+            node = next((child for child in node.children if child.name == name), None)
+            if node is None:
+                return None
+        return node
+
+    def iter(self, node: NodeView | None = None) -> Iterator[NodeView]:
+        """
+        Pre-order iteration of the subtree of the given node (default: root)
+        """
+        stack = [node or self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def to_vss_node(self) -> VSSNode:
+        return self.root.to_vss_node()
+
+
+class BinaryNode(NodeView):
+    """
+    View on a node of the default format (v1)
+    """
+
+    __slots__ = ()
+    tree: BinaryTree
+
+    def _string(self, field: str) -> str:
+        position = self.tree.offsets[self.index]
+        for name, size in STREAM_FIELDS:
+            length, position = self.tree.read_length(position, size)
+            if name == field:
+                return self.tree.get_string(position, length)
+            position += length
+        raise KeyError(field)
+
+    @property
+    def type(self) -> NodeType:
+        return NodeType(self._string("type"))
+
+    @property
+    def parent(self) -> BinaryNode | None:
+        parent = self.tree.parents[self.index]
+        return None if parent < 0 else BinaryNode(self.tree, parent)
+
+    @property
+    def children(self) -> list[NodeView]:
+        return [BinaryNode(self.tree, i) for i in self.tree.children[self.index]]
+
+
+class BinaryTree(TreeView):
+    """
+    Memory mapped binary tree in the default format (v1).
+    The file is scanned once for node offsets, parents and children.
+
+    Example:
+        with BinaryTree(path) as tree:
+            node = tree.find("Vehicle.Speed")
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.offsets: list[int] = []
+        self.parents: list[int] = []
+        self.children: list[list[int]] = []
+        try:
+            self._scan()
+        except (struct.error, IndexError):
+            self.close()
+            raise BinaryFormatException(f"Truncated binary tree: {path}") from None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def get_string(self, offset: int, length: int) -> str:
+        # Multibyte characters might be cut off by the character based length
+        return str(self.buffer[offset : offset + length], "utf-8", "replace")
+
+    def read_length(self, position: int, size: int) -> tuple[int, int]:
+        """
+        Reads a length prefix, returns the length and the position of the data
+        """
+        if size == 1:
+            return self.buffer[position], position + 1
+        return UINT16.unpack_from(self.buffer, position)[0], position + 2
+
+    def _scan(self) -> None:
+        # Stack of [node, remaining children]
+        stack: list[list[int]] = []
+        position = 0
+        end = len(self.buffer)
+        while position < end:
+            index = len(self.offsets)
+            while stack and stack[-1][1] == 0:
+                stack.pop()
+            parent = -1
+            if stack:
+                parent = stack[-1][0]
+                stack[-1][1] -= 1
+                self.children[parent].append(index)
+            elif index > 0:
+                raise BinaryFormatException(f"Unexpected data after the tree: {self.path}, offset={position}")
+            self.offsets.append(position)
+            self.parents.append(parent)
+            self.children.append([])
+            for _, size in STREAM_FIELDS:
+                length, position = self.read_length(position, size)
+                position += length
+            count = self.buffer[position]
+            position += 1
+            if count:
+                stack.append([index, count])
+        if any(remaining for _, remaining in stack):
+            raise BinaryFormatException(f"Truncated binary tree: {self.path}")
+
+    @property
+    def root(self) -> BinaryNode:
+        return BinaryNode(self, 0)
+
+
+class IndexedNode(NodeView):
+    """
+    View on a node record of the indexed format (v2)
+    """
+
+    __slots__ = ()
+    tree: IndexedTree
+
+    def _record(self) -> tuple[int, ...]:
+        return RECORD.unpack_from(self.tree.buffer, self.tree.nodes_offset + self.index * RECORD.size)
+
+    def _string(self, field: str) -> str:
+        position = 4 + 2 * STRING_FIELDS.index(field)
+        offset, length = self._record()[position : position + 2]
+        return self.tree.get_string(self.tree.strings_offset + offset, length)
+
+    @property
+    def type(self) -> NodeType:
+        return NODE_TYPES[self._record()[0]]
+
+    @property
+    def parent(self) -> IndexedNode | None:
+        parent = self._record()[1]
+        return None if parent < 0 else IndexedNode(self.tree, parent)
+
+    @property
+    def children(self) -> list[NodeView]:
+        _, _, first, count = self._record()[:4]
+        return [IndexedNode(self.tree, i) for i in range(first, first + count)]
+
+
+class IndexedTree(TreeView):
+    """
+    Memory mapped binary tree in the indexed format (v2).
+
+    Example:
+        with IndexedTree(path) as tree:
+            node = tree.find("Vehicle.Speed")
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        if len(self.buffer) < HEADER.size:
+            self.close()
+            raise BinaryFormatException(f"Not an indexed binary tree: {path}")
+        (
+            magic,
+            version,
+            record_size,
+            self.node_count,
+            self.nodes_offset,
+            self.index_offset,
+            self.strings_offset,
+            self.strings_size,
+            _,
+        ) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise BinaryFormatException(f"Unsupported binary tree: {path}, version={version}")
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    @property
+    def root(self) -> IndexedNode:
+        return IndexedNode(self, 0)
+
+    def find(self, fqn: str) -> NodeView | None:
+        """
+        Looks up a node by binary searching the hash index
+        """
+        h = fqn_hash(fqn)
+        low, high = 0, self.node_count
+        while low < high:
+            mid = (low + high) // 2
+            if INDEX_ENTRY.unpack_from(self.buffer, self.index_offset + mid * INDEX_ENTRY.size)[0] < h:
+                low = mid + 1
+            else:
+                high = mid
+        # Several fqns might share a hash
+        while low < self.node_count:
+            entry_hash, index = INDEX_ENTRY.unpack_from(self.buffer, self.index_offset + low * INDEX_ENTRY.size)
+            if entry_hash != h:
+                break
+            node = IndexedNode(self, index)
+            if node.has_fqn(fqn):
+                return node
+            low += 1
+        return None
+
+
+def open_tree(path: Path) -> TreeView:
+    """
+    Opens a binary tree, detecting its format
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(MAGIC))
+    if magic == MAGIC:
+        return IndexedTree(path)
+    return BinaryTree(path)
@@ -14,14 +14,34 @@ import rich_click as click
 import vss_tools.cli_options as clo
 from vss_tools import log
 from vss_tools.lazy_group import LazyGroup
+from vss_tools.timings import collect, profiled, stage
 
 
-@click.group(context_settings={"auto_envvar_prefix": "vss_tools"}, invoke_without_command=True)
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "generate-synthetic": "vss_tools.synthetic:cli",
+    },
+    context_settings={"auto_envvar_prefix": "vss_tools"},
+    invoke_without_command=True,
+)
 @clo.log_level_opt
 @clo.log_file_opt
+@clo.timings_opt
+@clo.timings_output_opt
+@clo.timings_memory_opt
+@clo.profile_opt
 @click.version_option()
 @click.pass_context
-def cli(ctx: click.Context, log_level: str, log_file: Path):
+def cli(
+    ctx: click.Context,
+    log_level: str,
+    log_file: Path,
+    timings: bool,
+    timings_output: Path | None,
+    timings_memory: bool,
+    profile: Path | None,
+):
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
     if log_file:
@@ -31,6 +51,18 @@ def cli(ctx: click.Context, log_level: str, log_file: Path):
 
     log.setLevel(log_level)
 
+    if profile:
+        ctx.with_resource(profiled(profile))
+    if timings or timings_output or timings_memory:
+        collected = ctx.with_resource(collect(timings_memory))
+
+        def report() -> None:
+            collected.print()
+            if timings_output:
+                collected.write_json(timings_output)
+
+        ctx.call_on_close(report)
+
 
 @cli.group(
     cls=LazyGroup,
@@ -45,10 +77,12 @@ def cli(ctx: click.Context, log_level: str, log_file: Path):
         "id": "vss_tools.exporters.id:cli",
         "json": "vss_tools.exporters.json:cli",
         "jsonschema": "vss_tools.exporters.jsonschema:cli",
+        "parquet": "vss_tools.exporters.parquet:cli",
         "protobuf": "vss_tools.exporters.protobuf:cli",
         "yaml": "vss_tools.exporters.yaml:cli",
         "tree": "vss_tools.exporters.tree:cli",
         "samm": "vss_tools.exporters.samm:cli",
+        "sqlite": "vss_tools.exporters.sqlite:cli",
         "go": "vss_tools.exporters.go:cli",
     },
 )
@@ -59,3 +93,5 @@ def export(ctx: click.Context):
     """
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
+    else:
+        ctx.with_resource(stage(f"export {ctx.invoked_subcommand}"))
@@ -40,6 +40,32 @@ log_file_opt = click.option(
     help="Log file.",
 )
 
+timings_opt = click.option(
+    "--timings/--no-timings",
+    help="Print wall time and node counts per processing stage.",
+    default=False,
+    show_default=True,
+)
+
+timings_output_opt = click.option(
+    "--timings-output",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Writes timings as JSON into the given file. Implies '--timings'.",
+)
+
+timings_memory_opt = click.option(
+    "--timings-memory/--no-timings-memory",
+    help="Also trace the peak memory per processing stage. Slows down the run. Implies '--timings'.",
+    default=False,
+    show_default=True,
+)
+
+profile_opt = click.option(
+    "--profile",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Runs with cProfile and writes the stats into the given file.",
+)
+
 include_dirs_opt = option(
     "--include-dirs",
     "-I",
@@ -257,7 +257,7 @@ def get_fqn_namespaced_datatypes(fqn: str | None = None) -> dict[str, str]:
             fqn_namespaced_datatypes[(t.split(".")[-1])] = t
 
     if fqn_namespaced_datatypes:
-        log.debug(f"Namespaced datatypes, {fqn=}, {fqn_namespaced_datatypes=}")
+        log.debug("Namespaced datatypes, fqn=%r, fqn_namespaced_datatypes=%r", fqn, fqn_namespaced_datatypes)
     return fqn_namespaced_datatypes
 
 
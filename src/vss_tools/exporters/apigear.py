@@ -12,7 +12,6 @@
 import abc
 import typing
 from enum import Enum, Flag, auto
-from math import inf
 from pathlib import Path
 
 import rich_click as click
@@ -25,6 +24,11 @@ from vss_tools.main import get_trees
 from vss_tools.model import VSSDataBranch, VSSDataDatatype, VSSDataStruct
 from vss_tools.tree import VSSNode
 
+# libyaml based emitter if available, producing the same output
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# No line wrapping, largest width accepted by libyaml
+YAML_WIDTH = 2**31 - 1
+
 
 class SolutionLayers(Flag):
     UNREAL = auto()
@@ -344,7 +348,7 @@ def generate_module(directory: Path, module: ApiGearModule, module_name: str, mo
 
 
 def generate_solution(
-    directory: Path, module_filename: str, module_name: str, layers: typing.Dict[SolutionLayers, Path]
+    directory: Path, module_filenames: typing.List[str], module_name: str, layers: typing.Dict[SolutionLayers, Path]
 ):
     log.debug("Generating solution file")
 
@@ -356,25 +360,25 @@ def generate_solution(
     }
     unreal: typing.Dict[str, typing.Any] = {
         "name": "unreal",
-        "inputs": [module_filename],
+        "inputs": list(module_filenames),
         "template": "apigear-io/template-unreal",
         "features": ["stubs", "plugin"],
     }
     cpp14: typing.Dict[str, typing.Any] = {
         "name": "cpp",
-        "inputs": [module_filename],
+        "inputs": list(module_filenames),
         "template": "apigear-io/template-cpp14",
         "features": ["stubs"],
     }
     qt5: typing.Dict[str, typing.Any] = {
         "name": "qt5",
-        "inputs": [module_filename],
+        "inputs": list(module_filenames),
         "template": "apigear-io/template-qt5",
         "features": ["stubs", "qmlplugin"],
     }
     qt6: typing.Dict[str, typing.Any] = {
         "name": "qt6",
-        "inputs": [module_filename],
+        "inputs": list(module_filenames),
         "template": "apigear-io/template-qtcpp",
         "features": ["stubs", "qmlplugin"],
     }
@@ -404,27 +408,82 @@ def export_yaml(file_name, content_dict):
         yaml.dump(
             content_dict,
             f,
+            Dumper=YamlDumper,
             sort_keys=False,
-            width=inf,
+            width=YAML_WIDTH,
             indent=2,
             encoding="utf-8",
             allow_unicode=True,
         )
 
 
+def get_struct_names(types: typing.Iterable[str], structures: typing.Dict[str, ApiGearStructure]) -> typing.Set[str]:
+    """
+    Names of the structures used by the given types, including the structures used by those structures
+    """
+    names: typing.Set[str] = set()
+    pending = [t for t in types if t in structures]
+    while pending:
+        name = pending.pop()
+        if name in names:
+            continue
+        names.add(name)
+        pending.extend(p.type.type for p in structures[name].properties.values() if p.type.type in structures)
+    return names
+
+
+def get_modules(root: VSSNode, data_type_tree: VSSNode | None, split_modules: bool) -> typing.Dict[str, ApiGearModule]:
+    """
+    Modules by name. Without split, a single module with all interfaces and structures.
+    With split, one module per top level branch and one for the root, if not empty.
+    As modules can not import each other, every module gets the structures it uses.
+    """
+    types_module = ApiGearModule()
+    export_data_type_node(data_type_tree, types_module)
+
+    if not split_modules:
+        module = ApiGearModule()
+        export_node(root, module)
+        module.structures = types_module.structures
+        return {root.name: module}
+
+    root_module = ApiGearModule()
+    root_interface = ApiGearInterface(node_name(root))
+    root_module.interfaces.append(root_interface)
+    modules = {root.name: root_module}
+    for child in root.children:
+        if isinstance(child.data, VSSDataBranch):
+            module = ApiGearModule()
+            export_node(child, module)
+            modules[node_name(child)] = module
+        else:
+            export_node(child, root_module, root_interface)
+
+    structures = {structure.name: structure for structure in types_module.structures}
+    for module in modules.values():
+        types = [p.type.type for interface in module.interfaces for p in interface.properties.values()]
+        names = get_struct_names(types, structures)
+        module.structures = [structure for structure in types_module.structures if structure.name in names]
+
+    if not (root_interface.properties or root_module.enumerations or root_module.structures):
+        del modules[root.name]
+    return modules
+
+
 def export_apigear(
-    directory: Path, root: VSSNode, data_type_tree: VSSNode | None, layers: typing.Dict[SolutionLayers, Path]
+    directory: Path,
+    root: VSSNode,
+    data_type_tree: VSSNode | None,
+    layers: typing.Dict[SolutionLayers, Path],
+    split_modules: bool = False,
 ):
     """This method is used to traverse through the root VSS node to build
     -> ApiGear equivalent string buffer and to serialize it accordingly into a file
     """
-    module = ApiGearModule()
     module_name = root.name
-    module_filename = f"{module_name}.module.yaml"
 
     log.debug(f"Directory: {directory}")
     log.debug(f"Module name: {module_name}")
-    log.debug(f"Module filename: {module_filename}")
 
     if not layers:
         layers = {SolutionLayers.CPP: Path("./cppservice")}
@@ -432,10 +491,13 @@ def export_apigear(
 
     log.debug(layers)
 
-    export_node(root, module)
-    export_data_type_node(data_type_tree, module)
-    generate_solution(directory, module_filename, module_name, layers)
-    generate_module(directory, module, module_name, module_filename)
+    modules = get_modules(root, data_type_tree, split_modules)
+    module_filenames = {name: f"{name}.module.yaml" for name in modules}
+    log.debug(f"Module filenames: {list(module_filenames.values())}")
+
+    generate_solution(directory, list(module_filenames.values()), module_name, layers)
+    for name, module in modules.items():
+        generate_module(directory, module, name, module_filenames[name])
     log.info(f"Apigear files generated at location: {directory}")
 
 
@@ -475,6 +537,12 @@ def export_apigear(
     type=click.Path(file_okay=False, readable=True, writable=True, path_type=Path),
     help="Add Qt6 layer to solution file at the specified path",
 )
+@click.option(
+    "--split-modules/--no-split-modules",
+    default=False,
+    show_default=True,
+    help="Generate one module per top level branch instead of a single module",
+)
 def cli(
     vspec: Path,
     include_dirs: tuple[Path],
@@ -490,6 +558,7 @@ def cli(
     apigear_template_cpp_path: Path,
     apigear_template_qt5_path: Path,
     apigear_template_qt6_path: Path,
+    split_modules: bool,
 ):
     """
     Export to ApiGear.
@@ -521,4 +590,4 @@ def cli(
     if apigear_template_qt6_path is not None:
         layers[SolutionLayers.QT6] = apigear_template_qt6_path
 
-    export_apigear(output_dir, tree, data_type_tree, layers)
+    export_apigear(output_dir, tree, data_type_tree, layers, split_modules)
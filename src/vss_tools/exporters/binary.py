@@ -24,15 +24,20 @@
 #
 # if a field is not present (e.g. min, max, unit, allowed, default, validate),
 # the length is 0.
+#
+# With '--format v2' an indexed format is written instead, see
+# 'vss_tools.binary_reader' for its layout and a reader.
 
 import struct
+from functools import cache
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 import rich_click as click
 
 import vss_tools.cli_options as clo
 from vss_tools import log
+from vss_tools.binary_reader import HEADER, INDEX_ENTRY, MAGIC, NODE_TYPES, RECORD, STRING_FIELDS, VERSION, fqn_hash
 from vss_tools.main import get_trees
 from vss_tools.tree import VSSNode
 
@@ -57,48 +62,175 @@ def intToHexChar(hexInt):
         return chr(hexInt - 10 + ord("A"))
 
 
+UINT8 = struct.Struct("B")
+UINT16 = struct.Struct("H")
+
+
+@cache
+def l8v_struct(length: int) -> struct.Struct:
+    return struct.Struct(f"{length + 1}p")
+
+
+@cache
+def l16v_struct(length: int) -> struct.Struct:
+    return struct.Struct(f"=H{length}s")
+
+
 # Create a struct containing the length of the string as uint8
 #  and the string itself
 def create_l8v_string(s: str) -> bytes:
-    pack = struct.pack(f"{len(s)+1}p", s.encode())
-    # log.debug(f"create_l8v_string: {s} as {pack.hex()}")
-    return pack
+    return l8v_struct(len(s)).pack(s.encode())
 
 
 # Create a struct containing the length of the string as uint16
 #  and the string itself
 def create_l16v_string(s: str) -> bytes:
-    pack = struct.pack(f"=H{len(s)}s", len(s), s.encode())
-    # log.debug(f"create_l16v_string: {s} as {pack.hex()}")
-    return pack
+    return l16v_struct(len(s)).pack(len(s), s.encode())
+
+
+def attribute_string(value: Any) -> str:
+    """
+    String representation of an optional attribute,
+    empty if not set (in line with 'as_dict' skipping None and [])
+    """
+    if value is None or value == []:
+        return ""
+    return str(value)
+
+
+def serialize_node(node: VSSNode, buffer: bytearray) -> None:
+    """
+    Appends the node and its subtree (pre-order) to the buffer.
+    Attributes are read from the model directly
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        data = node.get_vss_data()
+        extra = data.__pydantic_extra__ or {}
+        allowed = getattr(data, "allowed", None)
+
+        buffer += create_l8v_string(node.name)
+        buffer += create_l8v_string(data.type.value)
+        # Keeping UUID field in output for now (always 0)
+        buffer += UINT8.pack(0)
+
+        buffer += create_l16v_string(data.description)
+        buffer += create_l8v_string(attribute_string(getattr(data, "datatype", None)))
+        buffer += create_l8v_string(attribute_string(getattr(data, "min", None)))
+        buffer += create_l8v_string(attribute_string(getattr(data, "max", None)))
+        buffer += create_l8v_string(attribute_string(getattr(data, "unit", None)))
+
+        if not allowed:
+            buffer += UINT16.pack(0)
+        else:
+            buffer += create_l16v_string(allowedString(allowed))
+
+        buffer += create_l8v_string(attribute_string(getattr(data, "default", None)))
+        buffer += create_l8v_string(attribute_string(extra.get("validate")))
+
+        buffer += UINT8.pack(len(node.children))
+        stack.extend(reversed(node.children))
 
 
 def export_node(node: VSSNode, f: BinaryIO):
-    data = node.get_vss_data().as_dict()
+    buffer = bytearray()
+    serialize_node(node, buffer)
+    f.write(buffer)
 
-    f.write(create_l8v_string(node.name))
-    f.write(create_l8v_string(data.get("type", "")))
-    # Keeping UUID field in output for now (always 0)
-    f.write(struct.pack("B", 0))
 
-    f.write(create_l16v_string(data.get("description", "")))
-    f.write(create_l8v_string(data.get("datatype", "")))
-    f.write(create_l8v_string(str(data.get("min", ""))))
-    f.write(create_l8v_string(str(data.get("max", ""))))
-    f.write(create_l8v_string(data.get("unit", "")))
+class StringTable:
+    """
+    Deduplicated utf-8 strings, referenced by (offset, length)
+    """
 
-    if data.get("allowed") is None:
-        f.write(struct.pack("H", 0))
-    else:
-        f.write(create_l16v_string(allowedString(data.get("allowed", ""))))
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.refs: dict[str, tuple[int, int]] = {}
+
+    def add(self, s: str) -> tuple[int, int]:
+        ref = self.refs.get(s)
+        if ref is None:
+            encoded = s.encode()
+            ref = (len(self.data), len(encoded))
+            self.data += encoded
+            self.refs[s] = ref
+        return ref
+
+
+def get_indexed_strings(node: VSSNode) -> dict[str, str]:
+    data = node.get_vss_data()
+    extra = data.__pydantic_extra__ or {}
+    allowed = getattr(data, "allowed", None)
+    return {
+        "name": node.name,
+        "description": data.description,
+        "datatype": attribute_string(getattr(data, "datatype", None)),
+        "min": attribute_string(getattr(data, "min", None)),
+        "max": attribute_string(getattr(data, "max", None)),
+        "unit": attribute_string(getattr(data, "unit", None)),
+        "allowed": allowedString([str(a) for a in allowed]) if allowed else "",
+        "default": attribute_string(getattr(data, "default", None)),
+        "validate": attribute_string(extra.get("validate")),
+    }
 
-    f.write(create_l8v_string(str(data.get("default", ""))))
-    f.write(create_l8v_string(str(data.get("validate", ""))))
 
-    f.write(struct.pack("B", len(node.children)))
+def serialize_indexed(root: VSSNode) -> bytearray:
+    """
+    Serializes the tree into the indexed format (v2).
+    Nodes are numbered breadth-first so that children are contiguous
+    """
+    nodes = [root]
+    fqns = [root.name]
+    parents = [-1]
+    first_children = []
+    for index, node in enumerate(nodes):
+        first_children.append(len(nodes))
+        for child in node.children:
+            nodes.append(child)
+            fqns.append(f"{fqns[index]}.{child.name}")
+            parents.append(index)
+
+    nodes_offset = HEADER.size
+    index_offset = nodes_offset + len(nodes) * RECORD.size
+    strings_offset = index_offset + len(nodes) * INDEX_ENTRY.size
+
+    buffer = bytearray(strings_offset)
+    strings = StringTable()
+    for index, node in enumerate(nodes):
+        fields = get_indexed_strings(node)
+        refs = [value for field in STRING_FIELDS for value in strings.add(fields[field])]
+        type_index = NODE_TYPES.index(node.get_vss_data().type)
+        record = (type_index, parents[index], first_children[index], len(node.children), *refs)
+        RECORD.pack_into(buffer, nodes_offset + index * RECORD.size, *record)
+
+    index_entries = sorted((fqn_hash(fqn), index) for index, fqn in enumerate(fqns))
+    for position, entry in enumerate(index_entries):
+        INDEX_ENTRY.pack_into(buffer, index_offset + position * INDEX_ENTRY.size, *entry)
 
-    for child in node.children:
-        export_node(child, f)
+    HEADER.pack_into(
+        buffer,
+        0,
+        MAGIC,
+        VERSION,
+        RECORD.size,
+        len(nodes),
+        nodes_offset,
+        index_offset,
+        strings_offset,
+        len(strings.data),
+        0,
+    )
+    buffer += strings.data
+    return buffer
+
+
+def write_tree(node: VSSNode, path: Path, binary_format: str) -> None:
+    with open(str(path), "wb") as f:
+        if binary_format == "v2":
+            f.write(serialize_indexed(node))
+        else:
+            export_node(node, f)
 
 
 @click.command()
@@ -113,6 +245,14 @@ def export_node(node: VSSNode, f: BinaryIO):
 @clo.units_opt
 @clo.types_opt
 @clo.types_output_opt
+@click.option(
+    "--format",
+    "binary_format",
+    type=click.Choice(["v1", "v2"]),
+    default="v1",
+    show_default=True,
+    help="Binary format. 'v2' is an indexed format that can be memory mapped (see 'vss_tools.binary_reader')",
+)
 def cli(
     vspec: Path,
     output: Path,
@@ -125,6 +265,7 @@ def cli(
     units: tuple[Path],
     types: tuple[Path],
     types_output: Path | None,
+    binary_format: str,
 ):
     """
     Export to Binary.
@@ -144,11 +285,9 @@ def cli(
     log.info("Generating binary output...")
     if datatype_tree:
         if types_output:
-            with open(str(types_output), "wb") as f:
-                export_node(datatype_tree, f)
+            write_tree(datatype_tree, types_output, binary_format)
             log.info("Binary datatype tree output generated in %s", types_output)
         else:
             log.warning("Ignoring type tree generation as no file name specified")
-    with open(str(output), "wb") as f:
-        export_node(tree, f)
+    write_tree(tree, output, binary_format)
     log.info("Binary main tree output generated in %s", output)
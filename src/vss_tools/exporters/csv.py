@@ -9,15 +9,19 @@
 # Convert vspec tree to CSV
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Sequence
 
 import rich_click as click
-from anytree import PreOrderIter  # type: ignore[import]
 
 import vss_tools.cli_options as clo
 from vss_tools import log
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
 from vss_tools.main import get_trees
+from vss_tools.model import VSSData
 from vss_tools.tree import VSSNode
 from vss_tools.utils.misc import getattr_nn
 
@@ -44,37 +48,86 @@ def get_header(entry_type: str, with_instance_column: bool, extended_attributes:
     return row
 
 
-def add_rows(
-    rows: list[list[Any]], root: VSSNode, with_instance_column: bool, extended_attributes: tuple[str, ...] = ()
-) -> None:
-    node: VSSNode
-    for node in PreOrderIter(root):
-        data = node.get_vss_data()
-        row = [
-            node.get_fqn(),
-            data.type.value,
-            getattr_nn(data, "datatype", ""),
-            getattr_nn(data, "deprecation", ""),
-            getattr_nn(data, "unit", ""),
-            getattr_nn(data, "min", ""),
-            getattr_nn(data, "max", ""),
-            data.description,
-            getattr_nn(data, "comment", ""),
-            getattr_nn(data, "allowed", ""),
-            getattr_nn(data, "default", ""),
-        ]
-        if with_instance_column:
-            row.append(getattr_nn(data, "instances", ""))
-
-        for attr in extended_attributes:
-            row.append(getattr_nn(data, attr, ""))
-        rows.append(row)
-
-
-def write_csv(rows: list[list[Any]], output: Path):
+def get_columns(with_instance_column: bool, extended_attributes: tuple[str, ...] = ()) -> tuple[str, ...]:
+    """
+    Attributes of the columns following the name column, matching the header
+    """
+    columns: tuple[str, ...] = (
+        "type",
+        "datatype",
+        "deprecation",
+        "unit",
+        "min",
+        "max",
+        "description",
+        "comment",
+        "allowed",
+        "default",
+    )
+    if with_instance_column:
+        columns += ("instances",)
+    return columns + extended_attributes
+
+
+def get_attribute_getter(data_class: type[VSSData], attribute: str, default: Any = "") -> Callable[[VSSData], Any]:
+    """
+    Getter of an attribute, returning 'default' for missing attributes or attributes set to None
+    """
+    if attribute == "type":
+        return lambda data: data.type.value
+    if attribute not in data_class.model_fields:
+        # Extra attributes are only known by the instances
+        return lambda data: getattr_nn(data, attribute, default)
+    get = attrgetter(attribute)
+
+    def getter(data: VSSData) -> Any:
+        value = get(data)
+        return default if value is None else value
+
+    return getter
+
+
+@cache
+def get_attribute_getters(
+    data_class: type[VSSData], columns: tuple[str, ...], default: Any = ""
+) -> tuple[Callable[[VSSData], Any], ...]:
+    """
+    Getters of the columns, compiled once per data class
+    """
+    return tuple(get_attribute_getter(data_class, attribute, default) for attribute in columns)
+
+
+class CsvWriterVisitor(Visitor):
+    """
+    Writes one row per node
+    """
+
+    def __init__(self, writer: Any, with_instance_column: bool, extended_attributes: tuple[str, ...] = ()) -> None:
+        self.writer = writer
+        self.columns = get_columns(with_instance_column, extended_attributes)
+
+    def enter(self, visit: Visit) -> None:
+        data = visit.data
+        getters = get_attribute_getters(type(data), self.columns)
+        self.writer.writerow([visit.fqn, *[getter(data) for getter in getters]])
+
+
+def write_csv(
+    output: Path,
+    header: list[str],
+    trees: Sequence[tuple[VSSNode, tuple[str, ...]]],
+    with_instance_column: bool,
+) -> Path:
+    """
+    Writes the header and the rows of the given trees (with their extended attributes),
+    streaming the rows while walking the trees
+    """
     with open(output, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerows(rows)
+        writer.writerow(header)
+        for root, extended_attributes in trees:
+            traverse(root, [CsvWriterVisitor(writer, with_instance_column, extended_attributes)])
+    return output
 
 
 @click.command()
@@ -125,13 +178,18 @@ def cli(
     with_instance_column = not expand
 
     entry_type = "Node" if generic_entry else "Signal"
-    rows = [get_header(entry_type, with_instance_column, extended_attributes)]
-    add_rows(rows, tree, with_instance_column, extended_attributes)
+    header = get_header(entry_type, with_instance_column, extended_attributes)
+    trees: list[tuple[VSSNode, tuple[str, ...]]] = [(tree, extended_attributes)]
     if generic_entry and datatype_tree:
-        add_rows(rows, datatype_tree, with_instance_column)
-    write_csv(rows, output)
-
-    if not generic_entry and datatype_tree:
-        rows = [get_header("Node", with_instance_column)]
-        add_rows(rows, datatype_tree, with_instance_column)
-        write_csv(rows, types_output)
+        trees.append((datatype_tree, ()))
+
+    # Signals and types are written concurrently
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(write_csv, output, header, trees, with_instance_column)]
+        if not generic_entry and datatype_tree:
+            header = get_header("Node", with_instance_column)
+            futures.append(
+                executor.submit(write_csv, types_output, header, [(datatype_tree, ())], with_instance_column)
+            )
+        for future in futures:
+            log.info("CSV written to %s", future.result())
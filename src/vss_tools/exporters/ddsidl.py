@@ -12,6 +12,7 @@
 
 import keyword
 from pathlib import Path
+from typing import Iterator, TextIO
 
 import rich_click as click
 
@@ -169,8 +170,6 @@ def get_allowed_enum_literal(name: str):
     return name
 
 
-idl_file_buffer = []
-
 dataTypesMap_covesa_dds = {
     "uint8": "octet",
     "int8": "octet",
@@ -187,22 +186,46 @@ dataTypesMap_covesa_dds = {
 }
 
 
-def export_node(node: VSSNode, generate_all_idl_features: bool) -> None:
+class IDLExporter:
     """
-    This method is used to traverse VSS node and to create corresponding DDS IDL buffer string
+    Emits the DDS IDL of a signal tree line by line.
+    All state is kept in the exporter, lines are generated while traversing
+    and written directly, so memory scales with the tree depth
     """
-    global idl_file_buffer
-    arraysize = getattr(node.data, "arraysize", None)
-    allowed_values = None
 
-    if isinstance(node.data, VSSDataBranch):
-        idl_file_buffer.append("module " + getAllowedName(node.name))
-        idl_file_buffer.append("{")
-        for child in node.children:
-            export_node(child, generate_all_idl_features)
-        idl_file_buffer.append("};")
-        idl_file_buffer.append("")
-    else:
+    def __init__(self, generate_all_idl_features: bool = False):
+        self.generate_all_idl_features = generate_all_idl_features
+
+    def export(self, file: TextIO, root: VSSNode) -> None:
+        """
+        Writes the lines separated by newlines (no trailing newline)
+        """
+        separator = ""
+        for line in self.lines(root):
+            file.write(separator)
+            file.write(line)
+            separator = "\n"
+
+    def lines(self, node: VSSNode) -> Iterator[str]:
+        """
+        This method is used to traverse VSS node and to generate the corresponding DDS IDL lines
+        """
+        if isinstance(node.data, VSSDataBranch):
+            yield f"module {getAllowedName(node.name)}"
+            yield "{"
+            for child in node.children:
+                yield from self.lines(child)
+            yield "};"
+            yield ""
+        else:
+            yield from self.leaf_lines(node)
+
+    def leaf_lines(self, node: VSSNode) -> Iterator[str]:
+        all_features = self.generate_all_idl_features
+        comment = "" if all_features else "//"
+        name = getAllowedName(node.name)
+        arraysize = getattr(node.data, "arraysize", None)
+        allowed_values = None
         enum_created = False
         # check if there is a need to create enum (based on the usage of allowed values)
         allowed = getattr(node.data, "allowed")
@@ -213,42 +236,33 @@ def export_node(node: VSSNode, generate_all_idl_features: bool) -> None:
             module name for enum is chosen as the node name +
             """
             if datatype in ["string", "string[]"]:
-                idl_file_buffer.append("module " + getAllowedName(node.name) + "_M")
-                idl_file_buffer.append("{")
-                idl_file_buffer.append(
-                    "enum "
-                    + getAllowedName(node.name)
-                    + "Values{"
-                    + str(",".join(get_allowed_enum_literal(item) for item in allowed))
-                    + "};"
-                )
+                yield f"module {name}_M"
+                yield "{"
+                yield f"enum {name}Values{{{','.join(get_allowed_enum_literal(item) for item in allowed)}}};"
                 enum_created = True
-                idl_file_buffer.append("};")
+                yield "};"
                 allowed_values = str(allowed)
             else:
                 log.warning(
-                    f"VSS2IDL can only handle allowed values for string type, "
-                    f"signal {node.name} has type {datatype}"
+                    "VSS2IDL can only handle allowed values for string type, signal %s has type %s",
+                    node.name,
+                    datatype,
                 )
 
-        idl_file_buffer.append("struct " + getAllowedName(node.name))
-        idl_file_buffer.append("{")
+        yield f"struct {name}"
+        yield "{"
         # fetching value of datatype and obtaining the equivalent DDS type
-        try:
-            if datatype:
-                if datatype in dataTypesMap_covesa_dds:
-                    datatype = str(dataTypesMap_covesa_dds[datatype])
-                elif "[" in datatype:
-                    nodevalueArray = datatype.split("[", 1)
-                    if str(nodevalueArray[0]) in dataTypesMap_covesa_dds:
-                        datatype = str(dataTypesMap_covesa_dds[str(nodevalueArray[0])])
-                        arraysize = "[" + str(arraysize) + nodevalueArray[1]
-                else:  # no primitive type. this is custom
-                    datatype = datatype.replace(".", "::")  # custom data type
-
-        except AttributeError:
-            pass
-        # fetching value of unit
+        if datatype:
+            if datatype in dataTypesMap_covesa_dds:
+                datatype = dataTypesMap_covesa_dds[datatype]
+            elif "[" in datatype:
+                nodevalueArray = datatype.split("[", 1)
+                if nodevalueArray[0] in dataTypesMap_covesa_dds:
+                    datatype = dataTypesMap_covesa_dds[nodevalueArray[0]]
+                    arraysize = f"[{arraysize}{nodevalueArray[1]}"
+            else:  # no primitive type. this is custom
+                datatype = datatype.replace(".", "::")  # custom data type
+
         unit = getattr(node.data, "unit")
         min = getattr(node.data, "min")
         max = getattr(node.data, "max")
@@ -256,56 +270,33 @@ def export_node(node: VSSNode, generate_all_idl_features: bool) -> None:
         default = getattr(node.data, "default")
         if default:
             if isinstance(default, str) and not enum_created:
-                default = '"' + default + '"'
+                default = f'"{default}"'
 
         if datatype is not None:
             # adding range if min and max are specified in vspec file
-            if min is not None and max is not None and generate_all_idl_features:
-                idl_file_buffer.append("@range(min=" + str(min) + " ,max=" + str(max) + ")")
+            if min is not None and max is not None and all_features:
+                yield f"@range(min={min} ,max={max})"
 
             if allowed_values is None:
-                if default is None:
-                    idl_file_buffer.append(
-                        ("sequence<" + datatype + "> value" if arraysize is not None else datatype + " value") + ";"
-                    )
-                else:
-                    # default values in IDL file are not accepted by CycloneDDS/FastDDS :
-                    # these values can be generated if --all-idl-features is set as True
-                    idl_file_buffer.append(
-                        ("sequence<" + datatype + "> value" if arraysize is not None else datatype + " value")
-                        + ("  default " + str(default) if generate_all_idl_features else "")
-                        + ";"
-                    )
+                value = f"sequence<{datatype}> value" if arraysize is not None else f"{datatype} value"
             else:
                 # this is the case where allowed values are provided, accordingly contents are converted to enum
-                if default is None:
-                    idl_file_buffer.append(
-                        getAllowedName(node.name) + "_M::" + getAllowedName(node.name) + "Values value;"
-                    )
-                else:
-                    # default values in IDL file are not accepted by CycloneDDS/FastDDS :
-                    # these values can be generated if --all-idl-features is set as True
-                    idl_file_buffer.append(
-                        getAllowedName(node.name)
-                        + "_M::"
-                        + getAllowedName(node.name)
-                        + "Values value"
-                        + (" " + str(default) if generate_all_idl_features else "")
-                        + ";"
-                    )
+                value = f"{name}_M::{name}Values value"
+            if default is None:
+                yield f"{value};"
+            else:
+                # default values in IDL file are not accepted by CycloneDDS/FastDDS :
+                # these values can be generated if --all-idl-features is set as True
+                separator = "  default " if allowed_values is None else " "
+                yield f"{value}{separator}{default};" if all_features else f"{value};"
 
         if unit is not None:
-            idl_file_buffer.append(("" if generate_all_idl_features else "//") + 'const string unit="' + unit + '";')
+            yield f'{comment}const string unit="{unit}";'
 
         data = node.get_vss_data()
-        idl_file_buffer.append(
-            ("" if generate_all_idl_features else "//") + 'const string type ="' + str(data.type.value) + '";'
-        )
-
-        idl_file_buffer.append(
-            ("" if generate_all_idl_features else "//") + 'const string description="' + data.description + '";'
-        )
-        idl_file_buffer.append("};")
+        yield f'{comment}const string type ="{data.type.value}";'
+        yield f'{comment}const string description="{data.description}";'
+        yield "};"
 
 
 class StructExporter(object):
@@ -314,18 +305,18 @@ class StructExporter(object):
     """
 
     def __init__(self):
-        self.str_buf = ""
-        self.structs_seen = []
+        self.structs_seen: list[str] = []
 
     def export(self, root) -> str:
-        self.str_buf = ""
+        return "".join(self.chunks(root))
+
+    def chunks(self, root) -> Iterator[str]:
         self.structs_seen = []
-        self.export_data_type_node(root)
-        return self.str_buf
+        yield from self.export_data_type_node(root)
 
-    def export_data_type_node(self, node: VSSNode):
+    def export_data_type_node(self, node: VSSNode) -> Iterator[str]:
         """
-        This method is used to traverse VSS node and to create corresponding DDS IDL buffer string
+        This method is used to traverse VSS node and to generate the corresponding DDS IDL
         """
 
         prefix = ""
@@ -336,19 +327,18 @@ class StructExporter(object):
         elif isinstance(node.data, VSSDataStruct):
             # check if the properties use structs that have not been seen before
             # if not, add a forward declaration
-            fwds = []
+            fwds = set()
             for c in node.children:
                 datatype = getattr_nn(c.data, "datatype", "")
                 if not datatype.startswith("Types."):
                     continue
 
-                datatype_str = datatype(".", "::").split("[", 1)[0]
+                datatype_str = datatype.replace(".", "::").split("[", 1)[0]
                 if datatype_str not in self.structs_seen:
                     base_type = datatype_str.split("::")[-1]
-                    fwds.append(base_type)
+                    fwds.add(base_type)
 
-            fwds.sort()
-            for f in set(fwds):
+            for f in sorted(fwds):
                 prefix += f"struct {f};\n"
 
             prefix += f"struct {getAllowedName(node.name)}" + " {\n"
@@ -359,24 +349,23 @@ class StructExporter(object):
             datatype_str = datatype.replace(".", "::").split("[", 1)[0]
             is_seq = "[" in datatype
             if is_seq:
-                self.str_buf += f"sequence<{datatype_str}> {getAllowedName(node.name)};\n"
+                yield f"sequence<{datatype_str}> {getAllowedName(node.name)};\n"
             else:
-                self.str_buf += f"{datatype_str} {getAllowedName(node.name)};\n"
+                yield f"{datatype_str} {getAllowedName(node.name)};\n"
 
-        self.str_buf += f"{prefix}"
+        yield prefix
 
         for child in node.children:
-            self.export_data_type_node(child)
-        self.str_buf += suffix
+            yield from self.export_data_type_node(child)
+        yield suffix
 
 
 def export_idl(file, root, generate_all_idl_features=False):
-    """This method is used to traverse through the root VSS node to build
-    -> DDS IDL equivalent string buffer and to serialize it acccordingly into a file
+    """This method is used to traverse through the root VSS node
+    and to serialize the DDS IDL equivalent into a file
     """
-    export_node(root, generate_all_idl_features)
-    file.write("\n".join(idl_file_buffer))
-    log.info("IDL file generated at location : " + file.name)
+    IDLExporter(generate_all_idl_features).export(file, root)
+    log.info("IDL file generated at location : %s", file.name)
 
 
 @click.command()
@@ -424,12 +413,9 @@ def cli(
     )
     log.info("Generating DDS-IDL output...")
 
-    if datatype_tree is not None:
-        exporter = StructExporter()
-        with open(output, "w") as idl_out:
-            idl_out.write(exporter.export(datatype_tree))
-
-    with open(output, "a" if datatype_tree is not None else "w") as idl_out:
+    with open(output, "w") as idl_out:
+        if datatype_tree is not None:
+            idl_out.writelines(StructExporter().chunks(datatype_tree))
         export_idl(
             idl_out,
             tree,
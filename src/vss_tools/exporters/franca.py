@@ -9,14 +9,14 @@
 # Convert vspec tree to franca
 
 
-from io import TextIOWrapper
 from pathlib import Path
+from typing import TextIO
 
 import rich_click as click
-from anytree import PreOrderIter
 
 import vss_tools.cli_options as clo
 from vss_tools import log
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
 from vss_tools.main import get_trees
 from vss_tools.tree import VSSNode
 
@@ -47,37 +47,46 @@ const SignalSpec[] signal_spec = [
 """)
 
 
+class FrancaVisitor(Visitor):
+    """
+    Writes the data lines, one node at a time
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+        self.separator = "{"
+
+    def enter(self, visit: Visit) -> None:
+        if visit.parent is None:
+            return
+        data = visit.data
+        attributes = visit.attributes
+        lines = [
+            f'{self.separator}\tname: "{visit.fqn}"',
+            f'\ttype: "{data.type.value}"',
+            f'\tdescription: "{data.description}"',
+        ]
+        datatype = attributes.get("datatype")
+        if datatype:
+            lines.append(f'\tdatatype: "{datatype}"')
+        unit = attributes.get("unit")
+        if unit:
+            lines.append(f'\tunit: "{unit}"')
+        if "min" in attributes:
+            lines.append(f"\tmin: {attributes['min']}")
+        if "max" in attributes:
+            lines.append(f"\tmax: {attributes['max']}")
+        allowed = attributes.get("allowed")
+        if allowed:
+            lines.append(f"\tallowed: {allowed}")
+        self.file.write(",\n".join(lines))
+        self.file.write("\n}")
+        self.separator = ",\n{"
+
+
 # Write the data lines
-def print_franca_content(file: TextIOWrapper, root: VSSNode) -> None:
-    output = ""
-    node: VSSNode
-    for node in PreOrderIter(root):
-        data = node.get_vss_data()
-        if node.parent:
-            if output:
-                output += ",\n{"
-            else:
-                output += "{"
-            output += f'\tname: "{node.get_fqn()}"'
-            output += f',\n\ttype: "{data.type.value}"'
-            output += f',\n\tdescription: "{data.description}"'
-            datatype = getattr(data, "datatype", None)
-            if datatype:
-                output += f',\n\tdatatype: "{datatype}"'
-            unit = getattr(data, "unit", None)
-            if unit:
-                output += f',\n\tunit: "{unit}"'
-            min = getattr(data, "min", None)
-            if min is not None:
-                output += f",\n\tmin: {min}"
-            max = getattr(data, "max", None)
-            if max is not None:
-                output += f",\n\tmax: {max}"
-            allowed = getattr(data, "allowed", None)
-            if allowed:
-                output += f",\n\tallowed: {allowed}"
-            output += "\n}"
-    file.write(output)
+def print_franca_content(file: TextIO, root: VSSNode) -> None:
+    traverse(root, [FrancaVisitor(file)])
 
 
 @click.command()
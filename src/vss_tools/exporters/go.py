@@ -13,14 +13,14 @@ import re
 from pathlib import Path
 
 import rich_click as click
-from anytree import PreOrderIter
 
 import vss_tools.cli_options as clo
 from vss_tools import log
 from vss_tools.datatypes import Datatypes, is_array
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
 from vss_tools.main import get_trees
 from vss_tools.model import VSSDataBranch, VSSDataDatatype, VSSDataStruct
-from vss_tools.tree import VSSNode
+from vss_tools.tree import SEPARATOR, VSSNode
 
 datatype_map = {
     Datatypes.INT8_ARRAY[0]: "[]int8",
@@ -43,16 +43,37 @@ datatype_map = {
 }
 
 
-def add_children_map_entries(root: VSSNode, fqn: str, replace: str, map: dict[str, str]) -> None:
+class InstanceMappingVisitor(Visitor):
     """
-    Adding rename map entries for children of a given node
+    Collects the rename map of the instance branches and their children, see 'get_instance_mapping'
     """
-    child: VSSNode
-    for child in root.children:
-        child_fqn = child.get_fqn()
-        new_name = child_fqn.replace(fqn, replace)
-        map[child_fqn] = new_name
-        add_children_map_entries(child, fqn, replace, map)
+
+    def __init__(self) -> None:
+        self.instance_map: dict[str, str] = {}
+        # Nearest mapped branch above (or at) a visit, as (fqn, new_name), children are renamed like it
+        self.renames: dict[Visit, tuple[str, str] | None] = {}
+
+    def enter(self, visit: Visit) -> None:
+        fqn = visit.fqn
+        rename = self.renames[visit.parent] if visit.parent else None
+        if rename:
+            self.instance_map[fqn] = fqn.replace(*rename)
+
+        data = visit.node.data
+        if isinstance(data, VSSDataBranch):
+            instance_children_depth = visit.instance_children_depth
+
+            if instance_children_depth > 0 or data.is_instance:
+                instance_root, _ = visit.get_instance_root()
+                if instance_children_depth > 0:
+                    self.instance_map[fqn] = f"{instance_root.fqn}.I{instance_children_depth}"
+                else:
+                    self.instance_map[fqn] = instance_root.fqn
+                rename = (fqn, self.instance_map[fqn])
+        self.renames[visit] = rename
+
+    def leave(self, visit: Visit) -> None:
+        del self.renames[visit]
 
 
 def get_instance_mapping(root: VSSNode | None) -> dict[str, str]:
@@ -78,25 +99,9 @@ def get_instance_mapping(root: VSSNode | None) -> dict[str, str]:
 
     if root is None:
         return {}
-    instance_map: dict[str, str] = {}
-    for node in PreOrderIter(root):
-        if isinstance(node.data, VSSDataBranch):
-            instance_children_depth = node.count_instance_children_depth()
-
-            if instance_children_depth == 0:
-                if not node.data.is_instance:
-                    continue
-
-            instance_root, _ = node.get_instance_root()
-            fqn = node.get_fqn()
-
-            if instance_children_depth > 0:
-                instance_map[fqn] = f"{instance_root.get_fqn()}.I{instance_children_depth}"
-            else:
-                instance_map[fqn] = instance_root.get_fqn()
-            add_children_map_entries(node, fqn, instance_map[fqn], instance_map)
-
-    return instance_map
+    visitor = InstanceMappingVisitor()
+    traverse(root, [visitor])
+    return visitor.instance_map
 
 
 def get_datatype(node: VSSNode) -> str | None:
@@ -151,68 +156,38 @@ def get_struct_name(fqn: str, map: dict[str, str]) -> str:
         return fqn
 
 
-def get_go_structs(root: VSSNode | None, map: dict[str, str], type_tree: bool = False) -> dict[str, GoStruct]:
-    structs: dict[str, GoStruct] = {}
-    if root is None:
-        return structs
-    for node in PreOrderIter(root):
+class GoStructsVisitor(Visitor):
+    """
+    Collects a struct for every branch and struct node
+    """
+
+    def __init__(self, map: dict[str, str], type_tree: bool = False) -> None:
+        self.map = map
+        self.type_tree = type_tree
+        self.structs: dict[str, GoStruct] = {}
+
+    def enter(self, visit: Visit) -> None:
+        node = visit.node
         if isinstance(node.data, VSSDataBranch) or isinstance(node.data, VSSDataStruct):
-            struct = GoStruct(get_struct_name(node.get_fqn(), map))
+            struct = GoStruct(get_struct_name(visit.fqn, self.map))
             for child in node.children:
                 datatype = get_datatype(child)
                 if not datatype:
-                    datatype = get_struct_name(child.get_fqn(), map)
+                    datatype = get_struct_name(f"{visit.fqn}{SEPARATOR}{child.name}", self.map)
                 member = GoStructMember(child.name, datatype)
                 struct.members.append(member)
-            if type_tree and isinstance(node.data, VSSDataBranch):
+            if self.type_tree and isinstance(node.data, VSSDataBranch):
                 pass
             else:
-                structs[struct.name] = struct
-    return structs
+                self.structs[struct.name] = struct
 
 
-def get_prefixes(structs: dict[str, GoStruct]) -> list[str]:
-    """
-    Gets all current prefixes from the given structs.
-    Example:
-
-    Vehicle.Cabin
-    Something.Else
-
-    -> [Vehicle, Something]
-    """
-    prefixes: dict[str, int] = {}
-    for struct in structs.values():
-        split = struct.name.split(".")
-        if len(split) == 1:
-            continue
-        prefix = split[0]
-        if prefix in prefixes:
-            prefixes[prefix] += 1
-        else:
-            prefixes[prefix] = 1
-    return [p for p in prefixes.keys()]
-
-
-def get_prefix_strip_conflicts(prefix: str, structs: dict[str, GoStruct]) -> int:
-    """
-    Finds conflicts if we would strip the given prefix from structs
-    """
-    structs_new: list[str] = []
-    for struct in structs.values():
-        split = struct.name.split(".")
-        sp = split[0]
-        if len(split) == 1:
-            structs_new.append(struct.name)
-        else:
-            if sp != prefix:
-                structs_new.append(struct.name)
-            else:
-                log.debug(f"Stripping, {prefix=}, {struct.name=}")
-                structs_new.append(".".join(split[1:]))
-                log.debug(f"New name: {structs_new[-1]}")
-
-    return len(structs_new) - len(set(structs_new))
+def get_go_structs(root: VSSNode | None, map: dict[str, str], type_tree: bool = False) -> dict[str, GoStruct]:
+    if root is None:
+        return {}
+    visitor = GoStructsVisitor(map, type_tree)
+    traverse(root, [visitor])
+    return visitor.structs
 
 
 def is_only_instance(s: str) -> bool:
@@ -227,36 +202,141 @@ def is_only_instance(s: str) -> bool:
     return False
 
 
-def strip_structs_prefix(prefix: str, structs: dict[str, GoStruct]) -> int:
+class StructNames:
     """
-    Left strips all structs from the given prefix
-    Returns the number of changed struct names
+    Shortens struct names by left stripping common prefixes, as long as that does not lead to conflicting names.
+    Member datatypes referring to the structs are renamed accordingly.
+
+    All names are kept split into segments and indexed by their first segment (the first level of a trie
+    of the name segments), so that stripping a prefix only touches the names starting with it.
+    Prefixes are stripped in rounds, in the order they appear in the struct names, until nothing more can be stripped.
     """
-    stripped = 0
-    for struct in structs.values():
-        split = struct.name.split(".")
-        if len(split) > 1:
-            if split[0] == prefix:
-                new_name = ".".join(split[1:])
-                if is_only_instance(new_name):
-                    log.debug(f"Struct, not stripping, would be Instance id only: {struct.name}")
-                else:
-                    struct.name = new_name
-                    stripped += 1
-        for member in struct.members:
-            dtsplit = member.datatype.split(".")
-            if len(dtsplit) > 1:
-                array_member = dtsplit[0].startswith("[]")
-                content = dtsplit[0].lstrip("[]")
-                if content == prefix:
-                    new_name = ".".join(dtsplit[1:])
-                    if is_only_instance(new_name):
-                        log.debug(f"Member, not stripping, would be Instance id only: {member.datatype}")
-                    else:
-                        member.datatype = new_name
-                        if array_member:
-                            member.datatype = "[]" + member.datatype
-    return stripped
+
+    def __init__(self, structs: dict[str, GoStruct]) -> None:
+        self.structs = list(structs.values())
+        self.struct_names = [struct.name.split(".") for struct in self.structs]
+        self.members = [member for struct in self.structs for member in struct.members]
+        self.member_names = []
+        for member in self.members:
+            segments = member.datatype.split(".")
+            segments[0] = segments[0].lstrip("[]")
+            self.member_names.append(segments)
+
+        self.struct_index = self.get_index(self.struct_names)
+        self.member_index = self.get_index(self.member_names)
+
+        # Number of structs per name, and how many names are duplicates
+        self.name_counts: dict[str, int] = {}
+        self.duplicates = 0
+        for segments in self.struct_names:
+            self.add_name(".".join(segments))
+
+    @staticmethod
+    def get_index(names: list[list[str]]) -> dict[str, list[int]]:
+        index: dict[str, list[int]] = {}
+        for i, segments in enumerate(names):
+            if len(segments) > 1:
+                index.setdefault(segments[0], []).append(i)
+        return index
+
+    def add_name(self, name: str) -> None:
+        count = self.name_counts.get(name, 0)
+        if count:
+            self.duplicates += 1
+        self.name_counts[name] = count + 1
+
+    def remove_name(self, name: str) -> None:
+        count = self.name_counts[name]
+        if count > 1:
+            self.duplicates -= 1
+        self.name_counts[name] = count - 1
+
+    def get_prefixes(self) -> list[str]:
+        """
+        Gets all current prefixes of the struct names, in order of appearance.
+        Example:
+
+        Vehicle.Cabin
+        Something.Else
+
+        -> [Vehicle, Something]
+        """
+        return list(dict.fromkeys(segments[0] for segments in self.struct_names if len(segments) > 1))
+
+    def get_prefix_strip_conflicts(self, prefix: str) -> int:
+        """
+        Finds conflicts if we would strip the given prefix from structs
+        """
+        renames = [
+            (".".join(segments), ".".join(segments[1:]))
+            for segments in (self.struct_names[i] for i in self.struct_index.get(prefix, []))
+        ]
+        for name, new_name in renames:
+            self.remove_name(name)
+            self.add_name(new_name)
+        conflicts = self.duplicates
+        for name, new_name in renames:
+            self.remove_name(new_name)
+            self.add_name(name)
+        return conflicts
+
+    def strip_prefix(self, prefix: str) -> int:
+        """
+        Left strips all structs and member datatypes from the given prefix
+        Returns the number of changed struct names
+        """
+        stripped = 0
+        for i in self.strip_names(prefix, self.struct_names, self.struct_index, "Struct"):
+            self.remove_name(".".join(self.struct_names[i]))
+            self.add_name(".".join(self.struct_names[i][1:]))
+            del self.struct_names[i][0]
+            stripped += 1
+        for i in self.strip_names(prefix, self.member_names, self.member_index, "Member"):
+            del self.member_names[i][0]
+        return stripped
+
+    def strip_names(self, prefix: str, names: list[list[str]], index: dict[str, list[int]], kind: str) -> list[int]:
+        """
+        Gets the names to strip from the given prefix and moves them to the index of their new prefix
+        """
+        stripped = []
+        kept = []
+        for i in index.pop(prefix, []):
+            new_segments = names[i][1:]
+            if len(new_segments) == 1 and is_only_instance(new_segments[0]):
+                log.debug(f"{kind}, not stripping, would be Instance id only: {'.'.join(names[i])}")
+                kept.append(i)
+                continue
+            stripped.append(i)
+            if len(new_segments) > 1:
+                index.setdefault(new_segments[0], []).append(i)
+        if kept:
+            index.setdefault(prefix, []).extend(kept)
+        return stripped
+
+    def shorten(self) -> None:
+        rounds = 0
+        while True:
+            prefixes = self.get_prefixes()
+            log.debug(f"{prefixes=}")
+            stripped = 0
+            for prefix in prefixes:
+                conflicts = self.get_prefix_strip_conflicts(prefix)
+                log.debug(f"Struct name conflicts, prefix={prefix}, conflicts={conflicts}")
+                if conflicts == 0:
+                    stripped += self.strip_prefix(prefix)
+                    log.info(f"Stripping '{prefix}', round={rounds}, {stripped=}")
+            if stripped == 0:
+                break
+            else:
+                rounds += 1
+
+        for struct, segments in zip(self.structs, self.struct_names):
+            struct.name = ".".join(segments)
+        for member, segments in zip(self.members, self.member_names):
+            if len(segments) < member.datatype.count(".") + 1:
+                array = "[]" if member.datatype.startswith("[]") else ""
+                member.datatype = array + ".".join(segments)
 
 
 @click.command()
@@ -308,21 +388,7 @@ def cli(
     structs.update(datatype_structs)
 
     if short_names:
-        rounds = 0
-        while True:
-            prefixes = get_prefixes(structs)
-            log.debug(f"{prefixes=}")
-            stripped = 0
-            for prefix in prefixes:
-                conflicts = get_prefix_strip_conflicts(prefix, structs)
-                log.debug(f"Struct name conflicts, prefix={prefix}, conflicts={conflicts}")
-                if conflicts == 0:
-                    stripped += strip_structs_prefix(prefix, structs)
-                    log.info(f"Stripping '{prefix}', round={rounds}, {stripped=}")
-            if stripped == 0:
-                break
-            else:
-                rounds += 1
+        StructNames(structs).shorten()
 
     with open(output, "w") as f:
         f.write(f"package {package}\n\n")
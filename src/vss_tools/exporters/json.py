@@ -16,17 +16,43 @@ import rich_click as click
 
 import vss_tools.cli_options as clo
 from vss_tools import log
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
 from vss_tools.main import get_trees
 from vss_tools.tree import VSSNode
 
 
+class JsonVisitor(Visitor):
+    """
+    Builds the nested data of the visited tree
+    """
+
+    def __init__(self, with_extra_attributes: bool = True, extended_attributes: tuple[str, ...] = ()) -> None:
+        self.with_extra_attributes = with_extra_attributes
+        self.extended_attributes = extended_attributes
+        self.data: dict[str, Any] = {}
+        self.stack: list[dict[str, Any]] = []
+
+    def enter(self, visit: Visit) -> None:
+        node = visit.node
+        if self.stack:
+            # The given attribute options only apply to the root node
+            data = node.data.as_dict()
+            self.stack[-1]["children"][node.name] = data
+        else:
+            data = node.data.as_dict(self.with_extra_attributes, extended_attributes=self.extended_attributes)
+            self.data = data
+        if len(node.children) > 0:
+            data["children"] = {}
+        self.stack.append(data)
+
+    def leave(self, visit: Visit) -> None:
+        self.stack.pop()
+
+
 def get_data(node: VSSNode, with_extra_attributes: bool = True, extended_attributes: tuple[str, ...] = ()):
-    data = node.data.as_dict(with_extra_attributes, extended_attributes=extended_attributes)
-    if len(node.children) > 0:
-        data["children"] = {}
-    for child in node.children:
-        data["children"][child.name] = get_data(child)
-    return data
+    visitor = JsonVisitor(with_extra_attributes, extended_attributes)
+    traverse(node, [visitor])
+    return visitor.data
 
 
 @click.command()
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 import rich_click as click
+from anytree import PreOrderIter
 
 import vss_tools.cli_options as clo
 from vss_tools import log
@@ -68,6 +69,11 @@ type_map = {
     is_flag=True,
     help="Required all elements defined in VSS tree for a valid object",
 )
+@click.option(
+    "--inline-structs",
+    is_flag=True,
+    help="Inline the struct schemas for every signal using them, instead of referencing them from '$defs'",
+)
 def cli(
     vspec: Path,
     output: Path,
@@ -84,6 +90,7 @@ def cli(
     pretty: bool,
     no_additional_properties: bool,
     require_all_properties: bool,
+    inline_structs: bool,
 ):
     """
     Export as a jsonschema.
@@ -108,16 +115,34 @@ def cli(
 
     schema = {"$schema": "https://json-schema.org/draft/2020-12/schema", "title": tree.name}
 
-    add_node(schema, tree, datatype_tree, no_additional_properties, require_all_properties, extend_all_attributes)
+    defs: dict[str, Any] | None = None if inline_structs else {}
+    add_node(
+        schema,
+        tree,
+        get_type_nodes(datatype_tree),
+        no_additional_properties,
+        require_all_properties,
+        extend_all_attributes,
+        defs,
+    )
+    if defs:
+        schema["$defs"] = defs
 
     with open(output, "w", encoding="utf-8") as output_file:
         json.dump(schema, output_file, indent=indent, sort_keys=False)
 
 
-def find_type_node(datatype_tree: VSSNode | None, fqn: str) -> VSSNode | None:
+def get_type_nodes(datatype_tree: VSSNode | None) -> dict[str, VSSNode]:
+    """
+    Index of the datatype tree nodes by their fqn
+    """
     if not datatype_tree:
-        return None
-    return datatype_tree.get_node_with_fqn(fqn)
+        return {}
+    return {node.get_fqn(): node for node in PreOrderIter(datatype_tree)}
+
+
+def find_type_node(type_nodes: dict[str, VSSNode], fqn: str) -> VSSNode | None:
+    return type_nodes.get(fqn)
 
 
 def add_x_attributes(schema: dict[str, Any], node: VSSNode) -> None:
@@ -135,14 +160,40 @@ def add_x_attributes(schema: dict[str, Any], node: VSSNode) -> None:
         schema["x-comment"] = data.comment
 
 
+def add_struct_ref(
+    schema: dict[str, Any],
+    type_node: VSSNode,
+    type_nodes: dict[str, VSSNode],
+    no_additional_props: bool,
+    require_all_properties: bool,
+    extend_all_attributes: bool,
+    defs: dict[str, Any],
+) -> None:
+    """
+    References the schema of the given struct from defs, adding it there if it is not yet
+    """
+    fqn = type_node.get_fqn()
+    if fqn not in defs:
+        defs[fqn] = {}
+        add_node(
+            defs[fqn], type_node, type_nodes, no_additional_props, require_all_properties, extend_all_attributes, defs
+        )
+    schema["$ref"] = f"#/$defs/{fqn}"
+
+
 def add_node(
     schema: dict[str, Any],
     node: VSSNode,
-    dtree: VSSNode | None,
+    type_nodes: dict[str, VSSNode],
     no_additional_props: bool,
     require_all_properties: bool,
     extend_all_attributes: bool,
+    defs: dict[str, Any] | None = None,
 ) -> None:
+    """
+    Adds the schema of the given node.
+    Struct schemas are added to and referenced from defs, or inlined if defs is None
+    """
     schema["type"] = "object"
     schema["description"] = node.get_vss_data().description
     if extend_all_attributes:
@@ -169,10 +220,15 @@ def add_node(
                 ref["enum"] = node.data.allowed
         else:
             fqn = resolve_datatype(node.data.datatype, node.get_fqn()).rstrip("[]")
-            type_node = find_type_node(dtree, fqn)
+            type_node = find_type_node(type_nodes, fqn)
             if not type_node:
                 raise JsonSchemaExporterException()
-            add_node(ref, type_node, dtree, no_additional_props, require_all_properties, extend_all_attributes)
+            if defs is None:
+                add_node(ref, type_node, type_nodes, no_additional_props, require_all_properties, extend_all_attributes)
+            else:
+                add_struct_ref(
+                    ref, type_node, type_nodes, no_additional_props, require_all_properties, extend_all_attributes, defs
+                )
     else:
         schema["properties"] = {}
         if no_additional_props:
@@ -187,8 +243,9 @@ def add_node(
             add_node(
                 schema["properties"][child.name],
                 child,
-                dtree,
+                type_nodes,
                 no_additional_props,
                 require_all_properties,
                 extend_all_attributes,
+                defs,
             )
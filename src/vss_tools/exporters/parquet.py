@@ -0,0 +1,227 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+# Convert vspec tree to a typed Parquet (or Arrow IPC/Feather) table.
+# pyarrow is an optional dependency, only imported when exporting
+
+from __future__ import annotations
+
+import json
+import sys
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+import rich_click as click
+
+import vss_tools.cli_options as clo
+from vss_tools import log
+from vss_tools.exporters.csv import get_attribute_getters, get_columns
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
+from vss_tools.main import get_trees
+from vss_tools.tree import VSSNode
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Columns with few distinct values, dictionary encoded
+DICTIONARY_COLUMNS = ("type", "datatype", "unit")
+NUMBER_COLUMNS = ("min", "max")
+LIST_COLUMNS = ("allowed", "fka")
+
+INT64_RANGE = (-(2**63), 2**63 - 1)
+UINT64_RANGE = (0, 2**64 - 1)
+# Largest magnitude up to which all integers are exact in a float64
+FLOAT64_EXACT_INT = 2**53
+
+
+def get_text(value: Any) -> str | None:
+    """
+    Text of a value of any datatype, strings as they are and other values as JSON
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def get_list_text(values: list[Any]) -> list[str | None]:
+    return [get_text(value) for value in values]
+
+
+def get_converter(column: str) -> Callable[[Any], Any] | None:
+    """
+    Conversion of the (not None) values of a column
+    """
+    if column in ("type", *NUMBER_COLUMNS):
+        return None
+    if column in LIST_COLUMNS:
+        return get_list_text
+    return get_text
+
+
+def in_range(numbers: Sequence[float], lower: int, upper: int) -> bool:
+    return all(lower <= number <= upper for number in numbers)
+
+
+def get_number_array(values: list[int | float | None]) -> pa.Array:
+    """
+    Array of a number column which keeps all values exact.
+    Integral columns are int64 or uint64, other columns float64, unless an integer would be rounded,
+    in which case the column is decimal, with the precision and scale needed by its values
+    """
+    import pyarrow as pa
+
+    numbers = [value for value in values if value is not None]
+    if all(isinstance(number, int) for number in numbers):
+        if in_range(numbers, *INT64_RANGE):
+            return pa.array(values, pa.int64())
+        if in_range(numbers, *UINT64_RANGE):
+            return pa.array(values, pa.uint64())
+    elif in_range([number for number in numbers if isinstance(number, int)], -FLOAT64_EXACT_INT, FLOAT64_EXACT_INT):
+        return pa.array(values, pa.float64())
+
+    # repr gives the shortest text which reads back as the same float
+    decimals = [None if value is None else Decimal(repr(value)) for value in values]
+    exponents = [decimal.as_tuple().exponent for decimal in decimals if decimal is not None]
+    digits = [len(decimal.as_tuple().digits) for decimal in decimals if decimal is not None]
+    scale = max([0, *(-int(exponent) for exponent in exponents)])
+    precision = scale + max([1, *(count + int(exponent) for count, exponent in zip(digits, exponents))])
+    if precision <= 38:
+        return pa.array(decimals, pa.decimal128(precision, scale))
+    if precision <= 76:
+        return pa.array(decimals, pa.decimal256(precision, scale))
+    log.warning("Number values need %d digits, more than a decimal column holds, writing them as double", precision)
+    return pa.array([None if value is None else float(value) for value in values], pa.float64())
+
+
+class ColumnsVisitor(Visitor):
+    """
+    Collects the values of all nodes per column
+    """
+
+    def __init__(self, columns: tuple[str, ...]) -> None:
+        self.attributes = columns
+        self.converters = [get_converter(column) for column in columns]
+        self.names: list[str] = []
+        self.values: list[list[Any]] = [[] for _ in columns]
+
+    @property
+    def columns(self) -> dict[str, list[Any]]:
+        return {"name": self.names, **dict(zip(self.attributes, self.values))}
+
+    def enter(self, visit: Visit) -> None:
+        self.names.append(visit.fqn)
+        data = visit.data
+        getters = get_attribute_getters(type(data), self.attributes, None)
+        for values, getter, convert in zip(self.values, getters, self.converters):
+            value = getter(data)
+            values.append(value if convert is None or value is None else convert(value))
+
+
+def get_table(root: VSSNode, with_instance_column: bool, extended_attributes: tuple[str, ...] = ()) -> pa.Table:
+    """
+    One row per node, with the attributes of the CSV exporter and 'fka'
+    """
+    import pyarrow as pa
+
+    visitor = ColumnsVisitor(get_columns(with_instance_column, ("fka", *extended_attributes)))
+    traverse(root, [visitor])
+
+    arrays = []
+    for column, values in visitor.columns.items():
+        if column in DICTIONARY_COLUMNS:
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        elif column in NUMBER_COLUMNS:
+            arrays.append(get_number_array(values))
+        elif column in LIST_COLUMNS:
+            arrays.append(pa.array(values, pa.list_(pa.string())))
+        else:
+            arrays.append(pa.array(values, pa.string()))
+    return pa.Table.from_arrays(arrays, names=list(visitor.columns))
+
+
+def write_table(table: pa.Table, output: Path, feather: bool) -> None:
+    if feather:
+        from pyarrow import feather as arrow_feather
+
+        arrow_feather.write_feather(table, output)
+    else:
+        from pyarrow import parquet
+
+        parquet.write_table(table, output)
+    log.info("Wrote %d rows to %s", table.num_rows, output)
+
+
+def get_types_output(output: Path) -> Path:
+    """
+    Default output of the types table, next to the signal table
+    """
+    return output.with_name(f"{output.stem}_types{output.suffix}")
+
+
+@click.command()
+@clo.vspec_opt
+@clo.output_required_opt
+@clo.include_dirs_opt
+@clo.extended_attributes_opt
+@clo.strict_opt
+@clo.aborts_opt
+@clo.expand_opt
+@clo.overlays_opt
+@clo.quantities_opt
+@clo.units_opt
+@clo.types_opt
+@clo.types_output_opt
+@click.option(
+    "--feather/--no-feather",
+    default=False,
+    show_default=True,
+    help="Write Arrow IPC (Feather) files instead of Parquet files.",
+)
+def cli(
+    vspec: Path,
+    output: Path,
+    include_dirs: tuple[Path],
+    extended_attributes: tuple[str],
+    strict: bool,
+    aborts: tuple[str],
+    expand: bool,
+    overlays: tuple[Path],
+    quantities: tuple[Path],
+    units: tuple[Path],
+    types: tuple[Path],
+    types_output: Path | None,
+    feather: bool,
+):
+    """
+    Export as Parquet.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        log.error("The parquet exporter requires 'pyarrow', install it with 'pip install vss-tools[parquet]'")
+        sys.exit(1)
+
+    tree, datatype_tree = get_trees(
+        vspec=vspec,
+        include_dirs=include_dirs,
+        aborts=aborts,
+        strict=strict,
+        extended_attributes=extended_attributes,
+        quantities=quantities,
+        units=units,
+        types=types,
+        overlays=overlays,
+        expand=expand,
+    )
+    log.info("Generating Parquet output...")
+
+    with_instance_column = not expand
+    write_table(get_table(tree, with_instance_column, extended_attributes), output, feather)
+    if datatype_tree:
+        write_table(get_table(datatype_tree, with_instance_column), types_output or get_types_output(output), feather)
@@ -12,12 +12,11 @@ import rich_click as click
 
 import vss_tools.cli_options as clo
 from vss_tools import log
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
 from vss_tools.main import get_trees
 from vss_tools.model import VSSDataBranch
 from vss_tools.tree import VSSNode
 
-fqns: set[str] = set()
-
 
 # make first character lowercase
 def lc_first(s) -> str:
@@ -27,158 +26,216 @@ def lc_first(s) -> str:
         return s[0].lower() + s[1:]
 
 
-# variant of get_fqn that skips instance nodes (and the top-level one)
-def get_fqn2(node: VSSNode) -> str:
-    fqn = node.name
-    while node.parent:
-        data = node.get_vss_data()
-        if node.is_leaf or not (isinstance(data, VSSDataBranch) and data.is_instance):
-            # generated classes are in a package carrying their own name, but enumerations are not
-            if not getattr(data, "allowed", None):
-                fqn = "P" + node.name + "." + fqn
-        node = node.parent
-    return fqn
+class Names(Visitor):
+    """
+    Names of the nodes of a tree.
+    The qualified names are built top-down from the package prefixes of the parents while walking the tree,
+    those of the children of a node when entering it, so that they are known when rendering the node
+    """
 
+    def __init__(self) -> None:
+        self.fqns2: dict[int, str] = {}
+        self.prefixes: dict[int, str] = {}
 
-def get_name(node: VSSNode, qualify: bool) -> str:
-    if qualify:
-        return get_fqn2(node)
-    else:
-        return node.name
-
-
-# get the class name of a node that is not an instance going up.
-# adds postfix IS
-def get_classname(node: VSSNode, qualify: bool) -> str:
-    data = node.get_vss_data()
-    if node.is_leaf:
-        return get_name(node, qualify)
-    elif not (isinstance(data, VSSDataBranch) and data.is_instance):
-        if has_nested_instance_child(node):
-            return get_name(node, qualify) + "IS0"
-        elif has_instance_child(node):
-            return get_name(node, qualify) + "IS"
+    def enter(self, visit: Visit) -> None:
+        node = visit.node
+        if visit.parent is None:
+            self.prefixes[id(node)] = ""
+            self.fqns2[id(node)] = node.name
+        for child in node.children:
+            prefix = self.prefixes[id(node)]
+            data = child.get_vss_data()
+            if child.is_leaf or not (isinstance(data, VSSDataBranch) and data.is_instance):
+                # generated classes are in a package carrying their own name, but enumerations are not
+                if not getattr(data, "allowed", None):
+                    prefix += "P" + child.name + "."
+            self.prefixes[id(child)] = prefix
+            self.fqns2[id(child)] = prefix + child.name
+
+    # variant of get_fqn that skips instance nodes (and the top-level one)
+    def get_fqn2(self, node: VSSNode) -> str:
+        return self.fqns2[id(node)]
+
+    def get_name(self, node: VSSNode, qualify: bool) -> str:
+        if qualify:
+            return self.get_fqn2(node)
         else:
-            return get_name(node, qualify)
-    else:
-        parent = node.parent
-        if parent.get_vss_data().is_instance:
-            parent = parent.parent
-        if has_instance_child(node):
-            # node is already instance, implies nested one
-            return get_name(parent, qualify) + "_IS1"
+            return node.name
+
+    # get the class name of a node that is not an instance going up.
+    # adds postfix IS
+    def get_classname(self, node: VSSNode, qualify: bool) -> str:
+        data = node.get_vss_data()
+        if node.is_leaf:
+            return self.get_name(node, qualify)
+        elif not (isinstance(data, VSSDataBranch) and data.is_instance):
+            if self.has_nested_instance_child(node):
+                return self.get_name(node, qualify) + "IS0"
+            elif self.has_instance_child(node):
+                return self.get_name(node, qualify) + "IS"
+            else:
+                return self.get_name(node, qualify)
         else:
-            return get_name(parent, qualify)
+            parent = node.parent
+            if parent.get_vss_data().is_instance:
+                parent = parent.parent
+            if self.has_instance_child(node):
+                # node is already instance, implies nested one
+                return self.get_name(parent, qualify) + "_IS1"
+            else:
+                return self.get_name(parent, qualify)
 
+    # convenience function wrapping count_instance_children_depth
+    def has_instance_child(self, node: VSSNode) -> bool:
+        return node.count_instance_children_depth() > 0
 
-# convenience function wrapping count_instance_children_depth
-def has_instance_child(node: VSSNode) -> bool:
-    return node.count_instance_children_depth() > 0
+    # convenience function wrapping count_instance_children_depth
+    def has_nested_instance_child(self, node: VSSNode) -> bool:
+        return node.count_instance_children_depth() > 1
 
 
-# convenience function wrapping count_instance_children_depth
-def has_nested_instance_child(node: VSSNode) -> bool:
-    return node.count_instance_children_depth() > 1
+class Renderer(Visitor):
+    """
+    Renders a tree in a single walk, collecting the lines of the enums and of the classes in separate lists.
+    The qualified names are computed by 'Names', attached to the same walk.
+    Enums are rendered once per qualified name, and their packages only if they contain an enum.
+    Only the first instance of a branch is rendered as class.
+    """
 
+    def __init__(self, tree: VSSNode, with_enums: bool = True) -> None:
+        self.names = Names()
+        self.with_enums = with_enums
+        self.enum_lines: list[str] = []
+        self.class_lines: list[str] = []
+        self.enum_fqns: set[str] = set()
+        # (fill, name) of the packages of the current node in the enums, and how many of them are already written
+        self.enum_packages: list[tuple[str, str]] = []
+        self.written_enum_packages = 0
+        # Per entered branch: (enum fill, class fill) and the class fill of its following children, None: no class
+        self.fills: list[tuple[str, str | None]] = []
+        self.child_class_fills: list[str | None] = []
+        traverse(tree, [self.names, self])
 
-def get_enums(tree: VSSNode, fill: str, attributes: tuple[str]) -> str:
-    tree_content_lines = []
-    for node in tree.children:
-        data = node.get_vss_data()
-        if node.is_leaf:
-            allowed = getattr(data, "allowed", None)
-            fqn = get_fqn2(node)
-            if allowed and (fqn not in fqns):
-                # use enumeration instead of datatype, use 2nd level package name
-                fqns.add(fqn)
-                # create Enumeration
-                tree_content_lines.append("")
-                tree_content_lines.append("%s' %s" % (fill, data.description))
-                tree_content_lines.append("%senum %s {" % (fill, node.name))
-                for a in allowed:
-                    tree_content_lines.append("%s\t%s," % (fill, a))
-                tree_content_lines.append("%s}" % (fill))
-        else:
-            if not node.parent:
-                # top level package, recurse only
-                result = get_enums(node, fill + "\t", attributes)
-                tree_content_lines.append(result)
-            elif isinstance(data, VSSDataBranch) and data.is_instance:
-                # instance node, recurse only (no package, no indent)
-                result = get_enums(node, fill, attributes)
-                if result:
-                    tree_content_lines.append(result)
+    def is_package(self, visit: Visit) -> bool:
+        """
+        Whether the node is a package in the enums, instance nodes are not
+        """
+        return visit.parent is not None and not visit.is_instance
+
+    def enter(self, visit: Visit) -> None:
+        node = visit.node
+        enum_fill = ""
+        class_fill: str | None = ""
+        if visit.parent is not None:
+            enum_fill, _ = self.fills[-1]
+            class_fill = self.child_class_fills[-1]
+            if node.is_leaf:
+                self.add_enum(node, enum_fill)
+                return
+            if visit.is_instance:
+                # instance node, no package, no indent in the enums
+                self.child_class_fills[-1] = None
             else:
-                result = get_enums(node, fill + "\t", attributes)
-                # only add package, if it contains an enumeration
-                if result:
-                    tree_content_lines.append("")
-                    tree_content_lines.append("%spackage P%s {" % (fill, node.name))
-                    tree_content_lines.append(result)
-                    tree_content_lines.append("%s}" % (fill))
+                self.enum_packages.append((enum_fill, node.name))
+                enum_fill += "\t"
 
-    return "\n".join(tree_content_lines)
+        self.fills.append((enum_fill, class_fill))
+        self.child_class_fills.append(None if class_fill is None else self.add_class(node, class_fill))
 
+    def leave(self, visit: Visit) -> None:
+        if visit.parent is not None and visit.node.is_leaf:
+            return
+        _, class_fill = self.fills.pop()
+        self.child_class_fills.pop()
+        if class_fill is not None and self.needs_package(visit.node):
+            self.class_lines.append("%s}" % (class_fill))
+        if self.is_package(visit):
+            self.close_enum_package()
 
-def get_rendered_class(tree: VSSNode, fill, attributes: tuple[str]) -> str:
-    tree_content_lines = []
-    for node in tree.children:
+    def add_enum(self, node: VSSNode, fill: str) -> None:
+        data = node.get_vss_data()
+        allowed = getattr(data, "allowed", None)
+        if not (self.with_enums and allowed):
+            return
+        fqn = self.names.get_fqn2(node)
+        if fqn in self.enum_fqns:
+            return
+        # use enumeration instead of datatype, use 2nd level package name
+        self.enum_fqns.add(fqn)
+        for package_fill, name in self.enum_packages[self.written_enum_packages :]:
+            self.enum_lines.append("")
+            self.enum_lines.append("%spackage P%s {" % (package_fill, name))
+        self.written_enum_packages = len(self.enum_packages)
+        # create Enumeration
+        self.enum_lines.append("")
+        self.enum_lines.append("%s' %s" % (fill, data.description))
+        self.enum_lines.append("%senum %s {" % (fill, node.name))
+        for a in allowed:
+            self.enum_lines.append("%s\t%s," % (fill, a))
+        self.enum_lines.append("%s}" % (fill))
+
+    def close_enum_package(self) -> None:
+        fill, _ = self.enum_packages.pop()
+        if self.written_enum_packages > len(self.enum_packages):
+            self.written_enum_packages = len(self.enum_packages)
+            self.enum_lines.append("%s}" % (fill))
+
+    def needs_package(self, node: VSSNode) -> bool:
+        data = node.get_vss_data()
+        return bool(node.parent) and (node.is_leaf or not (isinstance(data, VSSDataBranch) and data.is_instance))
+
+    def add_class(self, node: VSSNode, fill: str) -> str:
+        """
+        Adds the class of the node, returns the fill for the classes of its children
+        """
+        data = node.get_vss_data()
+        if self.needs_package(node):
+            self.class_lines.append("%s' %s" % (fill, data.description))
+            self.class_lines.append("%spackage P%s {" % (fill, node.name))
+            fill = fill + "\t"
+        self.class_lines.append("%sclass %s {" % (fill, self.names.get_classname(node, False)))
+        if not node.children:
+            self.class_lines.append("")
+        for child in node.children:
+            self.add_class_member(child, fill + "\t")
+        self.class_lines.append("%s}" % (fill))
+        return fill
+
+    def add_class_member(self, node: VSSNode, fill: str) -> None:
         data = node.get_vss_data()
         if node.is_leaf:
             # add an entry to the data type
-            tree_content_lines.append("")
-            tree_content_lines.append("%s' %s: %s" % (fill, data.type.value, data.description))
+            self.class_lines.append("")
+            self.class_lines.append("%s' %s: %s" % (fill, data.type.value, data.description))
             datatype = getattr(data, "datatype", None)
             unit = getattr(data, "unit", None)
             if unit:
-                tree_content_lines.append("%s' unit: %s" % (fill, unit))
+                self.class_lines.append("%s' unit: %s" % (fill, unit))
             min = getattr(data, "min", None)
             max = getattr(data, "max", None)
             if (min is not None) and (max is not None):
-                tree_content_lines.append("%s' interval [%s..%s]" % (fill, min, max))
+                self.class_lines.append("%s' interval [%s..%s]" % (fill, min, max))
             elif min is not None:
-                tree_content_lines.append("%s' interval [%s..)" % (fill, min))
+                self.class_lines.append("%s' interval [%s..)" % (fill, min))
             elif max is not None:
-                tree_content_lines.append("%s' interval (..%s]" % (fill, max))
+                self.class_lines.append("%s' interval (..%s]" % (fill, max))
             if getattr(data, "allowed", None):
                 # use qualified name of enumeration as datatype
-                datatype = get_fqn2(node)
-            tree_content_lines.append("%s%s : %s" % (fill, lc_first(node.name), datatype))
-        else:
-            tree_content_lines.append("%s%s : %s" % (fill, lc_first(node.name), get_classname(node, True)))
-
-    return "\n".join(tree_content_lines)
-
-
-def get_rendered_tree(node: VSSNode, fill, attributes: tuple[str]) -> str:
-    tree_content_lines = []
-    data = node.get_vss_data()
-    needPkg = node.parent and (node.is_leaf or not (isinstance(data, VSSDataBranch) and data.is_instance))
-    if needPkg:
-        tree_content_lines.append("%s' %s" % (fill, data.description))
-        tree_content_lines.append("%spackage P%s {" % (fill, node.name))
-        nFill = fill + "\t"
-    else:
-        nFill = fill
-    tree_content_lines.append("%sclass %s {" % (nFill, get_classname(node, False)))
-    # if the node has child instances, enter into first one (skip current child node)
-    result = get_rendered_class(node, nFill + "\t", attributes)
-    tree_content_lines.append(result)
-    tree_content_lines.append("%s}" % (nFill))
-    for node in node.children:
-        data = node.get_vss_data()
-        if node.is_leaf:
-            pass
+                datatype = self.names.get_fqn2(node)
+            self.class_lines.append("%s%s : %s" % (fill, lc_first(node.name), datatype))
         else:
-            result = get_rendered_tree(node, nFill, attributes)
-            tree_content_lines.append(result)
-            if isinstance(data, VSSDataBranch) and data.is_instance:
-                break
+            self.class_lines.append("%s%s : %s" % (fill, lc_first(node.name), self.names.get_classname(node, True)))
 
-    if needPkg:
-        tree_content_lines.append("%s}" % (fill))
 
-    return "\n".join(tree_content_lines)
+def get_plant_code(tree: VSSNode, datatype_tree: VSSNode | None) -> str:
+    renderer = Renderer(tree)
+    parts = ["\n".join(renderer.enum_lines)]
+    if renderer.enum_fqns:
+        parts.append("\n' --- end of enums\n\n")
+    parts.append("\n".join(renderer.class_lines) + "\n")
+    if datatype_tree:
+        parts.append("\n'datatype tree:\n" + "\n".join(Renderer(datatype_tree, False).class_lines))
+    return "".join(parts)
 
 
 @click.command()
@@ -224,13 +281,7 @@ def cli(
         expand=expand,
     )
 
-    plant_code = get_enums(tree, "", attr)
-    if len(fqns) > 0:
-        plant_code += "\n' --- end of enums\n\n"
-
-    plant_code += get_rendered_tree(tree, "", attr) + "\n"
-    if datatype_tree:
-        plant_code += "\n'datatype tree:\n" + get_rendered_tree(datatype_tree, "", attr)
+    plant_code = get_plant_code(tree, datatype_tree)
 
     if output:
         log.info(f"Writing tree to: {output.absolute()}")
@@ -9,12 +9,15 @@
 # Convert vspec file to proto
 #
 
+import json
 import sys
-from io import TextIOWrapper
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from pathlib import Path
+from typing import TextIO
 
 import rich_click as click
-from anytree import findall
+from anytree import PreOrderIter
 
 import vss_tools.cli_options as clo
 from vss_tools import log
@@ -38,14 +41,54 @@ mapped = {
 }
 
 
-def init_package_file(path: Path, package_name: str):
-    with open(path, "w") as f:
-        log.info(f"Initializing {path}, package {package_name}")
-        f.write('syntax = "proto3";\n\n')
-        f.write(f"package {package_name};\n\n")
+def get_struct_imports(node: VSSNode, package_path: Path | None = None) -> list[str]:
+    """
+    Gets the package files of all structs used in the subtree of the node.
+    Structs of the given package are not imported
+    """
+    imports = []
+    for c_node in PreOrderIter(node, filter_=lambda n: isinstance(n.data, VSSDataDatatype)):
+        datatype = c_node.data.datatype
+        if "." not in datatype:
+            continue
+        struct_path = Path(datatype.replace(".", "/"))
+        if struct_path.parent != package_path:
+            imports.append(f"{struct_path.parent}/{struct_path.parent.name}.proto")
+    return imports
+
+
+def render_package(package_path: Path, structs: list[VSSNode], static_uid: bool, add_optional: bool) -> str:
+    """
+    Renders all structs of a package into the content of a single .proto file
+    """
+    fd = StringIO()
+    fd.write('syntax = "proto3";\n\n')
+    fd.write(f"package {'.'.join(package_path.parts)};\n\n")
+    written_imports: set[str] = set()
+    for node in structs:
+        imports = set(get_struct_imports(node, package_path)) - written_imports
+        written_imports.update(imports)
+        write_imports(fd, list(imports))
+
+        fd.write(f"message {node.name} {{" + "\n")
+        print_messages(node.children, fd, static_uid, add_optional)
+        fd.write("}\n\n")
+    return fd.getvalue()
+
 
+def write_package(
+    package_path: Path, structs: list[VSSNode], static_uid: bool, add_optional: bool, out_dir: Path
+) -> Path:
+    # <out-dir>/A/B/C/C.proto
+    out_file = out_dir / package_path / f"{package_path.name}.proto"
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    log.info("Initializing %s, package %s", out_file, ".".join(package_path.parts))
+    out_file.write_text(render_package(package_path, structs, static_uid, add_optional))
+    log.info("Wrote %s to %s", ", ".join(node.name for node in structs), out_file)
+    return out_file
 
-def traverse_data_type_tree(tree: VSSNode, static_uid: bool, add_optional: bool, out_dir: Path):
+
+def traverse_data_type_tree(tree: VSSNode, static_uid: bool, add_optional: bool, out_dir: Path) -> list[Path]:
     """
     All structs in a branch are written to a single .proto file.
     The file's base name is same as the branch's name
@@ -58,60 +101,116 @@ def traverse_data_type_tree(tree: VSSNode, static_uid: bool, add_optional: bool,
     The files are organized by package.
     With the above example, the file generated is
     A/B/C/C.proto
-    """
 
+    Structs are grouped by package first,
+    the package files are rendered and written concurrently.
+    Returning the written files
+    """
+    packages: dict[Path, list[VSSNode]] = {}
     node: VSSNode
-    for node in findall(tree, filter_=lambda n: isinstance(n.data, VSSDataStruct)):
-        # A/B/C/MyType
-        struct_path = Path(node.get_fqn("/"))
-
-        # <out-dir>/A/B/C
-        package_path = out_dir / struct_path.parent
-        package_path.mkdir(parents=True, exist_ok=True)
-
-        # <out-dir>/A/B/C/C.proto
-        out_file = package_path / f"{package_path.name}.proto"
-        if not out_file.exists():
-            init_package_file(out_file, ".".join(struct_path.parent.parts))
-
-        with open(out_file, "a") as fd:
-            imports = []
-            for c_node in findall(node, filter_=lambda n: isinstance(n.data, VSSDataDatatype)):
-                datatype = c_node.data.datatype
-                if "." not in datatype:
-                    continue
-                c_struct_path = Path(datatype.replace(".", "/"))
-                if c_struct_path.parent != struct_path.parent:
-                    imports.append(f"{c_struct_path.parent}/{c_struct_path.parent.name}.proto")
-
-            write_imports(fd, imports)
-
-            fd.write(f"message {struct_path.name} {{" + "\n")
-            print_messages(node.children, fd, static_uid, add_optional)
-            fd.write("}\n\n")
-            log.info(f"Wrote {struct_path.name} to {out_file}")
-
-
-def traverse_signal_tree(tree: VSSNode, fd: TextIOWrapper, static_uid: bool, add_optional: bool):
-    fd.write('syntax = "proto3";\n\n')
+    for node in PreOrderIter(tree, filter_=lambda n: isinstance(n.data, VSSDataStruct)):
+        # A/B/C/MyType -> A/B/C
+        package_path = Path(node.get_fqn("/")).parent
+        packages.setdefault(package_path, []).append(node)
+
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(write_package, package_path, structs, static_uid, add_optional, out_dir)
+            for package_path, structs in packages.items()
+        ]
+        return [future.result() for future in futures]
+
 
+def render_signal_file(
+    root: VSSNode, static_uid: bool, add_optional: bool, split_files: dict[VSSNode, str] | None = None
+) -> str:
+    """
+    Renders the messages of all branches below (and including) the root.
+    Struct imports and messages are collected in a single traversal.
+    Branches in 'split_files' (other than the root) are rendered into their own file
+    and only imported
+    """
+    split_files = split_files or {}
     imports = []
-    for node in findall(tree, filter_=lambda n: isinstance(n.data, VSSDataDatatype)):
-        datatype = node.data.datatype
-        if "." not in datatype:
+    messages = StringIO()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is not root and node in split_files:
+            imports.append(split_files[node])
             continue
-        struct_path = Path(node.data.datatype.replace(".", "/"))  # type: ignore
-        imports.append(f"{struct_path.parent}/{struct_path.parent.name}.proto")
+        if isinstance(node.data, VSSDataDatatype):
+            imports.extend(get_struct_imports(node))
+        elif isinstance(node.data, VSSDataBranch):
+            messages.write(f"message {node.get_fqn('')} {{" + "\n")
+            print_messages(node.children, messages, static_uid, add_optional)
+            messages.write("}\n\n")
+        stack.extend(reversed(node.children))
+
+    fd = StringIO()
+    fd.write('syntax = "proto3";\n\n')
     write_imports(fd, imports)
+    fd.write(messages.getvalue())
+    return fd.getvalue()
 
-    # write proto messages to file
-    for node in findall(tree, filter_=lambda node: isinstance(node.data, VSSDataBranch)):
-        fd.write(f"message {node.get_fqn('')} {{" + "\n")
-        print_messages(node.children, fd, static_uid, add_optional)
-        fd.write("}\n\n")
 
+def traverse_signal_tree(tree: VSSNode, fd: TextIO, static_uid: bool, add_optional: bool):
+    fd.write(render_signal_file(tree, static_uid, add_optional))
+
+
+def write_split_signal_files(
+    tree: VSSNode, output: Path, split_depth: int, static_uid: bool, add_optional: bool
+) -> list[Path]:
+    """
+    Writes the messages of each branch at the given depth (and its subtree)
+    into a separate file, the remaining messages go into the output file.
+    Split files are placed into a directory named like the output file
+    and get imported relative to the output directory.
+
+    Example with depth 1, output 'out/vss.proto':
+    out/vss.proto (message Vehicle, importing vss/VehicleBody.proto, ...)
+    out/vss/VehicleBody.proto (message VehicleBody, VehicleBodyLights, ...)
+
+    The files are rendered and written concurrently.
+    Returning the written files
+    """
+    split_roots = PreOrderIter(
+        tree,
+        filter_=lambda n: n.depth - tree.depth == split_depth and isinstance(n.data, VSSDataBranch),
+        maxlevel=split_depth + 1,
+    )
+    split_files = {node: f"{output.stem}/{node.get_fqn('')}.proto" for node in split_roots}
+    files = {tree: output}
+    files.update({node: output.parent / path for node, path in split_files.items()})
+    if split_files:
+        (output.parent / output.stem).mkdir(parents=True, exist_ok=True)
 
-def write_imports(fd: TextIOWrapper, imports: list[str]):
+    def write(node: VSSNode, path: Path) -> Path:
+        path.write_text(render_signal_file(node, static_uid, add_optional, split_files))
+        log.info("Wrote %s to %s", node.get_fqn(), path)
+        return path
+
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(write, node, path) for node, path in files.items()]
+        return [future.result() for future in futures]
+
+
+def write_manifest(path: Path, signal_files: list[Path], types_out_dir: Path | None, type_files: list[Path]):
+    """
+    Writes a json manifest listing all generated files.
+    Signal files are relative to the manifest, type files to the types output directory
+    """
+    manifest = {
+        "signals": [str(f.relative_to(path.parent)) for f in signal_files],
+        "types_dir": str(types_out_dir) if types_out_dir else None,
+        "types": [str(f.relative_to(types_out_dir)) for f in type_files] if types_out_dir else [],
+    }
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    log.info("Manifest written to %s", path)
+
+
+def write_imports(fd: TextIO, imports: list[str]):
     imports = list(set(imports))
     imports.sort()
     for stmt in imports:
@@ -119,7 +218,7 @@ def write_imports(fd: TextIOWrapper, imports: list[str]):
     fd.write("\n")
 
 
-def print_messages(nodes: tuple[VSSNode], fd: TextIOWrapper, static_uid: bool, add_optional: bool):
+def print_messages(nodes: tuple[VSSNode], fd: TextIO, static_uid: bool, add_optional: bool):
     usedKeys: dict[int, str] = {}
     for i, node in enumerate(nodes, 1):
         if isinstance(node.data, VSSDataDatatype):
@@ -186,6 +285,14 @@ def print_messages(nodes: tuple[VSSNode], fd: TextIOWrapper, static_uid: bool, a
     help="Expect staticUID attribute in the vspec input and use it as field number",
 )
 @click.option("--add-optional", is_flag=True, help="Set each field to 'optional'")
+@click.option(
+    "--split-depth",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Write the messages of each branch at the given depth (1: children of the root) into a separate file."
+    " Also writes a manifest of all generated files. 0 writes a single file.",
+)
 def cli(
     vspec: Path,
     output: Path,
@@ -200,6 +307,7 @@ def cli(
     types_out_dir: Path | None,
     static_uid: bool,
     add_optional: bool,
+    split_depth: int,
 ):
     """
     Export as protobuf.
@@ -216,11 +324,18 @@ def cli(
         types=types,
         overlays=overlays,
     )
+    type_files: list[Path] = []
     if datatype_tree:
         if not types_out_dir:
             types_out_dir = Path.cwd()
             log.warning(f"No output directory given. Writing to: {types_out_dir.absolute()}")
-        traverse_data_type_tree(datatype_tree, static_uid, add_optional, types_out_dir)
+        type_files = traverse_data_type_tree(datatype_tree, static_uid, add_optional, types_out_dir)
+
+    if split_depth:
+        log.info(f"Writing to: {output}, split depth: {split_depth}")
+        signal_files = write_split_signal_files(tree, output, split_depth, static_uid, add_optional)
+        write_manifest(output.with_suffix(".manifest.json"), signal_files, types_out_dir, type_files)
+        return
 
     with open(output, "w") as f:
         log.info(f"Writing to: {output}")
@@ -11,10 +11,7 @@
 #
 
 
-import importlib
 from pathlib import Path
-from types import ModuleType
-from typing import Optional
 
 import rich_click as click
 from anytree import findall
@@ -24,25 +21,8 @@ from vss_tools import log
 from vss_tools.main import get_trees
 from vss_tools.tree import VSSNode
 
-from .config import config as cfg
-
-VSSConcepts: Optional[ModuleType] = None
-vss_helper: Optional[ModuleType] = None
-ttl_helper: Optional[ModuleType] = None
-
-
-def __setup_environment(output_namespace, vspec_version, split_depth: int) -> None:
-    # Initialize config before to load other helpers / libraries, based on defined by user input, config data
-    cfg.init(output_namespace, vspec_version, split_depth)
-
-    global VSSConcepts
-    VSSConcepts = importlib.import_module("vss_tools.exporters.samm.helpers.samm_concepts").VSSConcepts
-
-    global vss_helper
-    vss_helper = importlib.import_module("vss_tools.exporters.samm.helpers.vss_helper")
-
-    global ttl_helper
-    ttl_helper = importlib.import_module("vss_tools.exporters.samm.helpers.ttl_helper")
+from .config.config import Config
+from .helpers import ttl_helper, vss_helper
 
 
 # TODO: Currently this is a workaround to read the Vehicle.VersionVSS, which is provided from COVESA/VSS
@@ -95,6 +75,28 @@ Allows to convert just selected VSS signals into aspect model(s), if '-spl / --s
 \033[33mEXAMPLE:\033[0m \033[96m-sigf PATH_TO_FILE/selected_signals.txt\033[0m
  """,
 )
+@clo.option(
+    "--direct-ttl/--no-direct-ttl",
+    default=False,
+    show_default=False,
+    help="""\b
+Boolean flag - used to write the aspect models (TTLs) directly, without serializing them with rdflib.
+Faster, and gives the same RDF graphs, but with different formatting of the TTL files.
+\033[30m[default: False]\033[0m
+ """,
+)
+@clo.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    show_default=False,
+    help="""\b
+Number of processes used to build and serialize the split aspect models in parallel.
+Use 1 to build them sequentially in the current process.
+\033[30m[default: number of CPUs]\033[0m
+ """,
+)
 @clo.option(
     "--split-depth",
     "-spld",
@@ -174,6 +176,8 @@ def cli(
     output_namespace,
     split,
     split_depth,
+    jobs,
+    direct_ttl,
 ) -> None:
     """
     Export as Eclipse Semantic Modeling Framework (ESMF) - Semantic Aspect Meta Model (SAMM) - .ttl files.
@@ -192,13 +196,6 @@ def cli(
         vspec, include_dirs, aborts, strict, extended_attributes, quantities, units, types, overlays, False
     )
 
-    # Get the VSS version from the vss_tree::VersionVSS
-    vss_version = __get_version_vss(vss_tree)
-
-    __setup_environment(output_namespace, vss_version, split_depth)
-
-    included_signals = []
-    included_branches = []
     included_signals_input = []
 
     if signals_file:
@@ -210,15 +207,42 @@ def cli(
     else:
         log.info("No signals selected.\nCreating model for the whole VSS tree.\n")
 
+    export_samm(vss_tree, target_folder, output_namespace, split, split_depth, included_signals_input, jobs, direct_ttl)
+
+
+def export_samm(
+    vss_tree: VSSNode,
+    target_folder: Path,
+    output_namespace: str,
+    split: bool,
+    split_depth: int,
+    included_signals_input: list[str] | None = None,
+    jobs: int | None = 1,
+    direct_ttl: bool = False,
+) -> Path:
+    """
+    Converts the given VSS tree to SAMM aspect models (TTLs) and returns the folder they are written to.
+    All state of the conversion is kept in a new Config, so that this can be called
+    repeatedly or concurrently (on different trees) in the same interpreter.
+    With split, the aspect models are built by 'jobs' processes (None: number of CPUs).
+    """
+    # Get the VSS version from the vss_tree::VersionVSS
+    vss_version = __get_version_vss(vss_tree)
+
+    config = Config(output_namespace, vss_version, split_depth, direct_ttl)
+
+    included_signals = []
+    included_branches = []
+
     log.info(
         "Update output: '%s' with ESMF namespace: '%s' and VSS Version: '%s'.\n",
         target_folder,
         output_namespace,
-        cfg.VSPEC_VERSION,
+        config.vspec_version,
     )
 
     # Make sure that target folder gets reflected with respect to current output_namespace and VSPEC_VERSION
-    target_folder = Path(f"{target_folder}/{output_namespace}/{cfg.VSPEC_VERSION}")
+    target_folder = Path(f"{target_folder}/{output_namespace}/{config.vspec_version}")
 
     log.info("Generating SAMM output...\n")
 
@@ -240,41 +264,22 @@ def cli(
     if included_signals:
         log.info("Included signals:\n%s\n", included_signals)
 
-    parsed_tree_uri = None
-
-    if vss_helper is not None and ttl_helper is not None:
-        # NOTE: below used parse_vss_tree function will store generated RDF Graph to dedicated TTL file
-        if len(included_signals_input) > 0:
-            # Filter the VSS tree based on included_signals_input
-            vss_helper.filter_vss_tree_for_deletion(vss_tree, included_signals_input)
-
-            # Remove nodes, which were marked as "not selected" i.e. to be deleted
-            vss_tree.delete_nodes(findall(vss_tree, filter_=lambda n: n.get_vss_data().delete))
-
-            if vss_tree:
-                # Parse the filtered tree to AME TTL.
-                parsed_tree_uri = ttl_helper.parse_vss_tree(target_folder, vss_tree, split)
-
-            else:
-                # Parse the whole tree as usual.
-                parsed_tree_uri = ttl_helper.parse_vss_tree(target_folder, vss_tree, split)
+    # NOTE: below used parse_vss_tree function will store generated RDF Graph to dedicated TTL file
+    if included_signals_input:
+        # Filter the VSS tree based on included_signals_input
+        vss_helper.filter_vss_tree_for_deletion(vss_tree, included_signals_input)
 
-        else:
-            # Work with vss_tree as usual.
-            parsed_tree_uri = ttl_helper.parse_vss_tree(target_folder, vss_tree, split)
+        # Remove nodes, which were marked as "not selected" i.e. to be deleted
+        vss_tree.delete_nodes(findall(vss_tree, filter_=lambda n: n.get_vss_data().delete))
 
-        if parsed_tree_uri != "DEPRECATED":
-            log.info(
-                "\nVSS to ESMF - SAMM processing - COMPLETED\n\nAll ttl files are located in: '%s'\n\n", target_folder
-            )
-        else:
-            log.warning(
-                "VSS to ESMF - SAMM processing - COMPLETED\n\n"
-                "VSS tree was not converted because it is DEPRECATED.\n\n"
-            )
+    parsed_tree_uri = ttl_helper.parse_vss_tree(config, target_folder, vss_tree, split, jobs)
 
+    if parsed_tree_uri != "DEPRECATED":
+        log.info("\nVSS to ESMF - SAMM processing - COMPLETED\n\nAll ttl files are located in: '%s'\n\n", target_folder)
     else:
         log.warning(
             "VSS to ESMF - SAMM processing - COMPLETED\n\n"
-            "VSS tree was not converted because required helpers were not initialized.\n\n"
+            "VSS tree was not converted because it is DEPRECATED.\n\n"
         )
+
+    return target_folder
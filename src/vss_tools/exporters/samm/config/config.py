@@ -6,6 +6,14 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from __future__ import annotations
+
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rdflib import URIRef
+
 # General CONFIG variables
 SAMM_TYPE = "samm"
 SAMM_VERSION = "2.1.0"
@@ -13,21 +21,62 @@ SAMM_VERSION = "2.1.0"
 # Used in file_helper.write_graph_to_file to properly escape characters in filedata, before to write it to a file.
 CUSTOM_ESCAPE_CHAR = "#V2E-ESC-CHAR#"
 
-# CONFIG Variable defined at runtime as per user input and in available init function
-OUTPUT_NAMESPACE = None
-VSPEC_VERSION = None
-SPLIT_DEPTH = None
+# Prefix of all SAMM namespaces, see helpers.namespaces
+SAMM_PREFIX = "urn:samm"
+
+
+class Config:
+    """
+    Runtime configuration and state of a single SAMM export, as defined by the user input.
+    A new config is created for every export and passed through the helpers,
+    so that exports can run repeatedly or concurrently in the same interpreter.
+    """
+
+    def __init__(self, output_namespace: str, vspec_version: str, split_depth: int, direct_ttl: bool = False):
+        self.output_namespace = output_namespace
+        self.vspec_version = vspec_version
+
+        # Write the TTLs directly, instead of serializing them with rdflib
+        self.direct_ttl = direct_ttl
+
+        # Make sure that split_depth is in correct type and value, else set it to DEFAULT: 1
+        self.split_depth = split_depth if (type(split_depth) is int and split_depth > 0) else 1
+
+        # Below formatted namespace should look like: urn:samm:com.covesa.vss.spec:5.0.0#
+        # and is used for the ":" bindings of the converted to TTLs, VSS Aspect models
+        # that will refer to the user specified output_namespace
+        self.samm_output_namespace = f"{SAMM_PREFIX}:{output_namespace}:{vspec_version}#"
+
+        # A DICT collection of key => value entries, where:
+        #   :key   - vss_node.name of a node from provided VSSNote (tree) for parsing.
+        #   :value - object of type: { counter: int, vss_paths: [str]}
+        #            where:
+        #                  - counter   - holds number of occurrences of the corresponding :key in the main VSSNode
+        #                  - vss_paths - array of qualified VSS path, for each node which name is matching the :key
+        #
+        # This collection will be populated on the very first call of parse_vss_tree
+        # so to have a full overview of available VSS nodes' names, if there is any duplicated ones etc.
+        # Then it will be used to defined whether the corresponding vss_node should be prefixed with its parent name,
+        # as implemented in the vss_helper.should_use_parent_prefix function.
+        self.unique_node_names: dict[str, Any] = {}
+
+    @property
+    def rdf(self) -> ModuleType:
+        """
+        Module providing the Graph and the RDF terms (URIRef, Literal, RDF, XSD) the aspect models are built with.
+        This is rdflib, or the minimal ttl_graph for direct TTLs, so that rdflib is not imported for those.
+        """
+        if self.direct_ttl:
+            from ..helpers import ttl_graph
+
+            return ttl_graph
 
+        import rdflib
 
-def init(output_namespace: str, vspec_version: str, split_depth: int):
-    # Set user defined or OUTPUT_NAMESPACE
-    global OUTPUT_NAMESPACE
-    OUTPUT_NAMESPACE = output_namespace
+        return rdflib
 
-    # Set user defined or OUTPUT_NAMESPACE
-    global VSPEC_VERSION
-    VSPEC_VERSION = vspec_version
+    def get_vspec_uri(self, node_name: str) -> URIRef:
+        return self.rdf.URIRef(f"{self.samm_output_namespace}{node_name}")
 
-    # Make sure that split_depth is in correct type and value, else set it to DEFAULT: 1
-    global SPLIT_DEPTH
-    SPLIT_DEPTH = split_depth if (type(split_depth) is int and split_depth > 0) else 1
+    def get_node_name_from_vspec_uri(self, node_uri: URIRef) -> str:
+        return node_uri.replace(self.samm_output_namespace, "")
@@ -6,27 +6,27 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from rdflib import XSD
-
 from .namespaces import get_unit_uri
 
+# NOTE: data types are XSD local names and units are unit URIs, as plain strings,
+#       see vss_helper.get_data_type and vss_helper.get_data_unit_uri for their RDF terms
 DataTypes = {
-    "uint8": XSD.unsignedByte,
-    "int8": XSD.byte,
-    "uint16": XSD.unsignedShort,
-    "int16": XSD.short,
-    "uint32": XSD.unsignedInt,
-    "int32": XSD.int,
-    "uint64": XSD.unsignedLong,
-    "int64": XSD.long,
-    "boolean": XSD.boolean,
-    "float": XSD.float,
-    "double": XSD.double,
-    "string": XSD.string,
-    "dateTime": XSD.dateTime,
-    "dateTimeStamp": XSD.dateTimeStamp,
-    "iso8601": XSD.dateTimeStamp,
-    "anyURI": XSD.anyURI,
+    "uint8": "unsignedByte",
+    "int8": "byte",
+    "uint16": "unsignedShort",
+    "int16": "short",
+    "uint32": "unsignedInt",
+    "int32": "int",
+    "uint64": "unsignedLong",
+    "int64": "long",
+    "boolean": "boolean",
+    "float": "float",
+    "double": "double",
+    "string": "string",
+    "dateTime": "dateTime",
+    "dateTimeStamp": "dateTimeStamp",
+    "iso8601": "dateTimeStamp",
+    "anyURI": "anyURI",
 }
 
 DataUnits = {
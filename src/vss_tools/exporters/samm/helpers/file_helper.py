@@ -6,22 +6,25 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rdflib import Graph
 from vss_tools import log
 
 from ..config import config as cfg
 
+if TYPE_CHECKING:
+    from rdflib import Graph
 
-# Write RDF Graph data to specified file
-def write_graph_to_file(path_to_file: Path, file_name: str, graph: Graph):
-    log.debug(
-        "Writing RDF Graph to \n  -- file: '%s' \n  -- location: '%s'\n  -- current working directory: '%s'\n",
-        file_name,
-        path_to_file,
-        Path.cwd(),
-    )  # type: ignore
+
+# Serialize RDF Graph data to the TTL formatted contents of an aspect model file.
+# With direct, the graph is a ttl_graph.Graph, written without rdflib,
+# giving the same RDF graph as below cleaned up rdflib output.
+def serialize_graph(graph: Graph, direct: bool = False) -> str:
+    if direct:
+        return graph.serialize(format="ttl", escape_char=cfg.CUSTOM_ESCAPE_CHAR)
 
     filedata = graph.serialize(format="ttl")
 
@@ -41,6 +44,18 @@ def write_graph_to_file(path_to_file: Path, file_name: str, graph: Graph):
     # Cleanup xsd:anyURI with xsd:double
     filedata = filedata.replace("xsd:anyURI", "xsd:double")
 
+    return filedata
+
+
+# Write serialized RDF Graph data to specified file
+def write_ttl_file(path_to_file: Path, file_name: str, filedata: str) -> Path:
+    log.debug(
+        "Writing RDF Graph to \n  -- file: '%s' \n  -- location: '%s'\n  -- current working directory: '%s'\n",
+        file_name,
+        path_to_file,
+        Path.cwd(),
+    )  # type: ignore
+
     # Make sure that output_folder is created with default permissions
     output_folder: Path = Path(path_to_file)
     output_folder.mkdir(parents=True, exist_ok=True)
@@ -8,12 +8,11 @@
 
 
 from enum import Enum
-
-from rdflib import URIRef
+from types import ModuleType
 
 from ..config import config as cfg
 from . import string_helper as str_helper
-from .namespaces import samm_base_namespace, samm_output_namespace
+from .namespaces import samm_base_namespace
 
 
 class VSSConcepts(Enum):
@@ -33,16 +32,10 @@ class VSSConcepts(Enum):
     VEHICLE_STAT = "StaticVehicleProperty"
 
     def __init__(self, vss_name):
-        self.ns = samm_output_namespace
         self.vsso_name = vss_name
 
-    @property
-    def uri(self):
-        return URIRef(self.uri_string)
-
-    @property
-    def uri_string(self):
-        return f"{self.ns}{self.value}"
+    # NOTE: VSS concepts live in the user specified output namespace,
+    #       use config.Config.get_vspec_uri to get their URI
 
 
 class SammConcepts(Enum):
@@ -67,9 +60,9 @@ class SammConcepts(Enum):
         self.ns = f"{samm_base_namespace}:meta-model:{cfg.SAMM_VERSION}#"
         self.vsso_name = vss_name
 
-    @property
-    def uri(self):
-        return URIRef(self.uri_string)
+    def uri(self, rdf: ModuleType):
+        # rdf is config.Config.rdf, the module to create the URIRef with
+        return rdf.URIRef(self.uri_string)
 
     @property
     def uri_string(self):
@@ -105,9 +98,9 @@ class SammCConcepts(Enum):
         self.ns = f"{samm_base_namespace}:characteristic:{cfg.SAMM_VERSION}#"
         self.vsso_name = vss_name
 
-    @property
-    def uri(self):
-        return URIRef(self.uri_string)
+    def uri(self, rdf: ModuleType):
+        # rdf is config.Config.rdf, the module to create the URIRef with
+        return rdf.URIRef(self.uri_string)
 
     @property
     def uri_string(self):
@@ -6,19 +6,23 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from typing import Sequence
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
 
-from rdflib import Graph, Literal, URIRef
-from rdflib.namespace import RDF, XSD
 from vss_tools import log
 from vss_tools.tree import VSSNode
 
+from ..config.config import Config
 from . import vss_helper as vss_helper
 from .data_types_and_units import DataTypes
-from .namespaces import Namespaces, get_node_name_from_vspec_uri, get_vspec_uri
+from .namespaces import Namespaces
 from .samm_concepts import SammCConcepts, SammConcepts, VSSConcepts
 from .string_helper import str_camel_case_split, str_to_lc_first_camel_case, str_to_uc_first_camel_case
 
+if TYPE_CHECKING:
+    from rdflib import Graph, Literal, URIRef
+
 #
 # Builder helper, which provides a set of functions, to set up a TTL Graph,
 # build various graph nodes like property, characteristic, entity etc. and add them to this graph,
@@ -65,32 +69,36 @@ def __add_node_tuple(graph: Graph, subject_uri: URIRef, predicate_uri: URIRef, o
 
 
 # Initialize an empty RDF Graph with related bindings and ESMF - AME namespaces
-def setup_graph():
+def setup_graph(config: Config):
+    rdf = config.rdf
+
     # Create a Graph
-    graph = Graph()
+    graph = rdf.Graph()
 
     # Bind the namespaces to a prefix for more readable output
-    graph.bind(VSSConcepts.EMPTY.value, VSSConcepts.EMPTY.uri)
-    graph.bind("xsd", XSD)
+    graph.bind(VSSConcepts.EMPTY.value, config.get_vspec_uri(VSSConcepts.EMPTY.value))
+    graph.bind("xsd", rdf.XSD)
 
     for nsKey in Namespaces:
-        graph.bind(nsKey, URIRef(Namespaces[nsKey]))
+        graph.bind(nsKey, rdf.URIRef(Namespaces[nsKey]))
 
     return graph
 
 
 # Build an RDF Tree Node as property for the provided vss_node and add it to the specified graph.
-def add_graph_node(graph: Graph, vss_node: VSSNode, is_aspect: bool) -> URIRef:
-    node_property_name = vss_helper.get_node_property_name(vss_node)
-    node_uri = get_vspec_uri(node_property_name)
+def add_graph_node(config: Config, graph: Graph, vss_node: VSSNode, is_aspect: bool) -> URIRef:
+    rdf = config.rdf
+
+    node_property_name = vss_helper.get_node_property_name(config, vss_node)
+    node_uri = config.get_vspec_uri(node_property_name)
 
     # Initialize the Property node - tuple
-    if __add_node_tuple(graph, node_uri, RDF.type, SammConcepts.PROPERTY.uri) is False:
+    if __add_node_tuple(graph, node_uri, rdf.RDF.type, SammConcepts.PROPERTY.uri(rdf)) is False:
         # Node was already created, just return its URI
         return node_uri
 
     if is_aspect:
-        add_node_aspect(graph, vss_node, node_uri)
+        add_node_aspect(config, graph, vss_node, node_uri)
     # ELSE: just build a simple property node as usual
 
     # Preferred name should be white space in front of each upper case letter
@@ -99,7 +107,10 @@ def add_graph_node(graph: Graph, vss_node: VSSNode, is_aspect: bool) -> URIRef:
     #     node.name     : IsStrongCrossWindDetected
     #     should be like: Is Strong Cross Wind Detected
     __add_node_tuple(
-        graph, node_uri, SammConcepts.PREFERRED_NAME.uri, Literal(str_camel_case_split(vss_node.ttl_name), "en")
+        graph,
+        node_uri,
+        SammConcepts.PREFERRED_NAME.uri(rdf),
+        rdf.Literal(str_camel_case_split(vss_node.ttl_name), "en"),
     )
 
     log.debug("Created graph node with URI: '%s'.\n", node_uri)
@@ -107,63 +118,75 @@ def add_graph_node(graph: Graph, vss_node: VSSNode, is_aspect: bool) -> URIRef:
     return node_uri
 
 
-def add_node_aspect(graph: Graph, vss_node: VSSNode, node_uri: URIRef):
+def add_node_aspect(config: Config, graph: Graph, vss_node: VSSNode, node_uri: URIRef):
+    rdf = config.rdf
+
     # Initialize Aspect for current Graph.
     log.debug("Add aspect node for node uri:\t  -- '%s'.", node_uri)
 
     # NOTE: there can be only 1 Aspect per graph. For Aspect nodes, vss_node.ttl_name is same as vss_node.name
     # Aspect Name must be UC FIRST CAMEL CASE
-    aspect_node_uri = get_vspec_uri(str_to_uc_first_camel_case(vss_node.ttl_name))
+    aspect_node_uri = config.get_vspec_uri(str_to_uc_first_camel_case(vss_node.ttl_name))
 
-    if __add_node_tuple(graph, aspect_node_uri, RDF.type, SammConcepts.ASPECT.uri) is True:
+    if __add_node_tuple(graph, aspect_node_uri, rdf.RDF.type, SammConcepts.ASPECT.uri(rdf)) is True:
         # Aspect added => complete its creation
         __add_node_tuple(
-            graph, aspect_node_uri, SammConcepts.PREFERRED_NAME.uri, Literal(str_camel_case_split(vss_node.name), "en")
+            graph,
+            aspect_node_uri,
+            SammConcepts.PREFERRED_NAME.uri(rdf),
+            rdf.Literal(str_camel_case_split(vss_node.name), "en"),
         )
 
         # Add the property instance of this Tree node to its Aspect
         __add_node_tuple(
             graph,
             aspect_node_uri,
-            SammConcepts.PROPERTIES.uri,
-            Literal(f"( {get_property_uri_from_node_uri(node_uri)} )"),
+            SammConcepts.PROPERTIES.uri(rdf),
+            rdf.Literal(f"( {get_property_uri_from_node_uri(config, node_uri)} )"),
         )
 
         # Add placeholders for Aspect operations and events
-        __add_node_tuple(graph, aspect_node_uri, SammConcepts.OPERATIONS.uri, Literal("()"))
-        __add_node_tuple(graph, aspect_node_uri, SammConcepts.EVENTS.uri, Literal("()"))
+        __add_node_tuple(graph, aspect_node_uri, SammConcepts.OPERATIONS.uri(rdf), rdf.Literal("()"))
+        __add_node_tuple(graph, aspect_node_uri, SammConcepts.EVENTS.uri(rdf), rdf.Literal("()"))
 
     # ELSE: do nothing since aspect node has already been created
 
 
-def add_node_branch_characteristic(graph: Graph, vss_node: VSSNode, node_uri: URIRef):
+def add_node_branch_characteristic(config: Config, graph: Graph, vss_node: VSSNode, node_uri: URIRef):
+    rdf = config.rdf
+
     # NOTE: constraints are usually on a leaf node
     #       and will result in Node having a Trait with BaseCharacteristic and Constraint nodes.
-    node_char_name = get_node_characteristic_name(node_uri, vss_helper.has_constraints(vss_node))
-    node_char_uri = get_vspec_uri(node_char_name)
+    node_char_name = get_node_characteristic_name(config, node_uri, vss_helper.has_constraints(vss_node))
+    node_char_uri = config.get_vspec_uri(node_char_name)
 
     log.debug("Add branch characteristic: '%s' for VSSNode: '%s'.", node_char_name, vss_node.name)
 
-    if __add_node_tuple(graph, node_char_uri, RDF.type, SammConcepts.CHARACTERISTIC.uri) is False:
+    if __add_node_tuple(graph, node_char_uri, rdf.RDF.type, SammConcepts.CHARACTERISTIC.uri(rdf)) is False:
         # Characteristic was already added => just return its URI
         return node_char_uri
 
     # ELSE: complete creation of node characteristic
 
-    __add_node_tuple(graph, node_char_uri, SammConcepts.NAME.uri, Literal(node_char_name))
+    __add_node_tuple(graph, node_char_uri, SammConcepts.NAME.uri(rdf), rdf.Literal(node_char_name))
 
     # Add description to this node's characteristic
     # NOTE: Keep description under this vss_node's branch - node_char_uri,
     #       because if there is any instances,
     #       each of its instance(s) will point to node_char_uri
     __add_node_tuple(
-        graph, node_char_uri, SammConcepts.DESCRIPTION.uri, Literal(vss_helper.get_node_description(vss_node), "en")
+        graph,
+        node_char_uri,
+        SammConcepts.DESCRIPTION.uri(rdf),
+        rdf.Literal(vss_helper.get_node_description(vss_node), "en"),
     )
 
     return node_char_uri
 
 
-def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
+def add_node_leaf(config: Config, graph: Graph, node_uri: URIRef, vss_node: VSSNode):
+    rdf = config.rdf
+
     log.debug(
         "Add node for VSS Node: '%s'\n  -- of type: '%s'\n  -- with path: '%s'",
         vss_node.name,
@@ -173,24 +196,27 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
 
     has_limits = vss_helper.has_constraints(vss_node)
 
-    node_char_name = get_node_characteristic_name(node_uri, has_limits)
-    node_char_uri = get_vspec_uri(node_char_name)
+    node_char_name = get_node_characteristic_name(config, node_uri, has_limits)
+    node_char_uri = config.get_vspec_uri(node_char_name)
 
     # Bind current vss_node to its characteristic
-    if __add_node_tuple(graph, node_uri, SammConcepts.CHARACTERISTIC_RELATION.uri, node_char_uri) is True:
+    if __add_node_tuple(graph, node_uri, SammConcepts.CHARACTERISTIC_RELATION.uri(rdf), node_char_uri) is True:
         # Complete creation of leaf node
         if has_limits:
-            node_char_uri = add_node_leaf_constraint(graph, node_char_name, node_char_uri, vss_node)
+            node_char_uri = add_node_leaf_constraint(config, graph, node_char_name, node_char_uri, vss_node)
 
         # Add description to this node's characteristic
         # NOTE: this could be the general characteristic or trait, in case if vss_node has limits
         __add_node_tuple(
-            graph, node_char_uri, SammConcepts.DESCRIPTION.uri, Literal(vss_helper.get_node_description(vss_node), "en")
+            graph,
+            node_char_uri,
+            SammConcepts.DESCRIPTION.uri(rdf),
+            rdf.Literal(vss_helper.get_node_description(vss_node), "en"),
         )
 
         # Get RDF and Data types for specified node_characteristic_uri from its related vss_node
         rdf_type = vss_helper.get_node_rdf_type(vss_node)
-        data_type = vss_helper.get_data_type(vss_node)
+        data_type = vss_helper.get_data_type(config, vss_node)
 
         match rdf_type:
             case SammCConcepts.ENUM | SammCConcepts.STATE:
@@ -201,24 +227,24 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
                     __add_node_tuple(
                         graph,
                         node_char_uri,
-                        SammCConcepts.DEFAULT_VALUE.uri,
-                        Literal(vss_node.data.default, datatype=data_type),  # type: ignore
+                        SammCConcepts.DEFAULT_VALUE.uri(rdf),
+                        rdf.Literal(vss_node.data.default, datatype=data_type),  # type: ignore
                     )
 
                 # Read values for this vss_node's characteristic
                 enum_values = None
                 if hasattr(vss_node.data, "allowed") and vss_node.data.allowed and type(vss_node.data.allowed) is list:
                     # Add allowed values to this node characteristic
-                    enum_values = get_enum_values(vss_node.data.allowed)
+                    enum_values = get_enum_values(config, vss_node.data.allowed)
                 elif hasattr(vss_node.data, "enum") and vss_node.data.enum:
                     # NOTE: From VSS 3.0 the 'enum' attribute has been renamed to `allowed`
                     #       However, we will keep this for backwards compatibility.
 
                     # Add ENUM values, as usual, to this node characteristic
-                    enum_values = get_enum_values(vss_node.data.enum)  # type: ignore
+                    enum_values = get_enum_values(config, vss_node.data.enum)  # type: ignore
 
                 if enum_values is not None:
-                    __add_node_tuple(graph, node_char_uri, SammCConcepts.VALUES.uri, enum_values)
+                    __add_node_tuple(graph, node_char_uri, SammCConcepts.VALUES.uri(rdf), enum_values)
 
             case SammCConcepts.LIST:
                 # Handle LIST type nodes
@@ -232,7 +258,10 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
 
                 if hasattr(vss_node.data, "unit") and vss_node.data.unit:
                     __add_node_tuple(
-                        graph, node_char_uri, SammCConcepts.UNIT.uri, vss_helper.get_data_unit_uri(vss_node.data.unit)
+                        graph,
+                        node_char_uri,
+                        SammCConcepts.UNIT.uri(rdf),
+                        vss_helper.get_data_unit_uri(config, vss_node.data.unit),
                     )
 
                 else:
@@ -249,8 +278,8 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
                     __add_node_tuple(
                         graph,
                         node_uri,
-                        SammConcepts.EXAMPLE_VALUE.uri,
-                        Literal(vss_node.data.default, datatype=data_type),
+                        SammConcepts.EXAMPLE_VALUE.uri(rdf),
+                        rdf.Literal(vss_node.data.default, datatype=data_type),
                     )
 
             case SammConcepts.CHARACTERISTIC:
@@ -262,7 +291,7 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
                         hasattr(vss_node.data, "unit")
                         and vss_node.data.unit
                         and vss_node.data.unit == "iso8601"
-                        and data_type == DataTypes[vss_node.data.unit]
+                        and data_type == rdf.XSD[DataTypes[vss_node.data.unit]]
                     ):
                         # Handle date-time based nodes
                         log.debug(" -- set node DATE-TIME values")
@@ -282,8 +311,8 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
                             __add_node_tuple(
                                 graph,
                                 node_uri,
-                                SammConcepts.EXAMPLE_VALUE.uri,
-                                Literal(vss_node.data.default, datatype=data_type),
+                                SammConcepts.EXAMPLE_VALUE.uri(rdf),
+                                rdf.Literal(vss_node.data.default, datatype=data_type),
                             )
                         else:
                             log.warning(
@@ -303,8 +332,8 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
                         __add_node_tuple(
                             graph,
                             node_uri,
-                            SammConcepts.EXAMPLE_VALUE.uri,
-                            Literal(vss_node.data.default, datatype=data_type),  # type: ignore
+                            SammConcepts.EXAMPLE_VALUE.uri(rdf),
+                            rdf.Literal(vss_node.data.default, datatype=data_type),  # type: ignore
                         )
 
             case _:
@@ -316,68 +345,72 @@ def add_node_leaf(graph: Graph, node_uri: URIRef, vss_node: VSSNode):
                 )
 
         # Set RDF.type for current leaf node characteristic
-        __add_node_tuple(graph, node_char_uri, RDF.type, rdf_type.uri)
+        __add_node_tuple(graph, node_char_uri, rdf.RDF.type, rdf_type.uri(rdf))
 
         # Set data_type for current vss_node's characteristic
-        __add_node_tuple(graph, node_char_uri, SammConcepts.DATA_TYPE.uri, data_type)
+        __add_node_tuple(graph, node_char_uri, SammConcepts.DATA_TYPE.uri(rdf), data_type)
 
     # ELSE: do nothing since leaf node has already been created
 
 
-def add_node_leaf_constraint(graph: Graph, node_char_name: str, node_char_uri: URIRef, vss_node: VSSNode):
+def add_node_leaf_constraint(
+    config: Config, graph: Graph, node_char_name: str, node_char_uri: URIRef, vss_node: VSSNode
+):
+    rdf = config.rdf
+
     log.debug("Add leaf-node constraint")
 
     constraint_name = str_to_uc_first_camel_case(vss_node.ttl_name + "Constraint")
-    constraint_node_uri = get_vspec_uri(constraint_name)
+    constraint_node_uri = config.get_vspec_uri(constraint_name)
 
     # Default Constraint URI is for Range (min/max) constraints
-    constraint_uri = SammCConcepts.RANGE_CONSTRAINT.uri
+    constraint_uri = SammCConcepts.RANGE_CONSTRAINT.uri(rdf)
 
     if hasattr(vss_node.data, "pattern") and vss_node.data.pattern is not None:
         # Pattern property is used for Regular Expression constraints of STRING based data nodes
-        constraint_uri = SammCConcepts.REG_EXP_CONSTRAINT.uri
+        constraint_uri = SammCConcepts.REG_EXP_CONSTRAINT.uri(rdf)
 
-    __add_node_tuple(graph, constraint_node_uri, RDF.type, constraint_uri)
-    __add_node_tuple(graph, constraint_node_uri, SammConcepts.NAME.uri, Literal(constraint_name))
+    __add_node_tuple(graph, constraint_node_uri, rdf.RDF.type, constraint_uri)
+    __add_node_tuple(graph, constraint_node_uri, SammConcepts.NAME.uri(rdf), rdf.Literal(constraint_name))
 
     # Workaround since doubles are serialized as scientific numbers
-    data_type = vss_helper.get_data_type(vss_node)
-    if data_type == XSD.double:
-        data_type = XSD.anyURI
+    data_type = vss_helper.get_data_type(config, vss_node)
+    if data_type == rdf.XSD.double:
+        data_type = rdf.XSD.anyURI
 
     if vss_node.data.max is not None:  # type: ignore
         __add_node_tuple(
             graph,
             constraint_node_uri,
-            SammCConcepts.MAX_VALUE.uri,
-            Literal(vss_node.data.max, datatype=data_type),  # type: ignore
+            SammCConcepts.MAX_VALUE.uri(rdf),
+            rdf.Literal(vss_node.data.max, datatype=data_type),  # type: ignore
         )
 
     if vss_node.data.min is not None:  # type: ignore
         __add_node_tuple(
             graph,
             constraint_node_uri,
-            SammCConcepts.MIN_VALUE.uri,
-            Literal(vss_node.data.min, datatype=data_type),  # type: ignore
+            SammCConcepts.MIN_VALUE.uri(rdf),
+            rdf.Literal(vss_node.data.min, datatype=data_type),  # type: ignore
         )
 
     if vss_node.data.pattern is not None:  # type: ignore
         __add_node_tuple(
             graph,
             constraint_node_uri,
-            SammConcepts.VALUE.uri,
-            Literal(vss_node.data.pattern, datatype=data_type),  # type: ignore
+            SammConcepts.VALUE.uri(rdf),
+            rdf.Literal(vss_node.data.pattern, datatype=data_type),  # type: ignore
         )
 
         # Set the RegExp value for constraint_node_uri
 
     base_c_name = str_to_uc_first_camel_case(vss_node.ttl_name + "BaseCharacteristic")
-    base_c_uri = get_vspec_uri(base_c_name)
+    base_c_uri = config.get_vspec_uri(base_c_name)
 
-    __add_node_tuple(graph, node_char_uri, SammCConcepts.BASE_CHARACTERISTICS.uri, base_c_uri)
-    __add_node_tuple(graph, node_char_uri, RDF.type, SammCConcepts.TRAIT.uri)
-    __add_node_tuple(graph, node_char_uri, SammConcepts.NAME.uri, Literal(node_char_name))
-    __add_node_tuple(graph, node_char_uri, SammCConcepts.CONSTRAINT.uri, constraint_node_uri)
+    __add_node_tuple(graph, node_char_uri, SammCConcepts.BASE_CHARACTERISTICS.uri(rdf), base_c_uri)
+    __add_node_tuple(graph, node_char_uri, rdf.RDF.type, SammCConcepts.TRAIT.uri(rdf))
+    __add_node_tuple(graph, node_char_uri, SammConcepts.NAME.uri(rdf), rdf.Literal(node_char_name))
+    __add_node_tuple(graph, node_char_uri, SammCConcepts.CONSTRAINT.uri(rdf), constraint_node_uri)
 
     return base_c_uri
 
@@ -390,7 +423,9 @@ def add_node_leaf_constraint(graph: Graph, node_char_name: str, node_char_uri: U
 # where:
 #   - URIRef - is the URIRef of the property node to be added to specified vss_node_uri
 #   - other, OPTIONAL, tuples are for property attributes: optional and payloadName
-def add_node_properties(vss_nodes_uris: Sequence[URIRef | tuple], graph: Graph, vss_node_uri: URIRef):
+def add_node_properties(config: Config, vss_nodes_uris: Sequence[URIRef | tuple], graph: Graph, vss_node_uri: URIRef):
+    rdf = config.rdf
+
     log.debug("Prepare properties from vss nodes URIs:\n%s\n", vss_nodes_uris)
 
     node_props = ""
@@ -410,8 +445,8 @@ def add_node_properties(vss_nodes_uris: Sequence[URIRef | tuple], graph: Graph,
                 payload_name = ""
 
                 for entry in node_uri:
-                    if type(entry) is URIRef:
-                        property_name = get_property_uri_from_node_uri(entry)
+                    if type(entry) is rdf.URIRef:
+                        property_name = get_property_uri_from_node_uri(config, entry)
 
                     elif type(entry) is tuple:
                         if entry[0] == "optional":
@@ -450,8 +485,8 @@ def add_node_properties(vss_nodes_uris: Sequence[URIRef | tuple], graph: Graph,
 
                     node_props += property_prefix + property
 
-            elif type(node_uri) is URIRef:
-                node_props += property_prefix + get_property_uri_from_node_uri(node_uri)
+            elif type(node_uri) is rdf.URIRef:
+                node_props += property_prefix + get_property_uri_from_node_uri(config, node_uri)  # type: ignore
 
             else:
                 log.warning("Not supported type: '%s' for Node URI: '%s'.", type(node_uri), node_uri)
@@ -462,17 +497,17 @@ def add_node_properties(vss_nodes_uris: Sequence[URIRef | tuple], graph: Graph,
     log.debug("Add properties URIs to vss node URI: '%s'\n  -- properties:\n%s\n", vss_node_uri, node_props)
 
     # Add properties to the specified vss_node_uri
-    __add_node_tuple(graph, vss_node_uri, SammConcepts.PROPERTIES.uri, Literal(node_props))
+    __add_node_tuple(graph, vss_node_uri, SammConcepts.PROPERTIES.uri(rdf), rdf.Literal(node_props))
 
 
-def get_property_uri_from_node_uri(vss_node_uri: URIRef):
-    return f":{str_to_lc_first_camel_case(vss_node_uri.replace(VSSConcepts.EMPTY.uri, ''))}"
+def get_property_uri_from_node_uri(config: Config, vss_node_uri: URIRef):
+    return f":{str_to_lc_first_camel_case(config.get_node_name_from_vspec_uri(vss_node_uri))}"
 
 
-def get_node_characteristic_name(node_uri: URIRef, has_limits: bool):
+def get_node_characteristic_name(config: Config, node_uri: URIRef, has_limits: bool):
     # Node characteristic name is based on the node property URI, and should be in the form:
     # NodePropertyNameCharacteristic or NodePropertyNameTrait, in case if the node has some constraints
-    node_name = get_node_name_from_vspec_uri(node_uri)
+    node_name = config.get_node_name_from_vspec_uri(node_uri)
     characteristic_name_suffix = "Trait" if has_limits else "Characteristic"
 
     return str_to_uc_first_camel_case(node_name + characteristic_name_suffix)
@@ -487,7 +522,7 @@ def get_node_characteristic_name(node_uri: URIRef, has_limits: bool):
 #            We might need to further refactor the VssNote.allowed field so it has the correct type: list[str]
 #
 #            For the moment, we define the collection_to_process as: list[str] | str, so to pass the mypy check.
-def get_enum_values(collection_to_process: list[str] | str):
+def get_enum_values(config: Config, collection_to_process: list[str] | str):
     enum_values = ""
 
     for value in collection_to_process:
@@ -496,10 +531,10 @@ def get_enum_values(collection_to_process: list[str] | str):
         else:
             enum_values += value + " "
 
-    return Literal(f"( {enum_values.strip()} )")
+    return config.rdf.Literal(f"( {enum_values.strip()} )")
 
 
-def add_node_instances(graph: Graph, instances_dict_tree: dict, node_char_uri: URIRef):
+def add_node_instances(config: Config, graph: Graph, instances_dict_tree: dict, node_char_uri: URIRef):
     instance_char_uri = None
 
     if instances_dict_tree:
@@ -507,7 +542,9 @@ def add_node_instances(graph: Graph, instances_dict_tree: dict, node_char_uri: U
 
         # Build Node Instance as characteristic which then will be added to the corresponding node_uri
         node_instance_name = str_to_uc_first_camel_case(instances_dict_tree["name"] + "Instance")
-        instance_char_uri, instance_entity_uri = add_node_instance_characteristic_with_entity(graph, node_instance_name)
+        instance_char_uri, instance_entity_uri = add_node_instance_characteristic_with_entity(
+            config, graph, node_instance_name
+        )
 
         instance_entity_properties = []
         skip_siblings_child_nodes = False
@@ -542,18 +579,22 @@ def add_node_instances(graph: Graph, instances_dict_tree: dict, node_char_uri: U
                     # Instance Type should be prefixed by its parent name to make it more unique, similar to ttl_name
                     ni_type_name = "{}{}".format(instance["parent"]["name"], instance["instance_type"])
                     type_char_name = str_to_uc_first_camel_case(ni_type_name)
-                    type_char_uri, type_entity_uri = add_node_instance_characteristic_with_entity(graph, type_char_name)
+                    type_char_uri, type_entity_uri = add_node_instance_characteristic_with_entity(
+                        config, graph, type_char_name
+                    )
 
                     # In this case, the created type_entity will represent a common node for each instance of that type.
                     # Idea is that we can share common type node like characteristic for instances of the same type.
                     ni_entity_uri = type_entity_uri
 
-                    ni_prop_uri = add_node_instance_property(graph, ni_path_name, type_char_uri)
+                    ni_prop_uri = add_node_instance_property(config, graph, ni_path_name, type_char_uri)
 
                 else:
                     # If the current instance does not have instance_type, just build it as usual
-                    ni_char_uri, ni_entity_uri = add_node_instance_characteristic_with_entity(graph, ni_char_name)
-                    ni_prop_uri = add_node_instance_property(graph, ni_path_name, ni_char_uri)
+                    ni_char_uri, ni_entity_uri = add_node_instance_characteristic_with_entity(
+                        config, graph, ni_char_name
+                    )
+                    ni_prop_uri = add_node_instance_property(config, graph, ni_path_name, ni_char_uri)
 
                     # Make sure to turn of skip_siblings_child_nodes,
                     # to handle properly children of the current instance
@@ -566,7 +607,7 @@ def add_node_instances(graph: Graph, instances_dict_tree: dict, node_char_uri: U
                 if not skip_siblings_child_nodes:
                     # Build instance - entity properties (children) nodes of current instance
                     add_instance_entity_properties(
-                        graph, instance["children"], ni_type_name, node_char_uri, ni_entity_uri
+                        config, graph, instance["children"], ni_type_name, node_char_uri, ni_entity_uri
                     )
 
                     if ni_type_name:
@@ -580,70 +621,82 @@ def add_node_instances(graph: Graph, instances_dict_tree: dict, node_char_uri: U
                 log.debug("Build instance path: '%s' as leaf node.", instance["path"])
 
                 leaf_path_name = instance["path"].replace(".", "")
-                leaf_uri = add_node_instance_property(graph, leaf_path_name, node_char_uri)
+                leaf_uri = add_node_instance_property(config, graph, leaf_path_name, node_char_uri)
 
                 instance_entity_properties.append((leaf_uri, ("optional", True), ("payloadName", instance["name"])))
 
             else:
                 log.warning("Instance: '%s' with type: '%s' cannot be processed yet.\n", instance, type(instance))
 
-        add_node_properties(instance_entity_properties, graph, instance_entity_uri)
+        add_node_properties(config, instance_entity_properties, graph, instance_entity_uri)
 
     return instance_char_uri
 
 
 # Helper function to support handling of creation of instance nodes for a VSSNode
-def add_node_instance_characteristic_with_entity(graph: Graph, node_name: str):
+def add_node_instance_characteristic_with_entity(config: Config, graph: Graph, node_name: str):
+    rdf = config.rdf
+
     # NOTE: Node instance characteristic should be of type:
     #       SammCConcepts.SINGLE_ENTITY instead of SammConcepts.CHARACTERISTIC
 
     # Append the characteristic class (type) to its name uri
-    node_char_uri = get_vspec_uri("{}{}".format(node_name, SammCConcepts.SINGLE_ENTITY.vsso_name))
+    node_char_uri = config.get_vspec_uri("{}{}".format(node_name, SammCConcepts.SINGLE_ENTITY.vsso_name))
 
     node_entity_name = str_to_uc_first_camel_case(node_name + "Entity")
-    node_entity_uri = get_vspec_uri(node_entity_name)
+    node_entity_uri = config.get_vspec_uri(node_entity_name)
 
-    if __add_node_tuple(graph, node_char_uri, RDF.type, SammCConcepts.SINGLE_ENTITY.uri) is False:
+    if __add_node_tuple(graph, node_char_uri, rdf.RDF.type, SammCConcepts.SINGLE_ENTITY.uri(rdf)) is False:
         # This characteristic is already present, just return its URI and
         return node_char_uri, node_entity_uri
 
     # ELSE: continue with node creation as usual
 
-    __add_node_tuple(graph, node_char_uri, SammConcepts.NAME.uri, Literal(node_name))
+    __add_node_tuple(graph, node_char_uri, SammConcepts.NAME.uri(rdf), rdf.Literal(node_name))
     __add_node_tuple(
-        graph, node_char_uri, SammConcepts.PREFERRED_NAME.uri, Literal(str_camel_case_split(node_name), "en")
+        graph, node_char_uri, SammConcepts.PREFERRED_NAME.uri(rdf), rdf.Literal(str_camel_case_split(node_name), "en")
     )
 
     # Add the node entity to the graph
-    __add_node_tuple(graph, node_entity_uri, RDF.type, SammConcepts.ENTITY.uri)
+    __add_node_tuple(graph, node_entity_uri, rdf.RDF.type, SammConcepts.ENTITY.uri(rdf))
 
     # Add the node entity to its characteristic as data type
-    __add_node_tuple(graph, node_char_uri, SammConcepts.DATA_TYPE.uri, node_entity_uri)
+    __add_node_tuple(graph, node_char_uri, SammConcepts.DATA_TYPE.uri(rdf), node_entity_uri)
 
     return node_char_uri, node_entity_uri
 
 
-def add_node_instance_property(graph: Graph, instance_name: str, instance_char_uri: URIRef):
+def add_node_instance_property(config: Config, graph: Graph, instance_name: str, instance_char_uri: URIRef):
+    rdf = config.rdf
+
     property_name = str_to_lc_first_camel_case(instance_name)
-    property_uri = get_vspec_uri(property_name)
+    property_uri = config.get_vspec_uri(property_name)
 
-    if __add_node_tuple(graph, property_uri, RDF.type, SammConcepts.PROPERTY.uri) is False:
+    if __add_node_tuple(graph, property_uri, rdf.RDF.type, SammConcepts.PROPERTY.uri(rdf)) is False:
         log.warning("Return: '%s'.\n", property_uri)
 
         return property_uri
 
     __add_node_tuple(
-        graph, property_uri, SammConcepts.PREFERRED_NAME.uri, Literal(str_camel_case_split(instance_name), "en")
+        graph,
+        property_uri,
+        SammConcepts.PREFERRED_NAME.uri(rdf),
+        rdf.Literal(str_camel_case_split(instance_name), "en"),
     )
 
     # Bind this instance node to the provided instance_char_uri
-    __add_node_tuple(graph, property_uri, SammConcepts.CHARACTERISTIC_RELATION.uri, instance_char_uri)
+    __add_node_tuple(graph, property_uri, SammConcepts.CHARACTERISTIC_RELATION.uri(rdf), instance_char_uri)
 
     return property_uri
 
 
 def add_instance_entity_properties(
-    graph: Graph, instance_children: list[dict], instance_type: str, characteristic_uri: URIRef, entity_uri: URIRef
+    config: Config,
+    graph: Graph,
+    instance_children: list[dict],
+    instance_type: str,
+    characteristic_uri: URIRef,
+    entity_uri: URIRef,
 ):
     if instance_children and len(instance_children) > 0:
         entity_properties = []
@@ -660,11 +713,11 @@ def add_instance_entity_properties(
             # Add node instance as property node with characteristic of its main - parent VSSNode
             # NOTE: at this point each instance property node will be linked to the VSS defined node (characteristic)
             # FOR EXAMPLE: Door.Row1.DriverSide instance will have a DoorCharacteristic node as defined in VSS.
-            child_uri = add_node_instance_property(graph, child_path_name, characteristic_uri)
+            child_uri = add_node_instance_property(config, graph, child_path_name, characteristic_uri)
 
             # Instance child properties should be optional and with payloadName without its parent prefix.
             # For more details check function: add_node_properties
             entity_properties.append((child_uri, ("optional", True), ("payloadName", child_instance["name"])))
 
         # Add child properties nodes to this instance's entity node
-        add_node_properties(entity_properties, graph, entity_uri)
+        add_node_properties(config, entity_properties, graph, entity_uri)
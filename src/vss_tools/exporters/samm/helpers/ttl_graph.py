@@ -0,0 +1,193 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import math
+import re
+from typing import Any, Iterator
+
+#
+# Minimal RDF terms and graph, with the same interface as the used parts of rdflib.
+# Used instead of rdflib (see config.Config.rdf) to write the aspect models as Turtle directly,
+# without importing rdflib at all.
+#
+
+
+class URIRef(str):
+    pass
+
+
+class Literal:
+    __slots__ = ("value", "lang", "datatype", "lexical")
+
+    def __init__(self, value: Any, lang: str | None = None, datatype: URIRef | None = None):
+        self.value = value
+        self.lang = lang
+        self.datatype = datatype
+        # Same lexical form as rdflib gives to python values
+        self.lexical = ("true" if value else "false") if type(value) is bool else str(value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Literal) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"Literal({self.lexical!r}, lang={self.lang!r}, datatype={self.datatype!r})"
+
+    @property
+    def key(self) -> tuple[str, str | None, URIRef | None]:
+        return self.lexical, self.lang, self.datatype
+
+
+class Namespace:
+    def __init__(self, uri: str):
+        self.uri = uri
+
+    def __getattr__(self, name: str) -> URIRef:
+        return URIRef(self.uri + name)
+
+    def __getitem__(self, name: str) -> URIRef:
+        return URIRef(self.uri + name)
+
+    def __str__(self) -> str:
+        return self.uri
+
+
+RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
+XSD = Namespace("http://www.w3.org/2001/XMLSchema#")
+
+Node = URIRef | Literal
+Triple = tuple[URIRef, URIRef, Node]
+
+# Local part of a prefixed name, which does not need any escaping
+LOCAL_NAME = re.compile(r"[A-Za-z0-9_]([A-Za-z0-9_-]*)$|$")
+
+
+class Graph:
+    """
+    Insertion ordered set of triples with namespace bindings
+    """
+
+    def __init__(self) -> None:
+        self.namespaces: dict[str, str] = {}
+        self.triples: dict[Triple, None] = {}
+
+    def bind(self, prefix: str, namespace: str) -> None:
+        self.namespaces[prefix] = str(namespace)
+
+    def add(self, triple: Triple) -> None:
+        self.triples[triple] = None
+
+    def __contains__(self, triple: Triple) -> bool:
+        return triple in self.triples
+
+    def __len__(self) -> int:
+        return len(self.triples)
+
+    def __iter__(self) -> Iterator[Triple]:
+        return iter(self.triples)
+
+    def serialize(self, format: str = "ttl", escape_char: str = "") -> str:
+        if format not in ("ttl", "turtle"):
+            raise ValueError(f"Unsupported serialization format: '{format}', only Turtle is supported")
+
+        return TurtleWriter(self, escape_char).serialize()
+
+
+class TurtleWriter:
+    """
+    Writes a Graph as Turtle, giving the same RDF graph as the rdflib serialization
+    with the cleanups of file_helper.serialize_graph:
+      - literals in the form '( ... )' are written as they are, i.e. as Turtle collections
+      - backslashes and the custom escape_char (used to escape quotes) are dropped
+      - xsd:anyURI is replaced by xsd:double
+    """
+
+    def __init__(self, graph: Graph, escape_char: str = ""):
+        self.graph = graph
+        self.escape_char = escape_char
+        # Longest namespaces first, so that the most specific prefix is used
+        self.namespaces = sorted(graph.namespaces.items(), key=lambda item: len(item[1]), reverse=True)
+
+    def serialize(self) -> str:
+        subjects: dict[URIRef, dict[URIRef, list[Node]]] = {}
+        for subject, predicate, obj in self.graph:
+            subjects.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+
+        lines = [f"@prefix {prefix}: <{namespace}> ." for prefix, namespace in self.graph.namespaces.items()]
+        lines.append("")
+
+        rdf_type = RDF.type
+        for subject, predicates in subjects.items():
+            # rdf:type first, as 'a'
+            ordered = sorted(predicates.items(), key=lambda item: item[0] != rdf_type)
+            entries = []
+            for predicate, objects in ordered:
+                name = "a" if predicate == rdf_type else self.uri(predicate)
+                entries.append(f"{name} {', '.join(self.node(obj) for obj in objects)}")
+            lines.append(f"{self.uri(subject)} " + " ;\n    ".join(entries) + " .\n")
+
+        return "\n".join(lines)
+
+    def uri(self, uri: URIRef) -> str:
+        if uri == XSD.anyURI:
+            uri = XSD.double
+        for prefix, namespace in self.namespaces:
+            if uri.startswith(namespace) and LOCAL_NAME.match(uri, len(namespace)):
+                return f"{prefix}:{uri[len(namespace) :]}"
+        return f"<{uri}>"
+
+    def node(self, node: Node) -> str:
+        if isinstance(node, Literal):
+            return self.literal(node)
+        return self.uri(node)
+
+    def literal(self, literal: Literal) -> str:
+        lexical = literal.lexical
+
+        if literal.lang is None and literal.datatype is None and is_collection(lexical):
+            return lexical
+
+        lexical = lexical.replace("\\", "")
+        if self.escape_char:
+            lexical = lexical.replace(self.escape_char, "")
+
+        if literal.datatype == XSD.double:
+            lexical = format_double(lexical)
+        elif literal.datatype == XSD.boolean:
+            lexical = lexical.lower()
+
+        quoted = quote(lexical)
+        if literal.lang:
+            return f"{quoted}@{literal.lang}"
+        if literal.datatype:
+            return f"{quoted}^^{self.uri(literal.datatype)}"
+        return quoted
+
+
+def is_collection(lexical: str) -> bool:
+    return lexical in ("()", "( )") or (lexical.startswith("( ") and lexical.endswith(" )"))
+
+
+# rdflib writes valid xsd:double values in exponent notation
+def format_double(lexical: str) -> str:
+    try:
+        value = float(lexical)
+    except ValueError:
+        return lexical
+    if math.isinf(value) or math.isnan(value):
+        return lexical
+    return re.sub("\\.?0*e", "e", f"{value:e}")
+
+
+def quote(lexical: str) -> str:
+    escaped = lexical.replace("\\", "\\\\").replace('"', '\\"').replace("\r", "\\r")
+    if "\n" in escaped:
+        return f'"""{escaped}"""'
+    return f'"{escaped}"'
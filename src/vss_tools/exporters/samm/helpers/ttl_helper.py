@@ -6,29 +6,160 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from __future__ import annotations
+
+import copy
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rdflib import Graph, URIRef
-from rdflib.namespace import RDF
 from vss_tools import log
 from vss_tools.model import VSSDataBranch
-from vss_tools.tree import VSSNode
+from vss_tools.tree import VSSNode, walk
 
-from ..config import config as cfg
+from ..config.config import Config
 from . import ttl_builder_helper as ttl_builder
 from . import vss_helper as vss_helper
-from .file_helper import write_graph_to_file
-from .namespaces import get_node_name_from_vspec_uri, samm_output_namespace
+from .file_helper import serialize_graph, write_ttl_file
 from .samm_concepts import SammConcepts, VSSConcepts
 from .string_helper import str_to_uc_first_camel_case
 
+if TYPE_CHECKING:
+    from rdflib import Graph, URIRef
+
+
+class Aspects:
+    """
+    Collects the aspect models (TTL file name and contents) built during a conversion, in creation order.
+    When an executor is given, the aspect models of split child branches are built and serialized
+    in separate worker processes.
+    The TTL files are written by the main process in the same order as a sequential conversion would,
+    so that the output does not depend on the executor.
+    """
+
+    def __init__(self, executor: Executor | None = None):
+        self.executor = executor
+        self.aspects: list[tuple[str, str] | Future[list[tuple[str, str]]]] = []
+
+    def add(self, config: Config, vss_node: VSSNode, graph: Graph) -> None:
+        # NOTE: make sure that TTL file name will reflect this graph's Aspect model name, i.e. uc first camel case
+        file_name = str_to_uc_first_camel_case(vss_node.ttl_name)
+        self.aspects.append((file_name, serialize_graph(graph, config.direct_ttl)))
+
+    def build_split(self, config: Config, vss_node: VSSNode) -> URIRef | str:
+        if self.executor is None:
+            return build_aspect(config, self, vss_node, True)
+
+        node_uri = get_aspect_uri(config, vss_node)
+
+        if node_uri == "DEPRECATED":
+            # Nothing to build, just let the usual handling report the deprecation
+            return build_aspect(config, self, vss_node, True)
+
+        # NOTE: pickle the work item right away, as the executor would do it in a background thread,
+        #       while this thread keeps updating the config and the vss_node tree
+        self.aspects.append(self.executor.submit(build_split_aspects, dump_work_item(config, vss_node)))
 
-# Parse provided VSSNode to an RDF Graph and write it to a TTL file
-def parse_vss_tree(path_to_ttl: Path, vss_node: VSSNode, split_vss: bool):
+        return node_uri
+
+    def write(self, path_to_ttl: Path) -> None:
+        for aspect in self.aspects:
+            for file_name, filedata in aspect.result() if isinstance(aspect, Future) else [aspect]:
+                vss_node_ttl_file = write_ttl_file(path_to_ttl, file_name, filedata)
+
+                log.debug("TTL file for parsed VSS node: '%s' is:\n'%s'\n", file_name, vss_node_ttl_file)
+
+
+# Parse provided VSSNode to an RDF Graph and write it to a TTL file.
+# When split_vss is set and jobs is not 1, split aspect models are built in a pool of 'jobs' processes
+# (None: number of CPUs)
+def parse_vss_tree(config: Config, path_to_ttl: Path, vss_node: VSSNode, split_vss: bool, jobs: int | None = 1):
     # Process provided vss_node so to get all of its unique VSSNode names, check if there is any duplicates etc.
     # This will be further used to make sure that we don't get any duplicate nodes in the generated TTL graph(s)
-    vss_helper.count_vss_tree_unique_node_names(vss_node)
+    vss_helper.count_vss_tree_unique_node_names(config, vss_node)
+
+    if split_vss and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            aspects = Aspects(executor)
+            node_uri = build_aspect(config, aspects, vss_node, split_vss)
+            aspects.write(path_to_ttl)
+    else:
+        aspects = Aspects()
+        node_uri = build_aspect(config, aspects, vss_node, split_vss)
+        aspects.write(path_to_ttl)
+
+    return node_uri
+
+
+# Pickle the work item of a split vss_node: the config, the ancestors of the vss_node (without their other children)
+# and its subtree, as a flat pre-order list of (name, data, ttl_name, parent index) entries.
+# NOTE: the nodes are linked by index, as pickling the node links would recurse as deep as the tree
+#       and would include the whole tree through the parent links.
+#       For the same reason, the config only keeps the unique node names of the pickled nodes.
+def dump_work_item(config: Config, vss_node: VSSNode) -> bytes:
+    ancestors = vss_node.ancestors
+    nodes = [(node.name, node.data, getattr(node, "ttl_name", None), i - 1) for i, node in enumerate(ancestors)]
+    indices: dict[int, int] = {}
+    for node, _ in walk(vss_node):
+        parent = indices.get(id(node.parent), len(ancestors) - 1)
+        indices[id(node)] = len(nodes)
+        nodes.append((node.name, node.data, getattr(node, "ttl_name", None), parent))
+
+    item_config = copy.copy(config)
+    item_config.unique_node_names = {name: config.unique_node_names[name] for name, *_ in nodes}
+    return pickle.dumps((item_config, len(ancestors), nodes), pickle.HIGHEST_PROTOCOL)
+
+
+# Rebuild the config and the split vss_node of a work item created by dump_work_item
+def load_work_item(work_item: bytes) -> tuple[Config, VSSNode]:
+    config, index, entries = pickle.loads(work_item)
+    nodes: list[VSSNode] = []
+    for name, data, ttl_name, parent in entries:
+        # NOTE: bypass VSSNode.__init__, the data is already validated
+        node = VSSNode.__new__(VSSNode)
+        node.name = name
+        node.data = data
+        if ttl_name is not None:
+            node.ttl_name = ttl_name
+        if parent >= 0:
+            node.parent = nodes[parent]
+        nodes.append(node)
+    return config, nodes[index]
+
+
+# Worker entry point, builds the aspect model of a split vss_node and all split aspect models below it.
+# The work_item is created by dump_work_item.
+def build_split_aspects(work_item: bytes) -> list[tuple[str, str]]:
+    config, vss_node = load_work_item(work_item)
+    aspects = Aspects()
+    build_aspect(config, aspects, vss_node, True)
+    return aspects.aspects  # type: ignore
+
+
+def has_only_deprecated_children(vss_node: VSSNode) -> bool:
+    deprecated_children = list(filter(lambda n: n.data.deprecation, vss_node.children))
+    return len(deprecated_children) == len(vss_node.children)
 
+
+def is_deprecated(vss_node: VSSNode) -> bool:
+    return bool(
+        hasattr(vss_node.data, "deprecation")
+        and vss_node.data.deprecation
+        and len(vss_node.data.deprecation.strip()) > 0
+    )
+
+
+# Get the URI, which build_aspect will return for the provided vss_node, without building its graph
+def get_aspect_uri(config: Config, vss_node: VSSNode) -> URIRef | str:
+    if has_only_deprecated_children(vss_node) or is_deprecated(vss_node):
+        return "DEPRECATED"
+
+    return config.get_vspec_uri(vss_helper.get_node_property_name(config, vss_node))
+
+
+# Build an RDF Graph, as aspect model, for the provided VSSNode and add it to the aspects
+def build_aspect(config: Config, aspects: Aspects, vss_node: VSSNode, split_vss: bool):
     log.debug(
         "Parse VSS node: '%s' to TTL file\n  -- as aspect%s\n", vss_node.name, "\n  -- split" if split_vss else ""
     )
@@ -36,11 +167,9 @@ def parse_vss_tree(path_to_ttl: Path, vss_node: VSSNode, split_vss: bool):
     # Skip parsing of VSSNode is branches, which have only deprecated children
     # NOTE: this is a special case for the OBD branch, which children are marked as deprecated from VSS 5.0,
     #       but the branch itself is not marked as deprecated.
-    deprecated_children = list(filter(lambda n: n.data.deprecation, vss_node.children))
-
-    if len(deprecated_children) == len(vss_node.children):
+    if has_only_deprecated_children(vss_node):
         log.warning(
-            "All child nodes of VSSNode: '%s' are deprecated.\n" "Skip the parsing of VSSNode: '%s'.\n",
+            "All child nodes of VSSNode: '%s' are deprecated.\nSkip the parsing of VSSNode: '%s'.\n",
             vss_node.name,
             vss_node.name,
         )
@@ -48,23 +177,21 @@ def parse_vss_tree(path_to_ttl: Path, vss_node: VSSNode, split_vss: bool):
         return "DEPRECATED"
 
     # Initialize RDF Graph for current node
-    graph = ttl_builder.setup_graph()
+    graph = ttl_builder.setup_graph(config)
 
     # Build VSS graph tree node.
     # NOTE: ESMF-AME requires standalone aspect models to have an aspect node.
-    node_uri = handle_vss_node(path_to_ttl, graph, vss_node, True, split_vss)
+    node_uri = handle_vss_node(config, aspects, graph, vss_node, True, split_vss)
 
     if node_uri != "DEPRECATED":
-        # Print graph for current vss_node to a TTL file
-        # NOTE: make sure that TTL file name will reflect this graph's Aspect model name, i.e. uc first camel case
-        vss_node_ttl_file = write_graph_to_file(path_to_ttl, str_to_uc_first_camel_case(vss_node.ttl_name), graph)
-
-        log.debug("TTL file for parsed VSS node: '%s' is:\n'%s'\n", vss_node.name, vss_node_ttl_file)
+        aspects.add(config, vss_node, graph)
 
     return node_uri
 
 
-def handle_vss_node(path_to_ttl: Path, graph: Graph, vss_node: VSSNode, is_aspect: bool, split_vss: bool):
+def handle_vss_node(
+    config: Config, aspects: Aspects, graph: Graph, vss_node: VSSNode, is_aspect: bool, split_vss: bool
+):
     log.debug(
         "Handle VSSNode: '%s'\n  -- node VSS path: '%s'\n  -- is_aspect: '%s'\n",
         vss_node.name,
@@ -73,24 +200,20 @@ def handle_vss_node(path_to_ttl: Path, graph: Graph, vss_node: VSSNode, is_aspec
     )
 
     # Check if node is deprecated and return DEPRECATED so it will be skipped for further conversion to TTL
-    if (
-        hasattr(vss_node.data, "deprecation")
-        and vss_node.data.deprecation
-        and len(vss_node.data.deprecation.strip()) > 0
-    ):
+    if is_deprecated(vss_node):
         log.warning(
             "Skipping VSSNode: '%s' since it is deprecated.\nDeprecation: '%s'\n",
             vss_node.name,
-            vss_node.data.deprecation,
+            vss_node.get_vss_data().deprecation,
         )
 
         return "DEPRECATED"
 
     # Build the general graph node for current vss_node
-    node_uri = ttl_builder.add_graph_node(graph, vss_node, is_aspect)
+    node_uri = ttl_builder.add_graph_node(config, graph, vss_node, is_aspect)
 
     if isinstance(vss_node.data, VSSDataBranch):
-        node_char_uri = ttl_builder.add_node_branch_characteristic(graph, vss_node, node_uri)
+        node_char_uri = ttl_builder.add_node_branch_characteristic(config, graph, vss_node, node_uri)
 
         if vss_node.data.instances:
             # Build instance(s) node(s) for the current vss_node ONLY when node is NOT EXPANDED.
@@ -99,29 +222,35 @@ def handle_vss_node(path_to_ttl: Path, graph: Graph, vss_node: VSSNode, is_aspec
             #
             # NOTE: in this case the node's characteristic (node_char_uri),
             #       will become a characteristic of each of this vss_node's instance(s)
-            node_name = get_node_name_from_vspec_uri(node_uri)
+            node_name = config.get_node_name_from_vspec_uri(node_uri)
 
             instances_dict_tree = vss_helper.get_instances_dict_tree(vss_node.data.instances, node_name)  # type: ignore
 
-            node_instance_uri = ttl_builder.add_node_instances(graph, instances_dict_tree, node_char_uri)
+            node_instance_uri = ttl_builder.add_node_instances(config, graph, instances_dict_tree, node_char_uri)
 
             # Link current vss_node to its instance uri, as if the instance uri is characteristic of this vss_node
-            graph.add((node_uri, SammConcepts.CHARACTERISTIC_RELATION.uri, node_instance_uri))
+            graph.add((node_uri, SammConcepts.CHARACTERISTIC_RELATION.uri(config.rdf), node_instance_uri))
 
         else:
             # Link the characteristic uri to current vss_node's node_uri as usual
-            graph.add((node_uri, SammConcepts.CHARACTERISTIC_RELATION.uri, node_char_uri))
+            graph.add((node_uri, SammConcepts.CHARACTERISTIC_RELATION.uri(config.rdf), node_char_uri))
 
-        handle_branch_node(path_to_ttl, graph, vss_node, split_vss, node_uri, node_char_uri)
+        handle_branch_node(config, aspects, graph, vss_node, split_vss, node_uri, node_char_uri)
 
     if vss_node.is_leaf:
-        ttl_builder.add_node_leaf(graph, node_uri, vss_node)
+        ttl_builder.add_node_leaf(config, graph, node_uri, vss_node)
 
     return node_uri
 
 
 def handle_branch_node(
-    path_to_ttl: Path, graph: Graph, vss_node: VSSNode, split_vss: bool, node_uri: URIRef, node_char_uri: URIRef
+    config: Config,
+    aspects: Aspects,
+    graph: Graph,
+    vss_node: VSSNode,
+    split_vss: bool,
+    node_uri: URIRef,
+    node_char_uri: URIRef,
 ):
     log.debug("Handle branch node for VSSNode: '%s'", vss_node.name)
 
@@ -129,17 +258,17 @@ def handle_branch_node(
     # NOTE: this will be like a Class representation of the current vss_node
     #       In order to keep consistent the naming of semantic nodes,
     #       we should append 'Entity' to the node's name, taken from its node_uri.
-    node_name = get_node_name_from_vspec_uri(node_uri)
+    node_name = config.get_node_name_from_vspec_uri(node_uri)
 
     # Node Entity name should be in camel case format with its first character in UPPER CASE
     node_entity_name = str_to_uc_first_camel_case(node_name + "Entity")
-    node_entity_uri = URIRef(VSSConcepts.EMPTY.uri_string + node_entity_name)
+    node_entity_uri = config.get_vspec_uri(VSSConcepts.EMPTY.value + node_entity_name)
 
     # Add the node entity to the graph
-    graph.add((node_entity_uri, RDF.type, SammConcepts.ENTITY.uri))
+    graph.add((node_entity_uri, config.rdf.RDF.type, SammConcepts.ENTITY.uri(config.rdf)))
 
     # Add the node entity to its characteristic as data type
-    graph.add((node_char_uri, SammConcepts.DATA_TYPE.uri, node_entity_uri))
+    graph.add((node_char_uri, SammConcepts.DATA_TYPE.uri(config.rdf), node_entity_uri))
 
     # Populate Entity properties if the current vss_node holds any child node
     properties_uris = []
@@ -147,18 +276,18 @@ def handle_branch_node(
     for child_node in vss_node.children:
         child_node_uri = None
 
-        if split_vss and child_node.depth <= cfg.SPLIT_DEPTH and isinstance(child_node.data, VSSDataBranch):
+        if split_vss and child_node.depth <= config.split_depth and isinstance(child_node.data, VSSDataBranch):
             # Build VSS node into separate Aspect model
             # when --split option is provided
             # and depth of current VSSNode is within specified config SPLIT_DEPT level,
             # Default SPLIT_DEPT is 1, i.e. just 1st level branches like Vehicle.Cabin etc.
-            child_node_uri = parse_vss_tree(path_to_ttl, child_node, True)
+            child_node_uri = aspects.build_split(config, child_node)
 
         else:
             # Each child should be a leaf node of its parent - i.e. NO ASPECTS and no split for child nodes
-            child_node_uri = handle_vss_node(path_to_ttl, graph, child_node, False, False)
+            child_node_uri = handle_vss_node(config, aspects, graph, child_node, False, False)
 
-        if child_node_uri and child_node_uri != "DEPRECATED" and str(child_node_uri) != samm_output_namespace:
+        if child_node_uri and child_node_uri != "DEPRECATED" and str(child_node_uri) != config.samm_output_namespace:
             # Each property should have payloadName = property name,
             # so to avoid the prefixed ttl_name when generating APIs and JSON payloads
             properties_uris.append((child_node_uri, ("payloadName", child_node.name)))
@@ -173,4 +302,4 @@ def handle_branch_node(
 
     # Add properties to current node_entity_uri
     if len(properties_uris) > 0:
-        ttl_builder.add_node_properties(properties_uris, graph, node_entity_uri)
+        ttl_builder.add_node_properties(config, properties_uris, graph, node_entity_uri)
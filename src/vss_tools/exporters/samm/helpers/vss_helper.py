@@ -6,51 +6,42 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from __future__ import annotations
+
 import re
 from ast import literal_eval
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rdflib import URIRef
 from vss_tools import log
 from vss_tools.datatypes import Datatypes
 from vss_tools.model import NodeType, VSSDataBranch, VSSDataDatatype
 from vss_tools.tree import VSSNode
 
 from ..config import config as cfg
+from ..config.config import Config
 from .data_types_and_units import DataTypes, DataUnits
 from .samm_concepts import SammCConcepts, SammConcepts
 from .string_helper import str_to_lc_first_camel_case, str_to_uc_first_camel_case
 
+if TYPE_CHECKING:
+    from rdflib import URIRef
+
 #
 # Helper script.
 # Provides set of functions to work with VSSNodes.
 #
 
 
-# A DICT collection of key => value entries, where:
-#   :key   - vss_node.name of a node from provided VSSNote (tree) for parsing.
-#   :value - object of type: { counter: int, vss_paths: [str]}
-#            where:
-#                  - counter   - holds number of occurrences of the corresponding :key in the main VSSNode
-#                  - vss_paths - array of qualified VSS path, for each node which name is matching the current :key
-#
-# This collection will be populated on the very first call of parse_vss_tree
-# so to have a full overview of available VSS nodes' names, if there is any duplicated ones etc.
-# Then it will be used to defined whether the corresponding vss_node should be prefixed with its parent name or not,
-# as implemented in the should_use_parent_prefix function.
-top_vss_tree_unique_node_names: dict[str, Any] = {}
-
-
-def count_vss_tree_unique_node_names(vss_node: VSSNode) -> None:
-    if type(top_vss_tree_unique_node_names) is dict and len(top_vss_tree_unique_node_names.keys()) == 0:
-        # THIS SHOULD BE DONE ONLY ONCE,
+def count_vss_tree_unique_node_names(config: Config, vss_node: VSSNode) -> None:
+    if len(config.unique_node_names.keys()) == 0:
+        # THIS SHOULD BE DONE ONLY ONCE PER EXPORT,
         # i.e. when we parse the top level tree and we have not yet read all of its nodes
-        populate_unique_node_names(top_vss_tree_unique_node_names, vss_node)
+        populate_unique_node_names(config.unique_node_names, vss_node)
 
 
 # Traverse through each node of provided vss_node tree and record unique node names,
 # their number of occurrences and vss_paths for their duplicates if there is any.
-# For more details, check comment for: top_vss_tree_unique_node_names field on lines: 33-44.
+# For more details, check comment for: config.Config.unique_node_names.
 def populate_unique_node_names(node_names_dict: dict[str, Any], vss_node: VSSNode) -> None:
     if not node_names_dict.get(vss_node.name):
         # ADD vss_node to node_names_dict
@@ -66,7 +57,7 @@ def populate_unique_node_names(node_names_dict: dict[str, Any], vss_node: VSSNod
             populate_unique_node_names(node_names_dict, vss_child_node)
 
 
-def get_parent_prefix_for_ttl_name(vss_node: VSSNode, ttl_name: str, use_vehicle_prefix=False) -> str:
+def get_parent_prefix_for_ttl_name(config: Config, vss_node: VSSNode, ttl_name: str, use_vehicle_prefix=False) -> str:
     parent_prefix = ""
 
     if vss_node.parent and (vss_node.parent.name != "Vehicle" or use_vehicle_prefix):
@@ -84,10 +75,9 @@ def get_parent_prefix_for_ttl_name(vss_node: VSSNode, ttl_name: str, use_vehicle
         # This is specially, when a user is using the split option
         if (
             vss_node.parent.name != vss_node.parent.ttl_name
-            and top_vss_tree_unique_node_names[vss_node.name]["counter"] > 0
+            and config.unique_node_names[vss_node.name]["counter"] > 0
             and sum(
-                vss_node.parent.name in vss_path
-                for vss_path in top_vss_tree_unique_node_names[vss_node.name]["vss_paths"]
+                vss_node.parent.name in vss_path for vss_path in config.unique_node_names[vss_node.name]["vss_paths"]
             )
             > 1
         ):
@@ -97,7 +87,7 @@ def get_parent_prefix_for_ttl_name(vss_node: VSSNode, ttl_name: str, use_vehicle
             parent_prefix = vss_node.parent.name
 
         if ttl_name.startswith(parent_prefix):
-            return get_parent_prefix_for_ttl_name(vss_node.parent, ttl_name, use_vehicle_prefix=True)
+            return get_parent_prefix_for_ttl_name(config, vss_node.parent, ttl_name, use_vehicle_prefix=True)
 
     return parent_prefix
 
@@ -111,7 +101,9 @@ def get_parent_prefix_for_ttl_name(vss_node: VSSNode, ttl_name: str, use_vehicle
 #                        it will be overwritten based on preserve_ttl_name
 #   preserve_ttl_name  - if specified and the provided vss_node, already has a ttl_name,
 #                        then its ttl_name will be preserved and will be prefixed with its parent name
-def set_ttl_name(vss_node: VSSNode, use_parent_prefix: bool, overwrite_ttl_name=False, preserve_ttl_name=False) -> None:
+def set_ttl_name(
+    config: Config, vss_node: VSSNode, use_parent_prefix: bool, overwrite_ttl_name=False, preserve_ttl_name=False
+) -> None:
     log.debug("Set ttl name for VSS Node: '%s'.", vss_node.name)
 
     if hasattr(vss_node, "ttl_name") is False:
@@ -125,7 +117,7 @@ def set_ttl_name(vss_node: VSSNode, use_parent_prefix: bool, overwrite_ttl_name=
         ttl_name = vss_node.ttl_name if vss_node.ttl_name and preserve_ttl_name else vss_node.name
 
         if use_parent_prefix:
-            parent_prefix = get_parent_prefix_for_ttl_name(vss_node, ttl_name)
+            parent_prefix = get_parent_prefix_for_ttl_name(config, vss_node, ttl_name)
             vss_node.ttl_name = parent_prefix + ttl_name
 
         else:
@@ -135,8 +127,8 @@ def set_ttl_name(vss_node: VSSNode, use_parent_prefix: bool, overwrite_ttl_name=
 
 
 # Helper function, to check whether to use parent prefix for a vss_node or not
-def should_use_parent_prefix(vss_node: VSSNode) -> bool:
-    if top_vss_tree_unique_node_names[vss_node.name]["counter"] > 1 or (
+def should_use_parent_prefix(config: Config, vss_node: VSSNode) -> bool:
+    if config.unique_node_names[vss_node.name]["counter"] > 1 or (
         vss_node.is_leaf
         and hasattr(vss_node.data, "datatype")
         and vss_node.data.datatype is Datatypes.BOOLEAN
@@ -206,9 +198,9 @@ def filter_vss_tree_for_deletion(vss_node: VSSNode, selected_paths: list[str]) -
                 vss_node.data.delete = True  # type: ignore
 
 
-def get_node_property_name(vss_node: VSSNode) -> str:
+def get_node_property_name(config: Config, vss_node: VSSNode) -> str:
     # Property names are based on the vss_node.ttl_name => make sure it is set
-    set_ttl_name(vss_node, should_use_parent_prefix(vss_node))
+    set_ttl_name(config, vss_node, should_use_parent_prefix(config, vss_node))
 
     # Graph - property names are in camel case format, where 1st character is in lower case
     return str_to_lc_first_camel_case(vss_node.ttl_name)  # type: ignore
@@ -232,26 +224,25 @@ def get_node_description(vss_node: VSSNode) -> str:
         and vss_node.data.description
         and len(vss_node.data.description.strip()) > 0
     ):
-        if '"' in vss_node.data.description:
-            # Escape double quotes within vss_node.description
-            vss_node.data.description = vss_node.data.description.replace('"', f'{cfg.CUSTOM_ESCAPE_CHAR}"')
+        # Escape double quotes within vss_node.description
+        # NOTE: the tree is not updated, so that it can be exported again
+        node_description = vss_node.data.description.replace('"', f'{cfg.CUSTOM_ESCAPE_CHAR}"')
 
         # Set 3 spaces spacer, so to align 'VSS path:' with 'Description:'
         spacer = "    "
-        description = f"\n\nDescription: {vss_node.data.description}"
+        description = f"\n\nDescription: {node_description}"
 
     # NOTE: there is also a vss_node.comment field which also holds some details
     #       Add the vss_node.comment to its description
     if hasattr(vss_node.data, "comment") and vss_node.data.comment and len(vss_node.data.comment.strip()) > 0:
-        if '"' in vss_node.data.comment:
-            vss_node.data.comment = vss_node.data.comment.replace('"', f'{cfg.CUSTOM_ESCAPE_CHAR}"')
+        node_comment = vss_node.data.comment.replace('"', f'{cfg.CUSTOM_ESCAPE_CHAR}"')
 
         # Use the 3 empty spaces spacer, when there is description,
         # otherwise set it to align 'VSS path:' with 'Comment:'
         spacer = spacer if description else " "
 
         # Align 'Comment:' with 'Description:' and 'VSS path:'
-        description = f"{description}\n\nComment{'   ' if description else ''}: {vss_node.data.comment}"
+        description = f"{description}\n\nComment{'   ' if description else ''}: {node_comment}"
 
     if hasattr(vss_node.data, "unit") and vss_node.data.unit and len(vss_node.data.unit.strip()) > 0:
         description = f"{description}\n\nUnit{'             ' if description else ''}: {vss_node.data.unit}"
@@ -457,7 +448,11 @@ def get_node_rdf_type(vss_node: VSSNode) -> SammConcepts | SammCConcepts:
         return SammConcepts.CHARACTERISTIC
 
 
-def get_data_type(vss_node: VSSNode) -> URIRef:
+def get_data_type(config: Config, vss_node: VSSNode) -> URIRef:
+    return config.rdf.XSD[get_data_type_name(vss_node)]
+
+
+def get_data_type_name(vss_node: VSSNode) -> str:
     if hasattr(vss_node.data, "unit") and vss_node.data.unit == "iso8601":
         # DateTime VSSNodes data_type should be based on their unit
         # instead of their datatype, which is more likely to be set as 'string'.
@@ -488,10 +483,10 @@ def get_data_type(vss_node: VSSNode) -> URIRef:
         return DataTypes["anyURI"]
 
 
-def get_data_unit_uri(unit: str):
+def get_data_unit_uri(config: Config, unit: str) -> URIRef:
     if DataUnits.get(unit):
-        return DataUnits[unit]
+        return config.rdf.URIRef(DataUnits[unit])
     else:
         log.warning("No DataUnit found for unit: '%s'.\nDEFAULTING it to: '%s'\n", unit, DataUnits["blank"])
 
-        return DataUnits["blank"]
+        return config.rdf.URIRef(DataUnits["blank"])
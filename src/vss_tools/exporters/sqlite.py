@@ -0,0 +1,216 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+# Convert vspec tree to an indexed SQLite catalog
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import rich_click as click
+
+import vss_tools.cli_options as clo
+from vss_tools import log
+from vss_tools.datatypes import dynamic_units
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
+from vss_tools.exporters.utils import get_instances_meta
+from vss_tools.main import get_trees
+from vss_tools.model import VSSQuantity, VSSUnit
+from vss_tools.tree import VSSNode
+from vss_tools.units_quantities import load_quantities
+
+SCHEMA = """
+CREATE TABLE quantity (
+    name TEXT PRIMARY KEY,
+    definition TEXT NOT NULL,
+    comment TEXT,
+    remark TEXT
+);
+CREATE TABLE unit (
+    name TEXT PRIMARY KEY,
+    unit TEXT,
+    definition TEXT NOT NULL,
+    quantity TEXT NOT NULL REFERENCES quantity(name)
+);
+CREATE TABLE unit_datatype (
+    unit TEXT NOT NULL REFERENCES unit(name),
+    datatype TEXT NOT NULL
+);
+CREATE TABLE node (
+    id INTEGER PRIMARY KEY,
+    fqn TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    parent INTEGER REFERENCES node(id),
+    tree TEXT NOT NULL,
+    type TEXT NOT NULL,
+    datatype TEXT,
+    unit TEXT,
+    description TEXT NOT NULL
+);
+CREATE TABLE attribute (
+    node INTEGER NOT NULL REFERENCES node(id),
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (node, name)
+);
+CREATE TABLE instance (
+    node INTEGER NOT NULL REFERENCES node(id),
+    name TEXT NOT NULL
+);
+"""
+
+# Created after the bulk inserts
+INDEXES = """
+CREATE INDEX node_parent ON node(parent);
+CREATE INDEX node_type ON node(type);
+CREATE INDEX node_datatype ON node(datatype);
+CREATE INDEX node_unit ON node(unit);
+CREATE INDEX attribute_name ON attribute(name);
+CREATE INDEX unit_datatype_unit ON unit_datatype(unit);
+CREATE INDEX instance_node ON instance(node);
+"""
+
+# Attributes stored in the node table, all others are rows of the attribute table
+NODE_COLUMNS = ("type", "datatype", "unit", "description")
+
+
+class RowsVisitor(Visitor):
+    """
+    Collects the node and attribute rows, continuing the ids of the visited trees
+    """
+
+    def __init__(self, extend_all_attributes: bool, extended_attributes: tuple[str, ...] = ()) -> None:
+        self.extend_all_attributes = extend_all_attributes
+        self.extended_attributes = extended_attributes
+        self.tree = ""
+        self.ids: dict[str, int] = {}
+        self.nodes: list[tuple[Any, ...]] = []
+        self.attributes: list[tuple[int, str, str]] = []
+
+    def enter(self, visit: Visit) -> None:
+        node_id = len(self.ids) + 1
+        self.ids[visit.fqn] = node_id
+        parent_id = self.ids[visit.parent.fqn] if visit.parent else None
+
+        data = visit.node.data.as_dict(self.extend_all_attributes, extended_attributes=self.extended_attributes)
+        self.nodes.append(
+            (
+                node_id,
+                visit.fqn,
+                visit.node.name,
+                parent_id,
+                self.tree,
+                *(data.pop(column, None) for column in NODE_COLUMNS),
+            )
+        )
+        self.attributes.extend((node_id, name, json.dumps(value)) for name, value in data.items())
+
+    def add_tree(self, root: VSSNode, tree: str) -> None:
+        self.tree = tree
+        traverse(root, [self])
+
+
+def get_unit_rows(units: dict[str, VSSUnit]) -> tuple[list[tuple[Any, ...]], list[tuple[str, str]]]:
+    """
+    Units by all names they can be referenced with, and their allowed datatypes
+    """
+    unit_rows: list[tuple[Any, ...]] = []
+    datatype_rows: list[tuple[str, str]] = []
+    for name, unit in units.items():
+        unit_rows.append((name, unit.unit, unit.definition, unit.quantity))
+        datatype_rows.extend((name, datatype) for datatype in unit.allowed_datatypes or [])
+    return unit_rows, datatype_rows
+
+
+def write_catalog(
+    output: Path,
+    rows: RowsVisitor,
+    instances: dict[str, list[str]],
+    units: dict[str, VSSUnit],
+    quantities: dict[str, VSSQuantity],
+) -> None:
+    """
+    Writes all tables in a single transaction, replacing an existing catalog
+    """
+    output.unlink(missing_ok=True)
+    unit_rows, unit_datatype_rows = get_unit_rows(units)
+    instance_rows = [(rows.ids[fqn], name) for fqn, names in instances.items() for name in names]
+
+    connection = sqlite3.connect(output)
+    try:
+        with connection:
+            connection.executescript(SCHEMA)
+            connection.executemany(
+                "INSERT INTO quantity VALUES (?, ?, ?, ?)",
+                [(name, q.definition, q.comment, q.remark) for name, q in quantities.items()],
+            )
+            connection.executemany("INSERT INTO unit VALUES (?, ?, ?, ?)", unit_rows)
+            connection.executemany("INSERT INTO unit_datatype VALUES (?, ?)", unit_datatype_rows)
+            connection.executemany("INSERT INTO node VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows.nodes)
+            connection.executemany("INSERT INTO attribute VALUES (?, ?, ?)", rows.attributes)
+            connection.executemany("INSERT INTO instance VALUES (?, ?)", instance_rows)
+            connection.executescript(INDEXES)
+    finally:
+        connection.close()
+    log.info("Wrote %d nodes to %s", len(rows.nodes), output)
+
+
+@click.command()
+@clo.vspec_opt
+@clo.output_required_opt
+@clo.include_dirs_opt
+@clo.extended_attributes_opt
+@clo.strict_opt
+@clo.aborts_opt
+@clo.expand_opt
+@clo.overlays_opt
+@clo.quantities_opt
+@clo.units_opt
+@clo.types_opt
+@clo.extend_all_attributes_opt
+def cli(
+    vspec: Path,
+    output: Path,
+    include_dirs: tuple[Path],
+    extended_attributes: tuple[str],
+    strict: bool,
+    aborts: tuple[str],
+    expand: bool,
+    overlays: tuple[Path],
+    quantities: tuple[Path],
+    units: tuple[Path],
+    types: tuple[Path],
+    extend_all_attributes: bool,
+):
+    """
+    Export as SQLite.
+    """
+    tree, datatype_tree = get_trees(
+        vspec=vspec,
+        include_dirs=include_dirs,
+        aborts=aborts,
+        strict=strict,
+        extended_attributes=extended_attributes,
+        quantities=quantities,
+        units=units,
+        types=types,
+        overlays=overlays,
+        expand=expand,
+    )
+    log.info("Generating SQLite output...")
+
+    rows = RowsVisitor(extend_all_attributes, extended_attributes)
+    rows.add_tree(tree, "signals")
+    if datatype_tree:
+        rows.add_tree(datatype_tree, "types")
+
+    # Only the names of the quantities are kept when loading, same default as get_trees
+    if not quantities and (vspec.parent / "quantities.yaml").exists():
+        quantities = (vspec.parent / "quantities.yaml",)
+    write_catalog(output, rows, get_instances_meta(tree), dynamic_units, load_quantities(list(quantities)))
@@ -0,0 +1,156 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# Shared traversal of a tree, with visitors (exporters) attached to the same walk.
+# Built on 'vss_tools.tree.walk', adding enter/leave callbacks and the instance facts of every node.
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from vss_tools.model import VSSData, VSSDataBranch
+from vss_tools.tree import NoInstanceRootException, VSSNode, walk
+
+
+class AttributeView:
+    """
+    Read-only view on the attributes of the data of a node, without dumping the model.
+    Missing attributes and attributes set to None are treated the same
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def get(self, name: str, default: Any = None) -> Any:
+        value = getattr(self.data, name, None)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> Any:
+        value = getattr(self.data, name, None)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return getattr(self.data, name, None) is not None
+
+
+class Visit:
+    """
+    A node as seen by the visitors, with the information which is computed once during the walk
+    """
+
+    __slots__ = ("node", "fqn", "depth", "parent", "instance_root", "instance_hops")
+
+    def __init__(self, node: VSSNode, parent: Visit | None, fqn: str) -> None:
+        self.node = node
+        self.parent = parent
+        self.fqn = fqn
+        self.depth: int = parent.depth + 1 if parent else 0
+
+        # Same as VSSNode.get_instance_root, None for non branches and invalid instance branches
+        self.instance_root: Visit | None = None
+        self.instance_hops = 0
+        if isinstance(node.data, VSSDataBranch):
+            if not node.data.is_instance:
+                self.instance_root = self
+            elif parent and parent.instance_root:
+                self.instance_root = parent.instance_root
+                self.instance_hops = parent.instance_hops + 1
+
+    @property
+    def data(self) -> VSSData:
+        return self.node.get_vss_data()
+
+    @property
+    def attributes(self) -> AttributeView:
+        return AttributeView(self.node.data)
+
+    @property
+    def parent_fqn(self) -> str | None:
+        return self.parent.fqn if self.parent else None
+
+    @property
+    def is_instance(self) -> bool:
+        return isinstance(self.node.data, VSSDataBranch) and self.node.data.is_instance
+
+    def get_instance_root(self) -> tuple[Visit, int]:
+        """
+        Same as VSSNode.get_instance_root
+        """
+        if self.instance_root is None:
+            raise NoInstanceRootException()
+        return self.instance_root, self.instance_hops
+
+    @property
+    def instance_children_depth(self) -> int:
+        """
+        Same as VSSNode.count_instance_children_depth
+        """
+        return self.node.count_instance_children_depth()
+
+
+class Visitor:
+    """
+    Base class of the visitors of a traversal. All callbacks are optional.
+    """
+
+    def enter(self, visit: Visit) -> bool | None:
+        """
+        Called for every node, in pre-order.
+        Returning False skips the children of the node, for this visitor only
+        """
+        return None
+
+    def leave(self, visit: Visit) -> None:
+        """
+        Called after the children of the node were visited
+        """
+
+    def finish(self) -> None:
+        """
+        Called once after the walk
+        """
+
+
+def traverse(root: VSSNode, visitors: Sequence[Visitor]) -> None:
+    """
+    Walks the tree once, calling all visitors for every node.
+    Subtrees skipped by all visitors are not walked at all.
+    """
+    # Per visitor, the visit of which the children are skipped
+    skipped: list[Visit | None] = [None] * len(visitors)
+    # Visits of the current node and its ancestors, left when the walk continues outside of them
+    path: list[Visit] = []
+
+    def leave(visit: Visit) -> None:
+        for i, visitor in enumerate(visitors):
+            if skipped[i] is visit:
+                skipped[i] = None
+            if skipped[i] is None:
+                visitor.leave(visit)
+
+    def descend(node: VSSNode) -> bool:
+        return any(skip is None for skip in skipped)
+
+    for node, fqn in walk(root, descend=descend):
+        while path and path[-1].node is not node.parent:
+            leave(path.pop())
+        visit = Visit(node, path[-1] if path else None, fqn)
+        for i, visitor in enumerate(visitors):
+            if skipped[i] is None and visitor.enter(visit) is False:
+                skipped[i] = visit
+        path.append(visit)
+
+    while path:
+        leave(path.pop())
+
+    for visitor in visitors:
+        visitor.finish()
@@ -6,30 +6,144 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import re
+import sys
+from fnmatch import translate
+from itertools import chain
 from pathlib import Path
+from typing import Iterator, TextIO
 
 import rich_click as click
-from anytree import RenderTree
+from anytree import ContStyle
 
 import vss_tools.cli_options as clo
 from vss_tools import log
 from vss_tools.main import get_trees
-from vss_tools.tree import VSSNode
-
-
-def get_rendered_tree(tree: VSSNode, attributes: tuple[str]) -> str:
-    tree_content_lines = []
-    for pre, fill, node in RenderTree(tree):
-        tree_content_lines.append("%s%s" % (pre, node.name))
-        for attribute in attributes:
-            content = getattr(node.data, attribute, None)
-            if content is None:
-                continue
-            if isinstance(content, str):
-                tree_content_lines.append("%s%s='%s'" % (fill, attribute, content))
+from vss_tools.tree import SEPARATOR, VSSNode
+
+STYLE = ContStyle()
+
+
+def get_literal_prefix(pattern: str) -> str:
+    """
+    Part of a glob pattern before the first wildcard
+    """
+    match = re.search(r"[*?[]", pattern)
+    return pattern[: match.start()] if match else pattern
+
+
+class TreeRenderer:
+    """
+    Renders a tree line by line, same as anytree RenderTree.
+    Nodes deeper than 'max_depth' and nodes not leading to a node matching one of the glob 'patterns'
+    are pruned while walking
+    """
+
+    def __init__(self, attributes: tuple[str, ...], max_depth: int | None = None, patterns: tuple[str, ...] = ()):
+        self.attributes = attributes
+        self.max_depth = max_depth
+        self.patterns = patterns
+        self.regex = re.compile("|".join(translate(pattern) for pattern in patterns))
+        self.prefixes = [get_literal_prefix(pattern) for pattern in patterns]
+        # Whether a node (by id) matches or leads to a match
+        self.included: dict[int, bool] = {}
+
+    def can_match(self, fqn: str) -> bool:
+        """
+        Whether the node or one of its children can match a pattern, by the literal pattern prefixes
+        """
+        return any(
+            fqn.startswith(prefix) or prefix == fqn or prefix.startswith(fqn + SEPARATOR) for prefix in self.prefixes
+        )
+
+    def is_included(self, node: VSSNode, fqn: str, depth: int) -> bool:
+        included = self.included.get(id(node))
+        if included is None:
+            if not self.can_match(fqn):
+                included = False
+            elif self.regex.match(fqn):
+                included = True
+            else:
+                included = any(
+                    self.is_included(child, f"{fqn}{SEPARATOR}{child.name}", depth + 1)
+                    for child in self.get_candidates(node, depth)
+                )
+            self.included[id(node)] = included
+        return included
+
+    def get_candidates(self, node: VSSNode, depth: int) -> tuple[VSSNode, ...]:
+        if self.max_depth is not None and depth >= self.max_depth:
+            return ()
+        return node.children
+
+    def get_children(self, node: VSSNode, fqn: str, depth: int) -> list[VSSNode]:
+        children = self.get_candidates(node, depth)
+        if not self.patterns:
+            return list(children)
+        return [child for child in children if self.is_included(child, f"{fqn}{SEPARATOR}{child.name}", depth + 1)]
+
+    def iter_lines(self, root: VSSNode) -> Iterator[str]:
+        root_fqn = root.get_fqn()
+        if self.patterns and not self.is_included(root, root_fqn, 0):
+            return
+        # node, fqn, depth, indent, whether it is the last child (None for the root)
+        stack: list[tuple[VSSNode, str, int, str, bool | None]] = [(root, root_fqn, 0, "", None)]
+        while stack:
+            node, fqn, depth, indent, last = stack.pop()
+            if last is None:
+                pre = fill = ""
+            elif last:
+                pre, fill = indent + STYLE.end, indent + STYLE.empty
             else:
-                tree_content_lines.append("%s%s=%s" % (fill, attribute, content))
-    return "\n".join(tree_content_lines)
+                pre, fill = indent + STYLE.cont, indent + STYLE.vertical
+            yield "%s%s" % (pre, node.name)
+
+            # Only the requested attributes are looked up
+            for attribute in self.attributes:
+                content = getattr(node.data, attribute, None)
+                if content is None:
+                    continue
+                if isinstance(content, str):
+                    yield "%s%s='%s'" % (fill, attribute, content)
+                else:
+                    yield "%s%s=%s" % (fill, attribute, content)
+
+            children = self.get_children(node, fqn, depth)
+            for i in range(len(children) - 1, -1, -1):
+                child = children[i]
+                stack.append((child, f"{fqn}{SEPARATOR}{child.name}", depth + 1, fill, i == len(children) - 1))
+
+
+def get_rendered_tree(
+    tree: VSSNode, attributes: tuple[str, ...], max_depth: int | None = None, patterns: tuple[str, ...] = ()
+) -> str:
+    return "\n".join(TreeRenderer(attributes, max_depth, patterns).iter_lines(tree))
+
+
+def get_subtree(root: VSSNode, fqn: str) -> VSSNode | None:
+    """
+    Node with the given fqn, following the names from the root
+    """
+    names = fqn.split(SEPARATOR)
+    if names[0] != root.name:
+        return None
+    node = root
+    for name in names[1:]:
+        child = next((child for child in node.children if child.name == name), None)
+        if child is None:
+            return None
+        node = child
+    return node
+
+
+def write_lines(file: TextIO, lines: Iterator[str]) -> None:
+    """
+    Writes the lines as they are rendered, separated by newlines
+    """
+    for i, line in enumerate(lines):
+        if i:
+            file.write("\n")
+        file.write(line)
 
 
 @click.command()
@@ -45,6 +159,14 @@ def get_rendered_tree(tree: VSSNode, attributes: tuple[str]) -> str:
 @clo.units_opt
 @clo.types_opt
 @click.option("--attr", help="Show VSSData attribute", multiple=True)
+@click.option("--root", "root_fqn", help="Only render the subtree of the node with this fqn.")
+@click.option("--max-depth", type=click.IntRange(min=0), help="Only render this many levels below the root.")
+@click.option(
+    "--match",
+    "patterns",
+    multiple=True,
+    help="Only render nodes with a fqn matching one of the glob patterns, and their parents.",
+)
 def cli(
     vspec: Path,
     include_dirs: tuple[Path],
@@ -58,6 +180,9 @@ def cli(
     types: tuple[Path],
     output: Path | None,
     attr: tuple[str],
+    root_fqn: str | None,
+    max_depth: int | None,
+    patterns: tuple[str],
 ):
     """
     Export as Tree.
@@ -75,13 +200,21 @@ def cli(
         expand=expand,
     )
 
-    rendered_tree = get_rendered_tree(tree, attr)
+    roots = [tree]
     if datatype_tree:
-        rendered_tree += "\n" + get_rendered_tree(datatype_tree, attr)
+        roots.append(datatype_tree)
+    if root_fqn:
+        roots = [subtree for subtree in (get_subtree(root, root_fqn) for root in roots) if subtree]
+        if not roots:
+            log.error(f"Node not found: {root_fqn}")
+            sys.exit(1)
 
+    renderer = TreeRenderer(attr, max_depth, patterns)
+    lines = chain.from_iterable(renderer.iter_lines(root) for root in roots)
     if output:
         log.info(f"Writing tree to: {output.absolute()}")
         with open(output, "w") as f:
-            f.write(rendered_tree)
+            write_lines(f, lines)
     else:
-        log.info(rendered_tree)
+        write_lines(sys.stdout, lines)
+        sys.stdout.write("\n")
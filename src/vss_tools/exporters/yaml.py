@@ -12,12 +12,14 @@
 
 
 from pathlib import Path
+from typing import Any
 
 import rich_click as click
 import yaml
 
 import vss_tools.cli_options as clo
 from vss_tools import log
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
 from vss_tools.main import get_trees
 
 
@@ -36,6 +38,22 @@ def export_yaml(file_name, content_dict):
         )
 
 
+class FlatDataVisitor(Visitor):
+    """
+    Collects the data of all nodes by fqn, same as VSSNode.as_flat_dict
+    """
+
+    def __init__(self, with_extra_attributes: bool, extended_attributes: tuple[str, ...] = ()) -> None:
+        self.with_extra_attributes = with_extra_attributes
+        self.extended_attributes = extended_attributes
+        self.data: dict[str, Any] = {}
+
+    def enter(self, visit: Visit) -> None:
+        self.data[visit.fqn] = visit.node.data.as_dict(
+            self.with_extra_attributes, extended_attributes=self.extended_attributes
+        )
+
+
 # create dumper to remove aliases from output and to add nice new line after each object for a better readability
 class NoAliasDumper(yaml.SafeDumper):
     def ignore_aliases(self, data):
@@ -92,10 +110,14 @@ def cli(
         expand=expand,
     )
     log.info("Generating YAML output...")
-    tree_data = tree.as_flat_dict(extend_all_attributes, extended_attributes)
+    tree_visitor = FlatDataVisitor(extend_all_attributes, extended_attributes)
+    traverse(tree, [tree_visitor])
+    tree_data = tree_visitor.data
 
     if datatype_tree:
-        datatype_tree_data = datatype_tree.as_flat_dict(extend_all_attributes, extended_attributes)
+        datatype_tree_visitor = FlatDataVisitor(extend_all_attributes, extended_attributes)
+        traverse(datatype_tree, [datatype_tree_visitor])
+        datatype_tree_data = datatype_tree_visitor.data
         if not types_output:
             log.info("Adding custom data types to signal dictionary")
             tree_data["ComplexDataTypes"] = datatype_tree_data
@@ -8,7 +8,7 @@
 
 from pathlib import Path
 
-from anytree import PreOrderIter, findall
+from anytree import PreOrderIter
 
 from vss_tools import log
 from vss_tools.datatypes import (
@@ -16,25 +16,13 @@ from vss_tools.datatypes import (
     dynamic_quantities,
     dynamic_units,
 )
-from vss_tools.model import (
-    VSSDataBranch,
-    VSSDataProperty,
-    VSSDataStruct,
-    get_all_model_fields,
-)
+from vss_tools.timings import stage
 from vss_tools.tree import ModelValidationException, VSSNode, add_struct_schemas, build_tree
 from vss_tools.units_quantities import load_quantities, load_units
+from vss_tools.validation import get_rules, get_types_rules, report, validate
 from vss_tools.vspec import InvalidSpecDuplicatedEntryException, InvalidSpecException, load_vspec
 
 
-class NameViolationException(Exception):
-    pass
-
-
-class ExtraAttributesException(Exception):
-    pass
-
-
 class MultipleTypeTreesException(Exception):
     pass
 
@@ -74,33 +62,6 @@ def load_quantities_and_units(quantities: tuple[Path, ...], units: tuple[Path, .
         dynamic_units[k] = v
 
 
-def check_name_violations(root: VSSNode, strict: bool, aborts: tuple[str, ...]) -> None:
-    if strict or "name-style" in aborts:
-        naming_violations = root.get_naming_violations()
-        if naming_violations:
-            for violation in naming_violations:
-                log.warning(f"Name violation: '{violation[0]}' ({violation[1]})")
-            raise NameViolationException(f"Name violations detected: {naming_violations}")
-
-
-def check_extra_attribute_violations(
-    root: VSSNode,
-    strict: bool,
-    aborts: tuple[str, ...],
-    extended_attributes: tuple[str, ...],
-) -> None:
-    extra_attributes = root.get_extra_attributes(extended_attributes)
-    for attribute in extra_attributes:
-        log.warning(f"Unknown extra attribute: '{attribute[0]}':'{attribute[1]}'")
-        if attribute[1] in get_all_model_fields():
-            raise ExtraAttributesException(
-                f"Forbidden extra attribute (core attribute): '{attribute[0]}':'{attribute[1]}'"
-            )
-    if strict or "unknown-attribute" in aborts:
-        if extra_attributes:
-            raise ExtraAttributesException(f"Forbidden extra attributes detected: {extra_attributes}")
-
-
 def get_types_root(types: tuple[Path, ...], include_dirs: list[Path]) -> VSSNode | None:
     if not types:
         log.debug("No user 'types' defined")
@@ -136,50 +97,13 @@ def get_types_root(types: tuple[Path, ...], include_dirs: list[Path]) -> VSSNode
             exit(1)
 
         if dynamic_datatypes:
-            log.info(f"Dynamic datatypes added={len(dynamic_datatypes)}")
-            log.debug(f"Dynamic datatypes:\n{dynamic_datatypes}")
+            log.info("Dynamic datatypes added=%d", len(dynamic_datatypes))
+            log.debug("Dynamic datatypes:\n%s", dynamic_datatypes)
             add_struct_schemas(types_root)
 
     return types_root
 
 
-def get_invalid_node_msgs(root: VSSNode) -> list[str]:
-    """
-    Validating whether tree nodes have correct parents
-    All nodes need 'branch' parents except 'properties'.
-    Properties need a 'struct' as a parent.
-    Returning error msgs
-    """
-    invalid_nodes = []
-    for node in PreOrderIter(root):
-        ok = True
-        if node.parent is None:
-            continue
-        if isinstance(node.data, VSSDataProperty):
-            if not isinstance(node.parent.data, VSSDataStruct):
-                ok = False
-        elif isinstance(node.data, VSSDataStruct):
-            if not isinstance(node.parent.data, VSSDataStruct) and not isinstance(node.parent.data, VSSDataBranch):
-                ok = False
-        else:
-            if not isinstance(node.parent.data, VSSDataBranch):
-                ok = False
-        if not ok:
-            entry = f"'{node.get_fqn()} ({node.data.__class__.__name__})',"
-            entry += f" invalid parent: '{node.parent.data.__class__.__name__}'"
-            invalid_nodes.append(entry)
-    return invalid_nodes
-
-
-def validate_tree(root: VSSNode) -> None:
-    invalid_node_msgs = get_invalid_node_msgs(root)
-    if invalid_node_msgs:
-        log.critical(f"Invalid nodes={len(invalid_node_msgs)}")
-        for node in invalid_node_msgs:
-            log.critical(node)
-        exit(1)
-
-
 def get_trees(
     vspec: Path,
     include_dirs: tuple[Path, ...] = (),
@@ -197,9 +121,10 @@ def get_trees(
     Returning a tuple of the root and the types tree
     """
     if extended_attributes:
-        log.info(f"User defined extra attributes: {extended_attributes}")
+        log.info("User defined extra attributes: %s", extended_attributes)
     try:
-        load_quantities_and_units(quantities, units, vspec.parent)
+        with stage("load_quantities_and_units"):
+            load_quantities_and_units(quantities, units, vspec.parent)
     except ModelValidationException as e:
         log.critical(e)
         exit(1)
@@ -210,44 +135,55 @@ def get_trees(
             unique_include_dirs.append(include_dir)
 
     try:
-        types_root = get_types_root(types, unique_include_dirs)
-        vspec_data = load_vspec(unique_include_dirs, [vspec] + list(overlays))
+        with stage("types") as s:
+            types_root = get_types_root(types, unique_include_dirs)
+            s.count(types_root)
+        with stage("load_vspec"):
+            vspec_data = load_vspec(unique_include_dirs, [vspec] + list(overlays))
     except (InvalidSpecDuplicatedEntryException, InvalidSpecException) as e:
         log.critical(e)
         exit(1)
 
-    root, orphans = build_tree(vspec_data.data, connect_orphans=True)
+    with stage("build_tree") as s:
+        root, orphans = build_tree(vspec_data.data, connect_orphans=True)
+        s.count(root)
 
     if orphans:
         log.error(f"Model has orphans\n{list(orphans.keys())}")
         exit(1)
 
     if expand:
-        root.expand_instances()
+        with stage("expand_instances") as s:
+            root.expand_instances()
+            s.count(root)
 
     try:
-        root.resolve()
+        with stage("resolve"):
+            root.resolve()
     except ModelValidationException as e:
         log.critical(e)
         exit(1)
 
-    root.delete_nodes(findall(root, filter_=lambda n: n.get_vss_data().delete))
-
-    validate_tree(root)
-
-    if types_root:
-        validate_tree(types_root)
-        try:
-            check_extra_attribute_violations(types_root, True, aborts, extended_attributes)
-        except (NameViolationException, ExtraAttributesException) as e:
-            log.critical(e)
-            exit(1)
+    # All rules are checked in a single pass, nodes marked for deletion
+    # are collected on the way and not validated.
+    # All findings are reported before aborting
+    deleted: list[VSSNode] = []
+    with stage("validate"):
+        rules = get_rules(strict, aborts, extended_attributes)
+        findings = validate(root, rules, deleted)
+        abort = report(rules, findings)
+        if types_root:
+            types_rules = get_types_rules(extended_attributes)
+            types_findings = validate(types_root, types_rules)
+            abort = report(types_rules, types_findings) or abort
+            findings += types_findings
 
-    try:
-        check_name_violations(root, strict, aborts)
-        check_extra_attribute_violations(root, strict, aborts, extended_attributes)
-    except (NameViolationException, ExtraAttributesException) as e:
-        log.critical(e)
+    if abort:
+        log.critical("Validation failed, findings=%d", len(findings))
         exit(1)
 
+    with stage("delete_nodes") as s:
+        root.delete_nodes(deleted)
+        s.count(root)
+
     return root, types_root
@@ -80,9 +80,7 @@ class VSSRaw(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     def get_extra_attributes(self) -> list[str]:
-        defined_fields = self.__class__.model_fields
-        additional_fields = set(self.model_dump().keys()) - set(defined_fields)
-        return list(additional_fields)
+        return list(self.__pydantic_extra__ or {})
 
     def as_dict(
         self,
@@ -433,7 +431,7 @@ def get_vss_raw(data: dict[str, Any], fqn: str | None) -> VSSRaw:
     try:
         model = resolve_vss_raw(model)
     except (ValidationError, ModelException):
-        log.debug(f"'{fqn}', incomplete, initialized as '{model.__class__.__name__}'")
+        log.debug("'%s', incomplete, initialized as '%s'", fqn, model.__class__.__name__)
         return model
     return model
 
@@ -443,5 +441,5 @@ def get_all_model_fields() -> list[str]:
     for c in TYPE_CLASS_MAP.values():
         for k in c.model_fields.keys():  # type: ignore
             fields.add(k)
-    log.debug(f"Core model, fields={len(fields)}")
+    log.debug("Core model, fields=%d", len(fields))
     return list(fields)
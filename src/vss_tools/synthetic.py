@@ -0,0 +1,354 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+# Generates synthetic vspec catalogs for benchmarking and scale testing
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any
+
+import rich_click as click
+import yaml
+from pydantic import BaseModel
+
+from vss_tools import log
+
+ROOT = "Vehicle"
+TYPES_ROOT = "Types"
+
+QUANTITIES = {
+    "length": {"definition": "Linear extent in space between any two points"},
+    "temperature": {"definition": "Partial derivative of internal energy with respect to entropy"},
+    "velocity": {"definition": "Rate of change of the position of an object"},
+    "voltage": {"definition": "Difference of electric potential"},
+    "relation": {"definition": "Relation between two physical quantities"},
+}
+
+UNITS = {
+    "km": {"definition": "Length in kilometers", "unit": "kilometer", "quantity": "length"},
+    "m": {"definition": "Length in meters", "unit": "meter", "quantity": "length"},
+    "celsius": {"definition": "Temperature in degree celsius", "unit": "degree celsius", "quantity": "temperature"},
+    "km/h": {"definition": "Speed in kilometers per hour", "unit": "kilometer per hour", "quantity": "velocity"},
+    "V": {"definition": "Voltage in volts", "unit": "volt", "quantity": "voltage"},
+    "percent": {"definition": "Relation in percent", "unit": "percent", "quantity": "relation"},
+}
+
+NUMERIC_DATATYPES = ["uint8", "int8", "uint16", "int16", "uint32", "int32", "float", "double"]
+LEAF_TYPES = ["sensor", "sensor", "actuator", "attribute"]
+
+# Maximum values of the numeric datatypes used for picking 'min' and 'max'
+NUMERIC_MAX = {
+    "uint8": 255,
+    "int8": 127,
+    "uint16": 65535,
+    "int16": 32767,
+    "uint32": 100000,
+    "int32": 100000,
+    "float": 100000,
+    "double": 100000,
+}
+
+
+class SyntheticSpec(BaseModel):
+    """
+    Paths of a generated synthetic catalog
+    """
+
+    vspec: Path
+    units: Path
+    quantities: Path
+    types: tuple[Path, ...] = ()
+    overlays: tuple[Path, ...] = ()
+    nodes: int = 0
+
+
+class Generator:
+    """
+    Generates a random, valid catalog.
+    Every generated tree is fully determined by the given parameters and the seed.
+    """
+
+    def __init__(
+        self,
+        nodes: int,
+        branching: int,
+        instance_density: float,
+        structs: int,
+        overlays: int,
+        include_depth: int,
+        seed: int,
+    ) -> None:
+        self.nodes = nodes
+        self.branching = max(branching, 1)
+        self.instance_density = instance_density
+        self.structs = structs
+        self.overlays = overlays
+        self.include_depth = include_depth
+        self.rng = random.Random(seed)
+        self.counters: dict[str, int] = {}
+        self.struct_names: list[str] = []
+        self.leaves: list[str] = []
+        self.size = 0
+
+    def next_name(self, prefix: str) -> str:
+        self.counters[prefix] = self.counters.get(prefix, 0) + 1
+        return f"{prefix}{self.counters[prefix]}"
+
+    def get_instances(self) -> Any:
+        choice = self.rng.randrange(3)
+        if choice == 0:
+            return f"Row[1,{self.rng.randint(2, 4)}]"
+        if choice == 1:
+            return ["Left", "Right"]
+        return [f"Row[1,{self.rng.randint(2, 3)}]", ["Left", "Right"]]
+
+    def get_leaf(self, use_struct: bool = True) -> tuple[str, dict[str, Any]]:
+        node: dict[str, Any] = {"type": self.rng.choice(LEAF_TYPES)}
+        kind = self.rng.random()
+        if kind < 0.1:
+            name = self.next_name("IsSignal")
+            node["datatype"] = "boolean"
+        elif kind < 0.2:
+            name = self.next_name("Signal")
+            node["datatype"] = "string"
+            node["allowed"] = [f"VALUE_{i}" for i in range(self.rng.randint(2, 6))]
+        elif kind < 0.3 and use_struct and self.struct_names:
+            name = self.next_name("Signal")
+            node["datatype"] = self.rng.choice(self.struct_names)
+        else:
+            name = self.next_name("Signal")
+            datatype = self.rng.choice(NUMERIC_DATATYPES)
+            node["datatype"] = datatype
+            if self.rng.random() < 0.6:
+                node["unit"] = self.rng.choice(list(UNITS.keys()))
+            if self.rng.random() < 0.1:
+                node["datatype"] = f"{datatype}[]"
+            elif self.rng.random() < 0.4:
+                node["min"] = 0
+                node["max"] = self.rng.randint(1, NUMERIC_MAX[datatype])
+                if node["type"] == "attribute":
+                    node["default"] = node["max"]
+        if self.rng.random() < 0.02:
+            node["deprecation"] = "Synthetic deprecation."
+        node["description"] = f"Synthetic {node['type']} {name}."
+        return name, node
+
+    def get_branch(self, instantiable: bool) -> tuple[str, dict[str, Any]]:
+        name = self.next_name("Branch")
+        node: dict[str, Any] = {"type": "branch", "description": f"Synthetic branch {name}."}
+        if instantiable and self.rng.random() < self.instance_density:
+            node["instances"] = self.get_instances()
+        return name, node
+
+    def generate_signals(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Generates the signal tree, grouped by top level branches.
+        Keys inside of a group are relative to the top level branch.
+        Branches with instances only get leaves to keep the expanded tree size predictable
+        """
+        groups: dict[str, dict[str, dict[str, Any]]] = {}
+        # Queue of (group, relative fqn, whether the branch has instances)
+        queue: list[tuple[str, str, bool]] = []
+        count = 1
+        for _ in range(self.branching):
+            name, data = self.get_branch(False)
+            groups[name] = {"": data}
+            queue.append((name, "", False))
+            count += 1
+
+        while count < self.nodes:
+            group, fqn, instances = queue.pop(0) if queue else (self.rng.choice(list(groups)), "", False)
+            for i in range(self.branching):
+                if count >= self.nodes:
+                    break
+                # Keep at least one branch to continue with
+                if not instances and ((i == 0 and not queue) or self.rng.random() < 1 / self.branching):
+                    name, data = self.get_branch(True)
+                    queue.append((group, f"{fqn}.{name}".lstrip("."), "instances" in data))
+                else:
+                    name, data = self.get_leaf()
+                    self.leaves.append(f"{ROOT}.{group}.{fqn}.{name}".replace("..", "."))
+                groups[group][f"{fqn}.{name}".lstrip(".")] = data
+                count += 1
+        self.size = count
+        return groups
+
+    def generate_types(self) -> dict[str, dict[str, Any]]:
+        types: dict[str, dict[str, Any]] = {
+            TYPES_ROOT: {"type": "branch", "description": "Synthetic data types."},
+        }
+        for _ in range(self.structs):
+            struct = f"{TYPES_ROOT}.{self.next_name('Struct')}"
+            types[struct] = {"type": "struct", "description": f"Synthetic struct {struct}."}
+            for _ in range(self.rng.randint(1, 5)):
+                name, data = self.get_leaf(use_struct=False)
+                data["type"] = "property"
+                if self.struct_names and self.rng.random() < 0.2:
+                    # Nested struct
+                    data = {"type": "property", "datatype": self.rng.choice(self.struct_names)}
+                    data["description"] = f"Nested struct {name}."
+                types[f"{struct}.{name}"] = data
+            self.struct_names.append(struct)
+        return types
+
+    def generate_overlay(self, level: int) -> dict[str, dict[str, Any]]:
+        overlay: dict[str, dict[str, Any]] = {}
+        for fqn in self.rng.sample(self.leaves, min(len(self.leaves), max(1, len(self.leaves) // 10))):
+            overlay[fqn] = {"description": f"Overlay {level} description."}
+        branch = f"{ROOT}.Overlay{level}"
+        overlay[branch] = {"type": "branch", "description": f"Branch added by overlay {level}."}
+        for _ in range(self.branching):
+            name, data = self.get_leaf()
+            overlay[f"{branch}.{name}"] = data
+        return overlay
+
+    def write(self, target: Path) -> SyntheticSpec:
+        target.mkdir(parents=True, exist_ok=True)
+
+        quantities = target / "quantities.yaml"
+        write_yaml(quantities, QUANTITIES)
+        units = target / "units.yaml"
+        write_yaml(units, {k: {**v, "allowed-datatypes": ["numeric"]} for k, v in UNITS.items()})
+
+        types: tuple[Path, ...] = ()
+        if self.structs:
+            types = (target / "types.vspec",)
+            write_yaml(types[0], self.generate_types())
+
+        groups = self.generate_signals()
+        vspec = target / "main.vspec"
+        entries = {ROOT: {"type": "branch", "description": "Synthetic root."}}
+        for group, group_entries in groups.items():
+            entries[f"{ROOT}.{group}"] = group_entries.pop("")
+            entries.update({f"{ROOT}.{group}.{k}": v for k, v in group_entries.items()})
+        write_includes(target, Path(vspec.name), Path("."), entries, 1, self.include_depth)
+
+        overlays = []
+        for level in range(1, self.overlays + 1):
+            overlay = target / f"overlay_{level}.vspec"
+            write_yaml(overlay, self.generate_overlay(level))
+            overlays.append(overlay)
+
+        log.info("Synthetic spec generated, dir=%s, nodes=%d", target, self.size)
+        return SyntheticSpec(
+            vspec=vspec,
+            units=units,
+            quantities=quantities,
+            types=types,
+            overlays=tuple(overlays),
+            nodes=self.size,
+        )
+
+
+def write_entries(f: Any, entries: dict[str, Any]) -> None:
+    yaml.safe_dump(entries, f, sort_keys=False, width=120)
+    f.write("\n")
+
+
+def write_yaml(path: Path, entries: dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        write_entries(f, entries)
+
+
+def write_includes(target: Path, path: Path, directory: Path, entries: dict[str, Any], level: int, depth: int) -> None:
+    """
+    Writes entries into 'path' (relative to target).
+    Branches on the given level (amount of separators in their key) are moved
+    into their own files in 'directory' and get included until 'depth' is reached.
+    Keys of included files are relative to their branch
+    """
+    children = []
+    if depth > 0:
+        children = [k for k, v in entries.items() if k.count(".") == level and v.get("type") == "branch"]
+
+    nested: dict[str, dict[str, Any]] = {c: {} for c in children}
+    own = {}
+    for k, v in entries.items():
+        child = next((c for c in children if k.startswith(f"{c}.")), None)
+        if child:
+            nested[child][k.removeprefix(f"{child}.")] = v
+        else:
+            own[k] = v
+
+    with open(target / path, "w") as f:
+        write_entries(f, {k: v for k, v in own.items() if k not in nested})
+        for child, child_entries in nested.items():
+            name = child.split(".")[-1]
+            include = directory / f"{name}.vspec"
+            write_entries(f, {child: own[child]})
+            f.write(f"#include {include.as_posix()} {child}\n\n")
+            (target / directory).mkdir(parents=True, exist_ok=True)
+            write_includes(target, include, directory / name, child_entries, 0, depth - 1)
+
+
+def generate(
+    target: Path,
+    nodes: int = 1000,
+    branching: int = 5,
+    instance_density: float = 0.05,
+    structs: int = 10,
+    overlays: int = 0,
+    include_depth: int = 1,
+    seed: int = 0,
+) -> SyntheticSpec:
+    """
+    Generates a synthetic catalog into the target directory.
+    'nodes' is the size of the unexpanded signal tree (without overlays)
+    """
+    return Generator(nodes, branching, instance_density, structs, overlays, include_depth, seed).write(target)
+
+
+@click.command()
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    required=True,
+    help="Output directory.",
+)
+@click.option("--nodes", "-n", type=click.IntRange(min=1), default=1000, show_default=True, help="Target node count.")
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed of the random generator.")
+@click.option("--branching", type=click.IntRange(min=1), default=5, show_default=True, help="Children per branch.")
+@click.option(
+    "--instance-density",
+    type=click.FloatRange(min=0, max=1),
+    default=0.05,
+    show_default=True,
+    help="Share of branches with instances.",
+)
+@click.option("--structs", type=click.IntRange(min=0), default=10, show_default=True, help="Amount of structs.")
+@click.option("--overlays", type=click.IntRange(min=0), default=0, show_default=True, help="Amount of overlays.")
+@click.option(
+    "--include-depth",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Branch levels split into separate files via '#include', 0 writes a single 'main.vspec'.",
+)
+def cli(
+    output_dir: Path,
+    nodes: int,
+    seed: int,
+    branching: int,
+    instance_density: float,
+    structs: int,
+    overlays: int,
+    include_depth: int,
+):
+    """
+    Generate a synthetic vspec catalog for scale testing.
+    """
+    spec = generate(output_dir, nodes, branching, instance_density, structs, overlays, include_depth, seed)
+    cmd = f"vspec export <exporter> -s {spec.vspec} -u {spec.units} -q {spec.quantities}"
+    for types in spec.types:
+        cmd += f" -t {types}"
+    for overlay in spec.overlays:
+        cmd += f" -l {overlay}"
+    log.info("Usage: %s", cmd)
@@ -0,0 +1,180 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from __future__ import annotations
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from pydantic import BaseModel
+from rich.console import Console
+from rich.table import Table
+
+from vss_tools import log
+
+if TYPE_CHECKING:
+    from vss_tools.tree import VSSNode
+
+
+class StageTiming(BaseModel):
+    """
+    Measurement of a single (possibly nested) processing stage
+    """
+
+    name: str
+    depth: int = 0
+    wall_time: float = 0.0
+    nodes: int | None = None
+    peak_memory: int | None = None
+
+
+class TimingsReport(BaseModel):
+    stages: list[StageTiming] = []
+
+
+class Stage:
+    """
+    Handle of a running stage.
+    Allows to attach the node count of the tree the stage worked on
+    """
+
+    def __init__(self, timing: StageTiming | None = None) -> None:
+        self.timing = timing
+
+    def count(self, root: VSSNode | None) -> None:
+        """
+        Records the size of the given tree.
+        Only counts when timings are collected
+        """
+        if self.timing is not None and root is not None:
+            self.timing.nodes = root.size
+
+
+class Timings:
+    """
+    Collects wall time, node counts and peak memory of nested stages
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.report = TimingsReport()
+        self._open: list[StageTiming] = []
+
+    def _traced_peak(self) -> int:
+        return tracemalloc.get_traced_memory()[1]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        timing = StageTiming(name=name, depth=len(self._open))
+        self.report.stages.append(timing)
+        if self.trace_memory:
+            # The peak is reset for every stage, parents keep the maximum of their children
+            if self._open:
+                parent = self._open[-1]
+                parent.peak_memory = max(parent.peak_memory or 0, self._traced_peak())
+            tracemalloc.reset_peak()
+            timing.peak_memory = 0
+        self._open.append(timing)
+        start = time.perf_counter()
+        try:
+            yield Stage(timing)
+        finally:
+            timing.wall_time = time.perf_counter() - start
+            self._open.pop()
+            if self.trace_memory:
+                timing.peak_memory = max(timing.peak_memory or 0, self._traced_peak())
+                if self._open:
+                    parent = self._open[-1]
+                    parent.peak_memory = max(parent.peak_memory or 0, timing.peak_memory)
+                tracemalloc.reset_peak()
+
+    def get_table(self) -> Table:
+        table = Table(title="Timings")
+        table.add_column("Stage")
+        table.add_column("Wall time [s]", justify="right")
+        table.add_column("Nodes", justify="right")
+        if self.trace_memory:
+            table.add_column("Peak memory [MiB]", justify="right")
+        for timing in self.report.stages:
+            row = ["  " * timing.depth + timing.name, f"{timing.wall_time:.3f}"]
+            row.append("" if timing.nodes is None else str(timing.nodes))
+            if self.trace_memory:
+                row.append("" if timing.peak_memory is None else f"{timing.peak_memory / 2**20:.1f}")
+            table.add_row(*row)
+        return table
+
+    def print(self) -> None:
+        Console(stderr=True).print(self.get_table())
+
+    def write_json(self, path: Path) -> None:
+        path.write_text(self.report.model_dump_json(indent=2))
+        log.info("Timings written to %s", path)
+
+
+# Collector of the current context, threads started inside of a collection do not record into it
+_active: ContextVar[Timings | None] = ContextVar("timings", default=None)
+
+
+@contextmanager
+def collect(trace_memory: bool = False) -> Iterator[Timings]:
+    """
+    Activates timing collection for everything run inside of the context.
+    With 'trace_memory', the peak memory of every stage is traced with tracemalloc,
+    which slows down the measured stages considerably.
+
+    Example:
+        with collect() as timings:
+            get_trees(vspec)
+        timings.print()
+    """
+    timings = Timings(trace_memory)
+    started_tracing = False
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started_tracing = True
+    token = _active.set(timings)
+    try:
+        yield timings
+    finally:
+        _active.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[Stage]:
+    """
+    Records a stage into the active collector.
+    A no-op if no collection is active
+    """
+    active = _active.get()
+    if active is None:
+        yield Stage()
+        return
+    with active.stage(name) as s:
+        yield s
+
+
+@contextmanager
+def profiled(path: Path) -> Iterator[cProfile.Profile]:
+    """
+    Runs everything inside of the context with cProfile
+    and dumps the stats into the given file
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        log.info("Profile written to %s", path)
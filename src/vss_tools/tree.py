@@ -7,9 +7,10 @@
 # SPDX-License-Identifier: MPL-2.0
 from __future__ import annotations
 
+import logging
 import re
 from copy import deepcopy
-from typing import Any
+from typing import Any, Callable, Iterator, Sequence
 
 from anytree import Node, PreOrderIter, find, findall
 from pydantic import ValidationError
@@ -27,9 +28,11 @@ from vss_tools.model import (
     get_vss_raw,
     resolve_vss_raw,
 )
+from vss_tools.timings import stage
 from vss_tools.vspec import deep_update
 
 SEPARATOR = "."
+CAMEL_CASE_PATTERN = re.compile("[A-Z][A-Za-z0-9]*$")
 
 
 class NoInstanceRootException(Exception):
@@ -88,11 +91,13 @@ class VSSNode(Node):  # type: ignore[misc]
         Updating the data fqn when getting reattached.
         We need the fqn in the data for validation purposes.
         """
-        log.debug(f"Got attached to parent='{parent.get_fqn()}', new fqn='{self.get_fqn()}'")
         self.data.fqn = self.get_fqn(SEPARATOR)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Got attached to parent='%s', new fqn='%s'", parent.get_fqn(), self.data.fqn)
 
     def _post_detach(self, parent: VSSNode):
-        log.debug(f"'{self.get_fqn()}', detached from parent='{parent.get_fqn()}'")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("'%s', detached from parent='%s'", self.get_fqn(), parent.get_fqn())
 
     def get_vss_data(self) -> VSSData:
         if not isinstance(self.data, VSSData):
@@ -117,7 +122,8 @@ class VSSNode(Node):  # type: ignore[misc]
     def get_child(self, fqn: str) -> VSSNode | None:
         for child in self.children:
             if child.get_fqn() == fqn:
-                log.debug(f"{self.get_fqn()}, found child='{child.get_fqn()}'")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("%s, found child='%s'", self.get_fqn(), fqn)
                 return child
         return None
 
@@ -127,15 +133,17 @@ class VSSNode(Node):  # type: ignore[misc]
         The data of the other node has priority.
         Also merges children if their fqn matches recursively
         """
-        if self.get_fqn() != other.get_fqn():
-            raise NotMergeableException(f"{self.get_fqn()} != {other.get_fqn()}")
+        fqn = self.get_fqn()
+        other_fqn = other.get_fqn()
+        if fqn != other_fqn:
+            raise NotMergeableException(f"{fqn} != {other_fqn}")
 
-        log.debug(f"{self.get_fqn()}, merging with='{other.get_fqn()}'")
+        log.debug("%s, merging with='%s'", fqn, other_fqn)
         self_data = self.data.as_dict(exclude_fields=["fqn"])
         other_data = other.data.as_dict(exclude_fields=["fqn"])
 
         deep_update(self_data, other_data)
-        self.data = get_vss_raw(self_data, self.get_fqn())
+        self.data = get_vss_raw(self_data, fqn)
 
         child: VSSNode
         for child in other.children:
@@ -168,7 +176,7 @@ class VSSNode(Node):  # type: ignore[misc]
         """
         connected = self.get_node_with_fqn(fqn)
         if connected:
-            log.debug(f"Already connected: {fqn}")
+            log.debug("Already connected: %s", fqn)
             return connected
         target_fqn = get_expected_parent(fqn)
         if not target_fqn:
@@ -196,13 +204,15 @@ class VSSNode(Node):  # type: ignore[misc]
         instance_node: VSSNode
         iterations = 0
         n_instance_nodes = 0
+        debug = log.isEnabledFor(logging.DEBUG)
         # We need to setup a loop here since it could be that
         # we add nodes that again have instances configured
         while instance_nodes:
             n_instance_nodes += len(instance_nodes)
             iterations += 1
             for instance_node in instance_nodes:
-                log.debug(f"'{instance_node.get_fqn()}', expanding...")
+                if debug:
+                    log.debug("'%s', expanding...", instance_node.get_fqn())
                 # Copy the reference node for creating instances
                 instance_node_copy = deepcopy(instance_node)
 
@@ -216,19 +226,22 @@ class VSSNode(Node):  # type: ignore[misc]
                 # Remove children from copy that should not be instantiatet
                 for child in instance_node_copy.children:
                     if not getattr(child.data, "instantiate", True):
-                        log.debug(f"'{child.get_fqn()}', removing from copy (instantiate=False)")
+                        if debug:
+                            log.debug("'%s', removing from copy (instantiate=False)", child.get_fqn())
                         child.parent = None
 
                 # Remove children from instance node that need to be put on created instances instead
                 for child in instance_node.children:
                     if getattr(child.data, "instantiate", True):
-                        log.debug(f"'{child.get_fqn()}', removing from node (instantiate=True)")
+                        if debug:
+                            log.debug("'%s', removing from node (instantiate=True)", child.get_fqn())
                         child.parent = None
 
                 # Roots to attach generated nodes
                 # Initialized with the instance node itself
                 roots = [instance_node]
-                log.debug(f"Roots: {[r.get_fqn() for r in roots]}")
+                if debug:
+                    log.debug("Roots: %s", [r.get_fqn() for r in roots])
 
                 # We want to keep track of generated nodes
                 # in order to append common original children
@@ -254,39 +267,30 @@ class VSSNode(Node):  # type: ignore[misc]
                 instance_node.data.instances = []  # type: ignore
             instance_nodes = self.get_instance_nodes()
         if iterations:
-            log.debug(f"Instances, iterations={iterations}, nodes={n_instance_nodes}")
+            log.debug("Instances, iterations=%d, nodes=%d", iterations, n_instance_nodes)
 
-    def delete_nodes(self, nodes: tuple[VSSNode]) -> None:
+    def delete_nodes(self, nodes: Sequence[VSSNode]) -> None:
         """
         Deleting given nodes.
         It is not checked whether nodes are reachable from self!
         """
         size_before = self.size
         for node in nodes:
-            log.debug(f"Deleting node: {node}")
+            log.debug("Deleting node: %s", node)
             node.parent = None
         size_after = self.size
         if nodes:
-            log.info(f"Nodes deleted, given={len(nodes)}, overall={size_before - size_after}")
+            log.info("Nodes deleted, given=%d, overall=%d", len(nodes), size_before - size_after)
 
     def get_naming_violations(self) -> list[list[str]]:
         """
         Gets a list of nodes that are violating the naming conventions
         It returns a list of fqn's and their violation reason
         """
-        violations = []
-        log.debug(f"Checking node name compliance for {self.name}")
-        camel_case_pattern = re.compile("[A-Z][A-Za-z0-9]*$")
-        for node in PreOrderIter(self):
-            match = re.match(camel_case_pattern, node.name)
-            if not match:
-                violations.append([node.get_fqn(), "not CamelCase"])
-            if isinstance(node.data, VSSDataDatatype):
-                if node.data.datatype == Datatypes.BOOLEAN[0]:
-                    if not node.name.startswith("Is") and not node.name.startswith("Has"):
-                        violations.append([node.get_fqn(), "Not starting with 'Is' or 'Has'"])
+        log.debug("Checking node name compliance for %s", self.name)
+        violations = [[fqn, v] for node, fqn in walk(self) for v in get_name_violations(node)]
         if violations:
-            log.info(f"Naming violations: {len(violations)}")
+            log.info("Naming violations: %d", len(violations))
         return violations
 
     def get_extra_attributes(self, allowed: tuple[str, ...]) -> list[list[str]]:
@@ -294,13 +298,11 @@ class VSSNode(Node):  # type: ignore[misc]
         Gets a list of attributes that are not in the vss model
         and not explicitly allowed in the given list
         """
-        violations = []
-        for node in PreOrderIter(self):
-            for field in node.data.get_extra_attributes():
-                if field not in allowed:
-                    violations.append([node.get_fqn(), field])
+        violations: list[list[str]] = []
+        for node, fqn in walk(self):
+            violations.extend([fqn, field] for field in node.data.get_extra_attributes() if field not in allowed)
         if violations:
-            log.warning(f"Attributes, violations={len(violations)}")
+            log.warning("Attributes, violations=%d", len(violations))
         return violations
 
     def as_flat_dict(self, with_extra_attributes: bool, extended_attributes: tuple[str, ...] = ()) -> dict[str, Any]:
@@ -343,6 +345,40 @@ class VSSNode(Node):  # type: ignore[misc]
         return 0
 
 
+def walk(
+    root: VSSNode, deleted: list[VSSNode] | None = None, descend: Callable[[VSSNode], bool] | None = None
+) -> Iterator[tuple[VSSNode, str]]:
+    """
+    Pre-order traversal yielding nodes with their fqn, computed incrementally.
+    If a 'deleted' list is given, nodes marked for deletion are collected there
+    and their subtree is skipped.
+    'descend' is called for every node after it got yielded, returning False skips its children
+    """
+    stack: list[tuple[VSSNode, str]] = [(root, root.name)]
+    while stack:
+        node, fqn = stack.pop()
+        if deleted is not None and getattr(node.data, "delete", False):
+            deleted.append(node)
+            continue
+        yield node, fqn
+        if descend is None or descend(node):
+            stack.extend((child, f"{fqn}{SEPARATOR}{child.name}") for child in reversed(node.children))
+
+
+def get_name_violations(node: VSSNode) -> list[str]:
+    """
+    Naming convention violations of a single node:
+    names need to be CamelCase and boolean signals need to start with 'Is' or 'Has'
+    """
+    violations = []
+    if not CAMEL_CASE_PATTERN.match(node.name):
+        violations.append("not CamelCase")
+    if isinstance(node.data, VSSDataDatatype) and node.data.datatype == Datatypes.BOOLEAN[0]:
+        if not node.name.startswith("Is") and not node.name.startswith("Has"):
+            violations.append("Not starting with 'Is' or 'Has'")
+    return violations
+
+
 def get_expected_parent(name: str) -> str | None:
     """
     Returns the parent of a given fqn
@@ -389,7 +425,9 @@ def add_expanded_instance_children(roots: list[VSSNode], instance_root: VSSNode,
         if not match:
             add.append(child)
 
-    log.debug(f"Add to instances: {[n.get_fqn() for n in add]}")
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
+        log.debug("Add to instances: %s", [n.get_fqn() for n in add])
 
     # Adding them..
     for root in roots:
@@ -406,7 +444,8 @@ def add_expanded_instance_children(roots: list[VSSNode], instance_root: VSSNode,
         if match:
             change.append([match, child])
 
-    log.debug(f"Change nodes: {[n[0].get_fqn() for n in change]}")
+    if debug:
+        log.debug("Change nodes: %s", [n[0].get_fqn() for n in change])
 
     for nodes in change:
         target = nodes[0]
@@ -445,11 +484,11 @@ def expand_instance(
     # Node names can be given with a range syntax
     # such as Foo[1,2]asdf
     # We expand them here
-    log.debug(f"Requested instances: {requested_instances}")
+    log.debug("Requested instances: %s", requested_instances)
     for i in requested_instances:
         names.extend(expand_string(str(i)))
     nodes = []
-    log.debug(f"Requested instance names: {names}")
+    log.debug("Requested instance names: %s", names)
     for name in names:
         for root in roots:
             # Need to copy the template so that we
@@ -524,18 +563,20 @@ def build_tree(data: dict[str, Any], connect_orphans: bool = False) -> tuple[VSS
 
     root: VSSNode = roots[0]
     if connect_orphans:
-        connected_fqns = []
-        for fqn, orphan in orphans.items():
-            connected = root.connect(fqn, orphan)
-            if connected:
-                connected_fqns.append(fqn)
-        for fqn in connected_fqns:
-            del orphans[fqn]
+        with stage("connect_orphans"):
+            connected_fqns = []
+            for fqn, orphan in orphans.items():
+                connected = root.connect(fqn, orphan)
+                if connected:
+                    connected_fqns.append(fqn)
+            for fqn in connected_fqns:
+                del orphans[fqn]
 
     if orphans:
-        log.warning(f"Orphans: {len(orphans)}")
+        log.warning("Orphans: %d", len(orphans))
 
-    log.debug(f"Tree, root='{root.name}', size={root.size}, height={root.height}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Tree, root='%s', size=%d, height=%d", root.name, root.size, root.height)
     return root, orphans
 
 
@@ -607,7 +648,7 @@ def add_node_schema(root: VSSNode, fqn: str, schema: dict[str, Any]) -> None:
                     if d:
                         datatype = d[0]
                 if datatype:
-                    log.debug(f"Datatype: {datatype}")
+                    log.debug("Datatype: %s", datatype)
                     if array:
                         properties[child.name] = {"type": "array", "items": {"type": datatype}}
                     else:
@@ -0,0 +1,177 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from vss_tools import log
+from vss_tools.model import (
+    VSSDataBranch,
+    VSSDataProperty,
+    VSSDataStruct,
+    get_all_model_fields,
+)
+from vss_tools.tree import VSSNode, get_name_violations, walk
+
+
+class Finding(BaseModel):
+    """
+    A single violation found by a rule
+    """
+
+    rule: str
+    fqn: str
+    msg: str
+    level: int = logging.WARNING
+    abort: bool = False
+
+
+class Rule(ABC):
+    """
+    Base class of validation rules.
+    'check' is called once for every node during a single tree traversal
+    """
+
+    name = "rule"
+
+    @abstractmethod
+    def check(self, node: VSSNode, fqn: str) -> Iterator[Finding]:
+        """
+        Findings of a single node
+        """
+
+    def report(self, findings: list[Finding]) -> None:
+        for finding in findings:
+            log.log(finding.level, finding.msg)
+
+
+class ParentRule(Rule):
+    """
+    All nodes need 'branch' parents except 'properties' and 'structs'.
+    Properties need a 'struct' as a parent.
+    Structs need a 'struct' or 'branch' as a parent
+    """
+
+    name = "parent"
+
+    def check(self, node: VSSNode, fqn: str) -> Iterator[Finding]:
+        if node.parent is None:
+            return
+        parent_data = node.parent.data
+        if isinstance(node.data, VSSDataProperty):
+            ok = isinstance(parent_data, VSSDataStruct)
+        elif isinstance(node.data, VSSDataStruct):
+            ok = isinstance(parent_data, (VSSDataStruct, VSSDataBranch))
+        else:
+            ok = isinstance(parent_data, VSSDataBranch)
+        if not ok:
+            msg = f"'{fqn} ({node.data.__class__.__name__})',"
+            msg += f" invalid parent: '{parent_data.__class__.__name__}'"
+            yield Finding(rule=self.name, fqn=fqn, msg=msg, level=logging.CRITICAL, abort=True)
+
+    def report(self, findings: list[Finding]) -> None:
+        log.critical("Invalid nodes=%d", len(findings))
+        super().report(findings)
+
+
+class NamingRule(Rule):
+    """
+    Checks the naming conventions: CamelCase names and
+    boolean signals starting with 'Is' or 'Has'
+    """
+
+    name = "name-style"
+
+    def __init__(self, abort: bool = True) -> None:
+        self.abort = abort
+
+    def check(self, node: VSSNode, fqn: str) -> Iterator[Finding]:
+        for violation in get_name_violations(node):
+            yield Finding(rule=self.name, fqn=fqn, msg=f"Name violation: '{fqn}' ({violation})", abort=self.abort)
+
+    def report(self, findings: list[Finding]) -> None:
+        log.info("Naming violations: %d", len(findings))
+        super().report(findings)
+
+
+class ExtraAttributeRule(Rule):
+    """
+    Checks for attributes that are not in the vss model
+    and not explicitly allowed.
+    Extra attributes shadowing core attributes always abort
+    """
+
+    name = "unknown-attribute"
+
+    def __init__(self, allowed: tuple[str, ...] = (), abort: bool = False) -> None:
+        self.allowed = set(allowed)
+        self.abort = abort
+        self.core_fields = set(get_all_model_fields())
+
+    def get_extra_attributes(self, node: VSSNode) -> list[str]:
+        return [field for field in node.data.get_extra_attributes() if field not in self.allowed]
+
+    def check(self, node: VSSNode, fqn: str) -> Iterator[Finding]:
+        for field in self.get_extra_attributes(node):
+            msg = f"Unknown extra attribute: '{fqn}':'{field}'"
+            yield Finding(rule=self.name, fqn=fqn, msg=msg, abort=self.abort)
+            if field in self.core_fields:
+                msg = f"Forbidden extra attribute (core attribute): '{fqn}':'{field}'"
+                yield Finding(rule=self.name, fqn=fqn, msg=msg, level=logging.CRITICAL, abort=True)
+
+    def report(self, findings: list[Finding]) -> None:
+        log.warning("Attributes, violations=%d", len(findings))
+        super().report(findings)
+
+
+def validate(root: VSSNode, rules: list[Rule], deleted: list[VSSNode] | None = None) -> list[Finding]:
+    """
+    Runs all rules in a single traversal and returns all findings
+    """
+    findings: list[Finding] = []
+    for node, fqn in walk(root, deleted):
+        for rule in rules:
+            findings.extend(rule.check(node, fqn))
+    return findings
+
+
+def report(rules: list[Rule], findings: list[Finding]) -> bool:
+    """
+    Logs findings grouped by rule.
+    Returns whether any of the findings requires to abort
+    """
+    by_rule: dict[str, list[Finding]] = defaultdict(list)
+    for finding in findings:
+        by_rule[finding.rule].append(finding)
+    for rule in rules:
+        if by_rule.get(rule.name):
+            rule.report(by_rule[rule.name])
+    return any(finding.abort for finding in findings)
+
+
+def get_rules(strict: bool, aborts: tuple[str, ...], extended_attributes: tuple[str, ...]) -> list[Rule]:
+    """
+    Rules for the signal tree depending on the given abort configuration
+    """
+    rules: list[Rule] = [ParentRule()]
+    if strict or NamingRule.name in aborts:
+        rules.append(NamingRule())
+    rules.append(ExtraAttributeRule(extended_attributes, strict or ExtraAttributeRule.name in aborts))
+    return rules
+
+
+def get_types_rules(extended_attributes: tuple[str, ...]) -> list[Rule]:
+    """
+    Rules for the types tree. Unknown attributes always abort
+    """
+    return [ParentRule(), ExtraAttributeRule(extended_attributes, True)]
@@ -53,7 +53,7 @@ class Include:
         for dir in include_dirs:
             path = dir / self.target
             if path.exists():
-                log.debug(f"'{self.statement}', resolved={path}")
+                log.debug("'%s', resolved=%s", self.statement, path)
                 return path
         raise IncludeNotFoundException(f"Unable to find include {self.target}. Include dirs: {include_dirs}")
 
@@ -127,7 +127,7 @@ def load_vspec(include_dirs: list[Path], specs: list[Path], identifier: str | No
     pre = "VSpecs"
     if identifier:
         pre += f" ({identifier})"
-    log.info(f"{pre} loaded, amount={len(vspecs)}")
+    log.info("%s loaded, amount=%d", pre, len(vspecs))
     for vspec in vspecs:
         log.debug(vspec)
         if spec is None:
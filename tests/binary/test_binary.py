@@ -9,6 +9,10 @@
 import subprocess
 from pathlib import Path
 
+import pytest
+from vss_tools.binary_reader import BinaryFormatException, BinaryTree, IndexedTree, open_tree
+from vss_tools.model import NodeType
+
 HERE = Path(__file__).resolve().parent
 TEST_UNITS = HERE / ".." / "vspec" / "test_units.yaml"
 TEST_QUANT = HERE / ".." / "vspec" / "test_quantities.yaml"
@@ -44,3 +48,89 @@ def test_binary(tmp_path):
     for parser in parsers:
         check_expected_for_tool(parser, "A.String", "Node type=SENSOR", test_binary)
         check_expected_for_tool(parser, "A.Int", "Node type=ACTUATOR", test_binary)
+
+
+def test_binary_output(tmp_path):
+    """
+    Tests that the generated binary stays byte-identical to what the parsers expect
+    """
+    test_binary = tmp_path / "test.binary"
+    cmd = f"vspec export binary -u {TEST_UNITS}"
+    cmd += f" -q {TEST_QUANT} -s {HERE / 'test.vspec'} -o {test_binary}"
+    subprocess.run(cmd.split(), check=True)
+    assert test_binary.read_bytes() == (HERE / "expected.binary").read_bytes()
+
+
+def test_binary_indexed(tmp_path):
+    """
+    Tests the indexed format (v2) with the python reader
+    """
+    test_binary = tmp_path / "test.binary"
+    cmd = f"vspec export binary --format v2 -u {TEST_UNITS}"
+    cmd += f" -q {TEST_QUANT} -s {HERE / 'test.vspec'} -o {test_binary}"
+    subprocess.run(cmd.split(), check=True)
+
+    with IndexedTree(test_binary) as tree:
+        assert len(tree) == 3
+        assert [node.fqn for node in tree.iter()] == ["A", "A.String", "A.Int"]
+        node = tree.find("A.Int")
+        assert node is not None
+        assert node.type == NodeType.ACTUATOR
+        assert node.datatype == "uint16"
+        assert node.description == "An int"
+        assert node.parent == tree.root
+        assert tree.find("A.Foo") is None
+        assert tree.find("Int") is None
+
+    with pytest.raises(BinaryFormatException):
+        IndexedTree(HERE / "expected.binary")
+
+
+def test_binary_reader():
+    """
+    Tests reading the default format (v1)
+    """
+    with open_tree(HERE / "expected.binary") as tree:
+        assert isinstance(tree, BinaryTree)
+        assert len(tree) == 3
+        assert [node.fqn for node in tree.iter()] == ["A", "A.String", "A.Int"]
+        node = tree.find("A.String")
+        assert node is not None
+        assert node.type == NodeType.SENSOR
+        assert node.datatype == "string"
+        assert node.description == "A string"
+        assert tree.find("A.Foo") is None
+
+        root = tree.to_vss_node()
+        assert [child.get_fqn() for child in root.children] == ["A.String", "A.Int"]
+        assert root.children[1].get_vss_data().as_dict() == {
+            "type": "actuator",
+            "description": "An int",
+            "datatype": "uint16",
+        }
+
+
+@pytest.mark.parametrize("binary_format", ["v1", "v2"])
+def test_binary_reader_non_ascii(tmp_path, binary_format: str):
+    """
+    v2 stores byte lengths, v1 stores character lengths and truncates multibyte strings
+    """
+    vspec = tmp_path / "test.vspec"
+    vspec.write_text(
+        "A:\n  type: branch\n  description: Branch A.\n\n"
+        "A.Temperature:\n  datatype: float\n  type: sensor\n  description: Temperature in °\n",
+        encoding="utf-8",
+    )
+    test_binary = tmp_path / "test.binary"
+    cmd = f"vspec export binary --format {binary_format} -u {TEST_UNITS}"
+    cmd += f" -q {TEST_QUANT} -s {vspec} -o {test_binary}"
+    subprocess.run(cmd.split(), check=True)
+
+    with open_tree(test_binary) as tree:
+        node = tree.find("A.Temperature")
+        assert node is not None
+        if binary_format == "v2":
+            assert node.description == "Temperature in °"
+        else:
+            assert node.description.startswith("Temperature in ")
+        assert node.datatype == "float"
@@ -0,0 +1,29 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from typing import Any, Callable
+
+import pytest
+from vss_tools.tree import VSSNode, build_tree
+
+
+@pytest.fixture
+def make_tree() -> Callable[..., VSSNode]:
+    """
+    Factory of resolved trees from flat vspec data, e.g. {"A": {...}, "A.B": {...}}.
+    All nodes need to be connected to the root
+    """
+
+    def make(data: dict[str, Any], expand_instances: bool = False) -> VSSNode:
+        root, orphans = build_tree(data)
+        assert not orphans
+        root.resolve()
+        if expand_instances:
+            root.expand_instances()
+        return root
+
+    return make
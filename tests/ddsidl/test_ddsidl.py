@@ -0,0 +1,39 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from io import StringIO
+from pathlib import Path
+
+from vss_tools.exporters.ddsidl import IDLExporter
+from vss_tools.main import get_trees
+
+HERE = Path(__file__).resolve().parent
+TEST_UNITS = HERE / ".." / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / ".." / "vspec" / "test_quantities.yaml"
+
+
+def export(exporter: IDLExporter, root) -> str:
+    out = StringIO()
+    exporter.export(out, root)
+    return out.getvalue()
+
+
+def test_ddsidl_exporter_reentrant():
+    """
+    Exports are independent of each other, also when running interleaved
+    """
+    root, _ = get_trees(vspec=HERE / "test.vspec", units=(TEST_UNITS,), quantities=(TEST_QUANT,))
+
+    first = export(IDLExporter(), root)
+    assert "module A" in first
+    assert first == export(IDLExporter(), root)
+
+    all_features = export(IDLExporter(True), root)
+    assert all_features != first
+    interleaved = list(zip(IDLExporter().lines(root), IDLExporter(True).lines(root)))
+    assert "\n".join(line for line, _ in interleaved) == first
+    assert "\n".join(line for _, line in interleaved) == all_features
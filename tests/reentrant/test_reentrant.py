@@ -0,0 +1,84 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from vss_tools.exporters.graphql import GraphQLExporter
+from vss_tools.exporters.samm import export_samm
+from vss_tools.main import get_trees
+from vss_tools.tree import VSSNode
+
+HERE = Path(__file__).resolve().parent
+TEST_DIR = HERE / ".." / "vspec" / "test_instances"
+TEST_UNITS = HERE / ".." / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / ".." / "vspec" / "test_quantities.yaml"
+
+
+def get_tree() -> VSSNode:
+    tree, _ = get_trees(vspec=TEST_DIR / "test.vspec", units=(TEST_UNITS,), quantities=(TEST_QUANT,), expand=False)
+    return tree
+
+
+def get_files(folder: Path) -> dict[Path, str]:
+    return {path.relative_to(folder): path.read_text() for path in sorted(folder.rglob("*")) if path.is_file()}
+
+
+def test_graphql_exporter_reentrant():
+    """
+    GraphQL exports running in parallel threads do not share any state
+    """
+    trees = [get_tree() for _ in range(4)]
+
+    def export(tree: VSSNode) -> tuple[str, dict]:
+        exporter = GraphQLExporter(tree)
+        return f"{exporter.get_schema()}\n", exporter.export_mappings()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(export, trees))
+
+    expected = (TEST_DIR / "expected.graphql").read_text()
+    for schema, mappings in results:
+        assert schema == expected
+        assert mappings == results[0][1]
+    assert "A.B" in results[0][1]["vspec_branches"]["mappings"]
+
+
+def test_samm_exporter_reentrant(tmp_path: Path):
+    """
+    SAMM exports with different namespaces running in parallel threads do not share any state
+    """
+    namespaces = ["com.covesa.vss.spec", "org.example.vss", "com.covesa.vss.spec", "org.example.vss"]
+    trees = [get_tree() for _ in namespaces]
+
+    def export(index: int) -> Path:
+        return export_samm(trees[index], tmp_path / str(index), namespaces[index], True, 1)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        folders = list(executor.map(export, range(len(namespaces))))
+
+    expected = get_files(TEST_DIR / "expected.samm")
+    assert get_files(tmp_path / "0") == expected
+    assert get_files(tmp_path / "2") == expected
+
+    other = get_files(tmp_path / "1")
+    assert other == get_files(tmp_path / "3")
+    assert folders[1] == tmp_path / "1" / "org.example.vss" / "1.0.0"
+    for content in other.values():
+        assert "urn:samm:org.example.vss:1.0.0#" in content
+        assert "com.covesa.vss.spec" not in content
+
+
+def test_samm_exporter_jobs(tmp_path: Path):
+    """
+    Split aspect models built in worker processes are the same as the sequentially built ones
+    """
+    sequential = export_samm(get_tree(), tmp_path / "sequential", "com.covesa.vss.spec", True, 2, jobs=1)
+    parallel = export_samm(get_tree(), tmp_path / "parallel", "com.covesa.vss.spec", True, 2, jobs=2)
+
+    assert get_files(parallel) == get_files(sequential)
+    assert get_files(tmp_path / "parallel") == get_files(TEST_DIR / "expected.samm")
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from vss_tools.exporters.samm import export_samm
+from vss_tools.exporters.samm.helpers.ttl_graph import XSD, Literal, format_double, quote
+from vss_tools.main import get_trees
+
+HERE = Path(__file__).resolve().parent
+TEST_UNITS = HERE / ".." / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / ".." / "vspec" / "test_quantities.yaml"
+
+
+def export(vspec: Path, folder: Path, split: bool, direct_ttl: bool) -> dict[Path, Path]:
+    tree, _ = get_trees(vspec=vspec, units=(TEST_UNITS,), quantities=(TEST_QUANT,), expand=False)
+    export_samm(tree, folder, "com.covesa.vss.spec", split, 1, direct_ttl=direct_ttl)
+    return {path.relative_to(folder): path for path in sorted(folder.rglob("*.ttl"))}
+
+
+@pytest.mark.parametrize("split", [True, False])
+@pytest.mark.parametrize("test_dir", ["test_instances", "test_datatypes", "test_min_max", "test_comment"])
+def test_direct_ttl_isomorphic(test_dir: str, split: bool, tmp_path: Path):
+    """
+    The directly written TTLs describe the same RDF graphs as the ones serialized with rdflib
+    """
+    vspec = HERE / ".." / "vspec" / test_dir / "test.vspec"
+    expected = export(vspec, tmp_path / "rdflib", split, False)
+    result = export(vspec, tmp_path / "direct", split, True)
+
+    assert expected
+    assert result.keys() == expected.keys()
+    for name, path in result.items():
+        graph = Graph().parse(path, format="ttl")
+        assert len(graph) > 0
+        assert isomorphic(graph, Graph().parse(expected[name], format="ttl")), name
+
+
+def test_direct_ttl_does_not_import_rdflib(tmp_path: Path):
+    code = f"""
+import sys
+from pathlib import Path
+
+from vss_tools.exporters.samm import export_samm
+from vss_tools.main import get_trees
+
+tree, _ = get_trees(
+    vspec=Path("{HERE / ".." / "vspec" / "test_instances" / "test.vspec"}"),
+    units=(Path("{TEST_UNITS}"),),
+    quantities=(Path("{TEST_QUANT}"),),
+    expand=False,
+)
+export_samm(tree, Path("{tmp_path}"), "com.covesa.vss.spec", True, 1, direct_ttl=True)
+assert "rdflib" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+    assert list(tmp_path.rglob("*.ttl"))
+
+
+def test_literals():
+    assert Literal(True, datatype=XSD.boolean).lexical == "true"
+    assert Literal("a", "en") == Literal("a", "en")
+    assert Literal("a", "en") != Literal("a", "de")
+    assert format_double("2.5") == "2.5e+00"
+    assert format_double("-100") == "-1e+02"
+    assert format_double("abc") == "abc"
+    assert quote('say "hi"') == '"say \\"hi\\""'
+    assert quote("two\nlines") == '"""two\nlines"""'
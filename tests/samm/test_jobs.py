@@ -0,0 +1,58 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+import pytest
+from vss_tools.exporters.samm import export_samm
+from vss_tools.exporters.samm.config.config import Config
+from vss_tools.exporters.samm.helpers import vss_helper
+from vss_tools.exporters.samm.helpers.ttl_helper import dump_work_item, load_work_item
+from vss_tools.main import get_trees
+
+HERE = Path(__file__).resolve().parent
+TEST_UNITS = HERE / ".." / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / ".." / "vspec" / "test_quantities.yaml"
+VSPEC = HERE / ".." / "vspec" / "test_instances" / "test.vspec"
+
+
+def export(folder: Path, jobs: int) -> dict[Path, bytes]:
+    tree, _ = get_trees(vspec=VSPEC, units=(TEST_UNITS,), quantities=(TEST_QUANT,), expand=False)
+    export_samm(tree, folder, "com.covesa.vss.spec", True, 2, jobs=jobs)
+    return {path.relative_to(folder): path.read_bytes() for path in sorted(folder.rglob("*.ttl"))}
+
+
+@pytest.mark.parametrize("jobs", [2, None])
+def test_jobs_same_output(jobs: int | None, tmp_path: Path):
+    """
+    Building the split aspect models in worker processes gives the same TTLs as building them sequentially
+    """
+    expected = export(tmp_path / "sequential", 1)
+    assert len(expected) > 1
+    assert export(tmp_path / "parallel", jobs) == expected
+
+
+def test_work_item():
+    """
+    A work item holds the subtree of the split node and its ancestors, but no other nodes
+    """
+    tree, _ = get_trees(vspec=VSPEC, units=(TEST_UNITS,), quantities=(TEST_QUANT,), expand=False)
+    config = Config("com.covesa.vss.spec", "1.0.0", 2)
+    vss_helper.count_vss_tree_unique_node_names(config, tree)
+    tree.ttl_name = "VehicleTtl"
+    vss_node = tree.children[0]
+
+    item_config, item_node = load_work_item(dump_work_item(config, vss_node))
+
+    assert item_node.get_fqn() == vss_node.get_fqn()
+    assert item_node.depth == vss_node.depth
+    assert item_node.root.ttl_name == "VehicleTtl"
+    assert item_node.root.children == (item_node,)
+    assert [node.get_fqn() for node in item_node.descendants] == [node.get_fqn() for node in vss_node.descendants]
+    assert item_config.split_depth == config.split_depth
+    names = {node.name for node in vss_node.path + vss_node.descendants}
+    assert item_config.unique_node_names.keys() == names
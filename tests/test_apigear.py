@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+import yaml
+from vss_tools.exporters.apigear import (
+    ApiGearProperty,
+    ApiGearStructure,
+    ApiGearType,
+    SolutionLayers,
+    export_apigear,
+    get_modules,
+    get_struct_names,
+)
+from vss_tools.main import get_trees
+
+HERE = Path(__file__).resolve().parent
+TEST_DIR = HERE / "vspec" / "test_structs"
+TEST_UNITS = HERE / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / "vspec" / "test_quantities.yaml"
+
+
+def get_interfaces(modules) -> dict[str, list[str]]:
+    return {
+        interface.name: list(interface.properties)
+        for module in modules.values()
+        for interface in module.interfaces
+        if interface.properties
+    }
+
+
+def test_get_struct_names():
+    structures = {name: ApiGearStructure(name) for name in ("A", "B", "C", "D")}
+    structures["A"].properties["b"] = ApiGearProperty(ApiGearType("B"))
+    structures["B"].properties["c"] = ApiGearProperty(ApiGearType.array("C"))
+    structures["C"].properties["a"] = ApiGearProperty(ApiGearType("A"))
+    assert get_struct_names(["int32", "A"], structures) == {"A", "B", "C"}
+    assert get_struct_names(["D", "string"], structures) == {"D"}
+
+
+OVERLAY = """
+A.B:
+  type: branch
+  description: B
+A.B.Nested:
+  type: sensor
+  datatype: VehicleDataTypes.TestBranch1.NestedStruct
+  description: Nested
+A.B.Enum:
+  type: sensor
+  datatype: string
+  allowed: ['x', 'y']
+  description: Enum
+"""
+
+
+def test_split_modules(tmp_path: Path):
+    overlay = tmp_path / "overlay.vspec"
+    overlay.write_text(OVERLAY)
+    tree, datatype_tree = get_trees(
+        vspec=TEST_DIR / "test.vspec",
+        types=(TEST_DIR / "VehicleDataTypes.vspec",),
+        units=(TEST_UNITS,),
+        quantities=(TEST_QUANT,),
+        overlays=(overlay,),
+    )
+    single = get_modules(tree, datatype_tree, False)
+    split = get_modules(tree, datatype_tree, True)
+    assert list(single) == ["A"]
+    assert list(split) == ["A", "A_B"]
+    assert [s.name for s in split["A_B"].structures] == ["VehicleDataTypes_TestBranch1_NestedStruct"]
+
+    # Same interfaces and enumerations, distributed over the modules
+    assert get_interfaces(split) == get_interfaces(single)
+    assert sorted(e.name for m in split.values() for e in m.enumerations) == sorted(
+        e.name for e in single[tree.name].enumerations
+    )
+
+    # Every module has all the structures it uses
+    struct_names = {s.name for s in single[tree.name].structures}
+    for module in split.values():
+        names = {s.name for s in module.structures}
+        used = {p.type.type for i in module.interfaces for p in i.properties.values()}
+        used |= {p.type.type for s in module.structures for p in s.properties.values()}
+        assert used & struct_names <= names
+
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    export_apigear(output_dir, tree, datatype_tree, {SolutionLayers.QT6: Path("qt6")}, True)
+    solution = yaml.safe_load((output_dir / "A.solution.yaml").read_text())
+    inputs = solution["layers"][0]["inputs"]
+    assert inputs == [f"{name}.module.yaml" for name in split]
+    for filename in inputs:
+        module = yaml.safe_load((output_dir / filename).read_text())
+        assert f"{module['name']}.module.yaml" == filename
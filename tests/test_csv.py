@@ -0,0 +1,54 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+from vss_tools.exporters.csv import get_attribute_getters, get_columns, get_header, write_csv
+from vss_tools.model import VSSDataDatatype
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A", "instances": ["L", "R"]},
+    "A.B": {"type": "sensor", "datatype": "uint8", "description": "B", "min": 0, "dbc": "x"},
+    "A.C": {"type": "actuator", "datatype": "string", "description": "C", "allowed": ["x", "y"]},
+}
+
+
+def test_attribute_getters(make_tree):
+    columns = get_columns(True, ("dbc",))
+    getters = get_attribute_getters(VSSDataDatatype, columns)
+    # Compiled once per data class
+    assert get_attribute_getters(VSSDataDatatype, columns) is getters
+
+    data = make_tree(DATA).children[0].get_vss_data()
+    assert isinstance(data, VSSDataDatatype)
+    assert [getter(data) for getter in getters] == [
+        "sensor",
+        "uint8",
+        "",
+        "",
+        0,
+        "",
+        "B",
+        "",
+        "",
+        "",
+        "",
+        "x",
+    ]
+
+
+def test_write_csv(tmp_path: Path, make_tree):
+    output = tmp_path / "out.csv"
+    header = get_header("Signal", True, ("dbc",))
+    assert write_csv(output, header, [(make_tree(DATA), ("dbc",))], True) == output
+    assert output.read_text().splitlines() == [
+        "Signal,Type,DataType,Deprecated,Unit,Min,Max,Desc,Comment,Allowed,Default,Instances,dbc",
+        "A,branch,,,,,,A,,,,\"['L', 'R']\",",
+        "A.B,sensor,uint8,,,0,,B,,,,,x",
+        "A.C,actuator,string,,,,,C,,\"['x', 'y']\",,,",
+    ]
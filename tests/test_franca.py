@@ -0,0 +1,29 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from io import StringIO
+
+from vss_tools.exporters.franca import print_franca_content
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A"},
+    "A.B": {"type": "branch", "description": "B"},
+    "A.B.C": {"type": "sensor", "datatype": "uint8", "description": "C", "min": 1},
+    "A.D": {"type": "actuator", "datatype": "string", "description": "D", "allowed": ["x", "y"]},
+}
+
+
+def test_print_franca_content(make_tree):
+    file = StringIO()
+    print_franca_content(file, make_tree(DATA))
+    assert file.getvalue() == (
+        '{\tname: "A.B",\n\ttype: "branch",\n\tdescription: "B"\n},\n'
+        '{\tname: "A.B.C",\n\ttype: "sensor",\n\tdescription: "C",\n\tdatatype: "uint8",\n\tmin: 1\n},\n'
+        '{\tname: "A.D",\n\ttype: "actuator",\n\tdescription: "D",\n\tdatatype: "string",\n'
+        "\tallowed: ['x', 'y']\n}"
+    )
@@ -0,0 +1,55 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from vss_tools.exporters.go import GoStruct, GoStructMember, StructNames
+
+
+def get_structs(members: dict[str, list[str]]) -> dict[str, GoStruct]:
+    structs = {}
+    for name, datatypes in members.items():
+        struct = GoStruct(name)
+        struct.members = [GoStructMember(datatype.split(".")[-1], datatype) for datatype in datatypes]
+        structs[name] = struct
+    return structs
+
+
+def test_shorten_struct_names():
+    structs = get_structs(
+        {
+            "Vehicle": ["Vehicle.Cabin", "float32"],
+            "Vehicle.Cabin": ["[]Vehicle.Cabin.Door", "Vehicle.Cabin.Door.I1"],
+            "Vehicle.Cabin.Door": ["[]uint8"],
+            "Vehicle.Cabin.Door.I1": [],
+            "Other.Door": [],
+            "X": ["X.I1"],
+            "X.I1": [],
+        }
+    )
+    StructNames(structs).shorten()
+
+    # 'Cabin' is not stripped, as 'Cabin.Door' would conflict with 'Door' (from 'Other.Door')
+    # 'X.I1' is not stripped, as it would only be an instance id
+    assert [struct.name for struct in structs.values()] == [
+        "Vehicle",
+        "Cabin",
+        "Cabin.Door",
+        "Cabin.Door.I1",
+        "Door",
+        "X",
+        "X.I1",
+    ]
+    assert [member.datatype for member in structs["Vehicle"].members] == ["Cabin", "float32"]
+    assert [member.datatype for member in structs["Vehicle.Cabin"].members] == ["[]Cabin.Door", "Cabin.Door.I1"]
+    assert [member.datatype for member in structs["Vehicle.Cabin.Door"].members] == ["[]uint8"]
+    assert [member.datatype for member in structs["X"].members] == ["X.I1"]
+
+
+def test_shorten_struct_names_rounds():
+    structs = get_structs({"A.B.C": ["A.B.C.D"], "A.B.C.D": [], "E.F": []})
+    StructNames(structs).shorten()
+    assert [struct.name for struct in structs.values()] == ["C", "D", "F"]
+    assert structs["A.B.C"].members[0].datatype == "D"
@@ -0,0 +1,87 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+import pytest
+from vss_tools.exporters.jsonschema import add_node, get_type_nodes
+from vss_tools.main import get_trees
+from vss_tools.tree import VSSNode
+
+HERE = Path(__file__).resolve().parent
+TEST_DIR = HERE / "vspec" / "test_structs"
+TEST_UNITS = HERE / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / "vspec" / "test_quantities.yaml"
+
+NESTED = "VehicleDataTypes.TestBranch1.NestedStruct"
+PARENT = "VehicleDataTypes.TestBranch1.ParentStruct"
+
+
+def get_test_trees() -> tuple[VSSNode, VSSNode | None]:
+    return get_trees(
+        vspec=TEST_DIR / "test.vspec",
+        types=(TEST_DIR / "VehicleDataTypes.vspec",),
+        units=(TEST_UNITS,),
+        quantities=(TEST_QUANT,),
+    )
+
+
+def get_schema(inline_structs: bool) -> dict[str, Any]:
+    tree, datatype_tree = get_test_trees()
+    schema: dict[str, Any] = {"$schema": "https://json-schema.org/draft/2020-12/schema", "title": tree.name}
+    defs: dict[str, Any] | None = None if inline_structs else {}
+    add_node(schema, tree, get_type_nodes(datatype_tree), True, False, False, defs)
+    if defs:
+        schema["$defs"] = defs
+    return schema
+
+
+def test_type_nodes():
+    _, datatype_tree = get_test_trees()
+    type_nodes = get_type_nodes(datatype_tree)
+    assert type_nodes[NESTED].name == "NestedStruct"
+    assert f"{NESTED}.x" in type_nodes
+    assert get_type_nodes(None) == {}
+
+
+def test_struct_defs():
+    schema = get_schema(False)
+    assert list(schema["$defs"]) == [PARENT, NESTED]
+
+    sensors = schema["properties"]
+    assert sensors["ParentStructSensor"]["$ref"] == f"#/$defs/{PARENT}"
+    assert sensors["ParentStructSensor"]["description"] == "A rich sensor with user-defined data type."
+    assert sensors["NestedStructSensor"]["$ref"] == f"#/$defs/{NESTED}"
+
+    parent = schema["$defs"][PARENT]["properties"]
+    assert parent["x_property"]["$ref"] == f"#/$defs/{NESTED}"
+    assert parent["x_properties"]["items"] == {"$ref": f"#/$defs/{NESTED}"}
+    assert parent["z_property"]["type"] == "number"
+
+
+def test_inline_structs():
+    schema = get_schema(True)
+    assert "$defs" not in schema
+    sensor = schema["properties"]["ParentStructSensor"]
+    assert sensor["properties"]["x_properties"]["items"]["properties"]["x"]["minimum"] == -10
+
+
+@pytest.mark.parametrize(
+    "instance, valid",
+    [
+        ({"ParentStructSensor": {"x_properties": [{"x": 1, "y": 2}], "z_property": 3}}, True),
+        ({"ParentStructSensor": {"x_properties": [{"x": -11}]}}, False),
+        ({"NestedStructSensor": {"y": 11}}, False),
+        ({"NestedStructSensor": {"unknown": 1}}, False),
+    ],
+)
+def test_struct_defs_validate_like_inlined(instance: dict[str, Any], valid: bool):
+    for schema in (get_schema(False), get_schema(True)):
+        errors = list(jsonschema.Draft202012Validator(schema).iter_errors(instance))
+        assert not errors if valid else errors
@@ -0,0 +1,77 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+import pytest
+from vss_tools.exporters.csv import get_columns
+from vss_tools.exporters.parquet import ColumnsVisitor, get_number_array, get_table, get_types_output, write_table
+from vss_tools.exporters.traversal import traverse
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A", "fka": ["Old"]},
+    "A.B": {"type": "sensor", "datatype": "uint8", "description": "B", "min": 0, "max": 10, "dbc": {"x": 1}},
+    "A.C": {"type": "actuator", "datatype": "float", "description": "C", "allowed": [1.5, 2], "default": 1.5},
+}
+
+
+def test_columns(make_tree):
+    visitor = ColumnsVisitor(get_columns(False, ("fka", "dbc")))
+    traverse(make_tree(DATA), [visitor])
+    columns = visitor.columns
+    assert columns["name"] == ["A", "A.B", "A.C"]
+    assert columns["type"] == ["branch", "sensor", "actuator"]
+    assert columns["datatype"] == [None, "uint8", "float"]
+    assert columns["min"] == [None, 0, None]
+    assert columns["max"] == [None, 10, None]
+    assert columns["allowed"] == [None, None, ["1.5", "2"]]
+    assert columns["default"] == [None, None, "1.5"]
+    assert columns["fka"] == [["Old"], [], []]
+    assert columns["dbc"] == [None, '{"x": 1}', None]
+
+
+def test_types_output():
+    assert get_types_output(Path("out/vss.parquet")) == Path("out/vss_types.parquet")
+
+
+@pytest.mark.parametrize("feather", [False, True])
+def test_write_table(tmp_path: Path, feather: bool, make_tree):
+    pa = pytest.importorskip("pyarrow")
+    from pyarrow import feather as arrow_feather
+    from pyarrow import parquet
+
+    table = get_table(make_tree(DATA), True, ("dbc",))
+    assert table.column_names[:2] == ["name", "type"]
+    assert table.column_names[-3:] == ["instances", "fka", "dbc"]
+    assert pa.types.is_dictionary(table.schema.field("type").type)
+    assert table.schema.field("min").type == pa.int64()
+    assert table.schema.field("allowed").type == pa.list_(pa.string())
+
+    output = tmp_path / "out"
+    write_table(table, output, feather)
+    read = arrow_feather.read_table(output) if feather else parquet.read_table(output)
+    assert read.column("name").to_pylist() == ["A", "A.B", "A.C"]
+    assert read.column("max").to_pylist() == [None, 10, None]
+    assert read.column("allowed").to_pylist() == [None, None, ["1.5", "2"]]
+
+
+@pytest.mark.parametrize(
+    "values, datatype",
+    [
+        ([None, -(2**63), 2**63 - 1], "int64"),
+        ([None, 0, 2**64 - 1], "uint64"),
+        ([None, 0.5, 2**53], "double"),
+        ([-1, 2**64 - 1], "decimal128(20, 0)"),
+        ([0.25, 2**64 - 1], "decimal128(22, 2)"),
+    ],
+)
+def test_number_array(values: list, datatype: str):
+    pytest.importorskip("pyarrow")
+    array = get_number_array(values)
+    assert str(array.type) == datatype
+    assert array.to_pylist() == values
@@ -0,0 +1,52 @@
+# Copyright (c) 2025 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from pathlib import Path
+
+from vss_tools.exporters.plantuml import Renderer, get_plant_code
+from vss_tools.main import get_trees
+from vss_tools.tree import VSSNode
+
+HERE = Path(__file__).resolve().parent
+TEST_DIR = HERE / "vspec" / "test_allowed"
+TEST_UNITS = HERE / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / "vspec" / "test_quantities.yaml"
+
+
+def get_tree() -> VSSNode:
+    tree, _ = get_trees(vspec=TEST_DIR / "test.vspec", units=(TEST_UNITS,), quantities=(TEST_QUANT,))
+    return tree
+
+
+def test_plant_code_reentrant():
+    """
+    Enums are deduplicated per export, not for all exports
+    """
+    expected = (TEST_DIR / "expected.plantuml").read_text()
+    assert get_plant_code(get_tree(), None) == expected
+    assert get_plant_code(get_tree(), None) == expected
+
+
+def test_enum_packages(make_tree):
+    data = {
+        "A": {"type": "branch", "description": "A"},
+        "A.B": {"type": "branch", "description": "B", "instances": ["L", "R"]},
+        "A.B.E": {"type": "sensor", "datatype": "string", "description": "E", "allowed": ["x", "y"]},
+        "A.C": {"type": "branch", "description": "C"},
+        "A.C.D": {"type": "sensor", "datatype": "uint8", "description": "D"},
+    }
+    tree = make_tree(data, expand_instances=True)
+
+    renderer = Renderer(tree)
+    # One enum for all instances, only packages containing enums
+    assert renderer.enum_fqns == {"PB.E"}
+    assert renderer.enum_lines == ["", "package PB {", "", "\t' E", "\tenum E {", "\t\tx,", "\t\ty,", "\t}", "}"]
+    # Only the first instance is rendered as class
+    assert "\tclass BIS {" in renderer.class_lines
+    assert renderer.class_lines.count("\tclass B {") == 1
+
+    assert Renderer(tree, False).enum_lines == []
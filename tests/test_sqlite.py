@@ -0,0 +1,71 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+import sqlite3
+from pathlib import Path
+
+import pytest
+from vss_tools.datatypes import dynamic_units
+from vss_tools.exporters.sqlite import RowsVisitor, write_catalog
+from vss_tools.exporters.utils import get_instances_meta
+from vss_tools.model import VSSQuantity, VSSUnit
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A"},
+    "A.B": {"type": "branch", "description": "B", "instances": ["L", "R"]},
+    "A.B.C": {"type": "sensor", "datatype": "uint8", "description": "C", "unit": "km/h", "min": 0, "dbc": "x"},
+    "A.D": {"type": "actuator", "datatype": "string", "description": "D", "allowed": ["x", "y"]},
+}
+
+
+def test_write_catalog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_tree):
+    unit = VSSUnit.model_construct(
+        definition="Speed", unit="km/h", quantity="velocity", allowed_datatypes=["uint8", "float"]
+    )
+    monkeypatch.setitem(dynamic_units, "km/h", unit)
+    units = {"km/h": unit}
+    root = make_tree(DATA, expand_instances=True)
+    rows = RowsVisitor(False, ("dbc",))
+    rows.add_tree(root, "signals")
+    quantities = {"velocity": VSSQuantity(definition="Velocity")}
+    output = tmp_path / "vss.db"
+    output.write_text("replaced")
+    write_catalog(output, rows, get_instances_meta(root), units, quantities)
+
+    connection = sqlite3.connect(output)
+    nodes = connection.execute("SELECT id, fqn, parent, tree, type, datatype, unit FROM node ORDER BY id").fetchall()
+    assert nodes[:3] == [
+        (1, "A", None, "signals", "branch", None, None),
+        (2, "A.B", 1, "signals", "branch", None, None),
+        (3, "A.B.L", 2, "signals", "branch", None, None),
+    ]
+    assert len(nodes) == 7
+
+    sensors = connection.execute(
+        "SELECT fqn FROM node WHERE type = 'sensor' AND unit = 'km/h' AND fqn GLOB 'A.B.*' ORDER BY fqn"
+    ).fetchall()
+    assert sensors == [("A.B.L.C",), ("A.B.R.C",)]
+
+    attributes = connection.execute(
+        "SELECT a.name, a.value FROM attribute a JOIN node n ON n.id = a.node WHERE n.fqn = 'A.B.L.C' ORDER BY a.name"
+    ).fetchall()
+    assert attributes == [("dbc", '"x"'), ("min", "0")]
+    assert connection.execute("SELECT value FROM attribute WHERE name = 'allowed'").fetchall() == [('["x", "y"]',)]
+
+    instances = connection.execute(
+        "SELECT n.fqn, i.name FROM instance i JOIN node n ON n.id = i.node ORDER BY i.name"
+    ).fetchall()
+    assert instances == [("A.B", "L"), ("A.B", "R")]
+
+    assert connection.execute("SELECT * FROM unit").fetchall() == [("km/h", "km/h", "Speed", "velocity")]
+    assert connection.execute("SELECT datatype FROM unit_datatype").fetchall() == [("uint8",), ("float",)]
+    assert connection.execute("SELECT * FROM quantity").fetchall() == [("velocity", "Velocity", None, None)]
+
+    plan = connection.execute("EXPLAIN QUERY PLAN SELECT id FROM node WHERE parent = 1").fetchall()
+    assert "node_parent" in plan[0][-1]
+    connection.close()
@@ -0,0 +1,133 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from anytree import PreOrderIter  # type: ignore[import]
+from vss_tools.exporters.franca import FrancaVisitor
+from vss_tools.exporters.traversal import Visit, Visitor, traverse
+from vss_tools.main import get_trees
+from vss_tools.model import VSSDataBranch
+from vss_tools.tree import NoInstanceRootException
+
+HERE = Path(__file__).resolve().parent
+INSTANCES_DIR = HERE / "vspec" / "test_instances"
+TEST_UNITS = HERE / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / "vspec" / "test_quantities.yaml"
+
+
+class Recorder(Visitor):
+    def __init__(self, skip: str | None = None) -> None:
+        self.skip = skip
+        self.events: list[str] = []
+        self.visits: list[Visit] = []
+        self.finished = False
+
+    def enter(self, visit: Visit) -> bool | None:
+        self.events.append(f"+{visit.fqn}")
+        self.visits.append(visit)
+        return visit.fqn != self.skip
+
+    def leave(self, visit: Visit) -> None:
+        self.events.append(f"-{visit.fqn}")
+
+    def finish(self) -> None:
+        self.finished = True
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A"},
+    "A.B": {"type": "branch", "description": "B", "instances": ["Row[1,2]", ["L", "R"]]},
+    "A.B.C": {"type": "sensor", "datatype": "uint8", "description": "C", "min": 1},
+    "A.D": {"type": "actuator", "datatype": "string", "description": "D"},
+}
+
+
+def test_visit_info(make_tree):
+    root = make_tree(DATA, expand_instances=True)
+    recorder = Recorder()
+    traverse(root, [recorder])
+
+    assert recorder.finished
+    assert [visit.node for visit in recorder.visits] == list(PreOrderIter(root))
+    for visit in recorder.visits:
+        node = visit.node
+        assert visit.fqn == node.get_fqn()
+        assert visit.depth == node.depth
+        assert visit.parent_fqn == (node.parent.get_fqn() if node.parent else None)
+        assert visit.is_instance == getattr(node.data, "is_instance", False)
+        if visit.instance_root:
+            root_node, hops = node.get_instance_root()
+            assert visit.instance_root.node is root_node
+            assert visit.instance_hops == hops
+
+    visits = {visit.fqn: visit for visit in recorder.visits}
+    assert visits["A.B.Row1.L"].instance_root is visits["A.B"]
+    assert visits["A.B.Row1.L"].instance_hops == 2
+    assert visits["A.B.Row1.L.C"].instance_root is None
+    assert visits["A.B.Row1.L.C"].attributes["min"] == 1
+    assert "max" not in visits["A.B.Row1.L.C"].attributes
+    assert visits["A.B.Row1.L.C"].attributes.get("max", "") == ""
+
+
+def test_skip_per_visitor(make_tree):
+    root = make_tree(DATA, expand_instances=True)
+    skipping = Recorder(skip="A.B")
+    full = Recorder()
+    traverse(root, [skipping, full])
+
+    assert skipping.events == ["+A", "+A.B", "-A.B", "+A.D", "-A.D", "-A"]
+    assert len(full.visits) == len(list(PreOrderIter(root)))
+    assert full.events[-1] == "-A"
+
+
+def test_skip_all_visitors(make_tree):
+    root = make_tree(DATA, expand_instances=True)
+    recorder = Recorder(skip="A")
+    traverse(root, [recorder])
+    assert recorder.events == ["+A", "-A"]
+
+
+def test_shared_walk(make_tree):
+    root = make_tree(DATA, expand_instances=True)
+    file = StringIO()
+    recorder = Recorder()
+    traverse(root, [FrancaVisitor(file), recorder])
+    assert len(recorder.visits) == len(list(PreOrderIter(root)))
+    assert file.getvalue().startswith('{\tname: "A.B",\n')
+    assert file.getvalue().count("{\tname: ") == len(recorder.visits) - 1
+
+
+@pytest.mark.parametrize("expand", [True, False])
+def test_instance_facts(expand: bool) -> None:
+    """
+    The instance facts computed during the walk are the same as the ones of the VSSNode queries
+    """
+    tree, _ = get_trees(
+        vspec=INSTANCES_DIR / "test.vspec", quantities=(TEST_QUANT,), units=(TEST_UNITS,), expand=expand
+    )
+    recorder = Recorder()
+    traverse(tree, [recorder])
+
+    assert [visit.node for visit in recorder.visits] == list(PreOrderIter(tree))
+    for visit in recorder.visits:
+        node = visit.node
+        assert visit.fqn == node.get_fqn()
+        assert visit.instance_children_depth == node.count_instance_children_depth()
+        if isinstance(node.data, VSSDataBranch):
+            instance_root, hops = visit.get_instance_root()
+            assert (instance_root.node, hops) == node.get_instance_root()
+        else:
+            with pytest.raises(NoInstanceRootException):
+                visit.get_instance_root()
+
+    if expand:
+        visits = {visit.fqn: visit for visit in recorder.visits}
+        assert visits["A.B.Row1.Left"].get_instance_root() == (visits["A.B"], 2)
+        assert visits["A.B"].instance_children_depth == 2
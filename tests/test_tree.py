@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+import linecache
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+from vss_tools import log
+from vss_tools.main import get_trees
+from vss_tools.tree import VSSNode
+
+HERE = Path(__file__).resolve().parent
+OVERLAY_DIR = HERE / "vspec" / "test_overlay_on_instance"
+TEST_UNITS = HERE / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / "vspec" / "test_quantities.yaml"
+
+
+def count_fqn_calls_from_logging(monkeypatch: pytest.MonkeyPatch, level: int) -> int:
+    """
+    Runs the tree pipeline (including instance expansion and overlay merging)
+    and counts 'get_fqn' calls that originate from a logging statement
+    """
+    calls = 0
+    get_fqn = VSSNode.get_fqn
+
+    def counting_get_fqn(self, *args, **kwargs):
+        nonlocal calls
+        caller = sys._getframe(1)
+        if "log." in linecache.getline(caller.f_code.co_filename, caller.f_lineno):
+            calls += 1
+        return get_fqn(self, *args, **kwargs)
+
+    monkeypatch.setattr(VSSNode, "get_fqn", counting_get_fqn)
+    log.setLevel(level)
+    get_trees(
+        vspec=OVERLAY_DIR / "test.vspec",
+        overlays=(OVERLAY_DIR / "overlay_1.vspec", OVERLAY_DIR / "overlay_2.vspec"),
+        extended_attributes=("my_id",),
+        quantities=(TEST_QUANT,),
+        units=(TEST_UNITS,),
+    )
+    return calls
+
+
+def test_no_fqn_computation_for_disabled_debug_logs(monkeypatch: pytest.MonkeyPatch) -> None:
+    level = log.level
+    try:
+        assert count_fqn_calls_from_logging(monkeypatch, logging.DEBUG) > 0
+        assert count_fqn_calls_from_logging(monkeypatch, logging.INFO) == 0
+    finally:
+        log.setLevel(level)
@@ -0,0 +1,85 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+import subprocess
+from pathlib import Path
+
+from anytree import RenderTree
+from vss_tools.exporters.tree import TreeRenderer, get_rendered_tree, get_subtree
+from vss_tools.main import get_trees
+
+HERE = Path(__file__).resolve().parent
+TEST_UNITS = HERE / "vspec" / "test_units.yaml"
+TEST_QUANT = HERE / "vspec" / "test_quantities.yaml"
+VSPEC = HERE / "vspec" / "test_instances" / "test.vspec"
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A"},
+    "A.B": {"type": "branch", "description": "B"},
+    "A.B.C": {"type": "sensor", "datatype": "uint8", "description": "C", "min": 1},
+    "A.B.D": {"type": "sensor", "datatype": "uint8", "description": "D"},
+    "A.E": {"type": "branch", "description": "E"},
+    "A.E.F": {"type": "actuator", "datatype": "string", "description": "F"},
+    "A.G": {"type": "attribute", "datatype": "string", "description": "G"},
+}
+
+
+def test_same_as_render_tree(make_tree):
+    root = make_tree(DATA)
+    expected = []
+    for pre, fill, node in RenderTree(root):
+        expected.append(f"{pre}{node.name}")
+        if getattr(node.data, "min", None) is not None:
+            expected.append(f"{fill}min={node.data.min}")
+    assert get_rendered_tree(root, ("min",)) == "\n".join(expected)
+
+
+def test_max_depth(make_tree):
+    assert get_rendered_tree(make_tree(DATA), (), max_depth=1) == "A\n├── B\n├── E\n└── G"
+    assert get_rendered_tree(make_tree(DATA), (), max_depth=0) == "A"
+
+
+def test_subtree(make_tree):
+    root = make_tree(DATA)
+    subtree = get_subtree(root, "A.B")
+    assert subtree is not None
+    assert get_rendered_tree(subtree, ("description",)) == (
+        "B\ndescription='B'\n├── C\n│   description='C'\n└── D\n    description='D'"
+    )
+    assert get_subtree(root, "A.X") is None
+    assert get_subtree(root, "X.B") is None
+
+
+def test_match(make_tree):
+    root = make_tree(DATA)
+    assert get_rendered_tree(root, (), patterns=("A.B.C",)) == "A\n└── B\n    └── C"
+    assert get_rendered_tree(root, (), patterns=("A.E*", "*.D")) == "A\n├── B\n│   └── D\n└── E\n    └── F"
+    assert get_rendered_tree(root, (), max_depth=1, patterns=("A.E*",)) == "A\n└── E"
+    assert get_rendered_tree(root, (), patterns=("X*",)) == ""
+
+
+def test_match_prunes(make_tree):
+    root = make_tree(DATA)
+    renderer = TreeRenderer((), patterns=("A.E.*",))
+    assert list(renderer.iter_lines(root)) == ["A", "└── E", "    └── F"]
+    # The children of 'A.B' are never looked at
+    visited = {id(node) for node in root.descendants if id(node) in renderer.included}
+    assert visited == {id(node) for node in root.descendants if node.name in ("B", "E", "F", "G")}
+
+
+def test_cli_stdout(tmp_path: Path):
+    """
+    Without an output the tree is written to stdout, the same as into an output file
+    """
+    tree, _ = get_trees(vspec=VSPEC, units=(TEST_UNITS,), quantities=(TEST_QUANT,))
+    output = tmp_path / "out.txt"
+    cmd = f"vspec --log-level warning export tree -u {TEST_UNITS} -q {TEST_QUANT} -s {VSPEC} --attr unit"
+    process = subprocess.run(cmd.split(), capture_output=True, text=True, check=True)
+    subprocess.run([*cmd.split(), "-o", str(output)], check=True)
+    assert process.stdout == get_rendered_tree(tree, ("unit",)) + "\n"
+    assert output.read_text() == process.stdout.rstrip("\n")
@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+from vss_tools.tree import VSSNode
+from vss_tools.validation import (
+    ExtraAttributeRule,
+    NamingRule,
+    ParentRule,
+    get_rules,
+    report,
+    validate,
+)
+
+
+DATA = {
+    "A": {"type": "branch", "description": "A"},
+    "A.isOpen": {"type": "sensor", "datatype": "boolean", "description": "open", "e1": 1},
+    "A.B": {"type": "sensor", "datatype": "uint8", "description": "B"},
+    "A.B.C": {"type": "sensor", "datatype": "uint8", "description": "C"},
+    "A.Gone": {"type": "branch", "description": "Gone", "delete": True},
+    "A.Gone.x": {"type": "sensor", "datatype": "uint8", "description": "x", "e2": 2},
+}
+
+
+def test_validate_collects_all_findings(make_tree) -> None:
+    root = make_tree(DATA)
+    deleted: list[VSSNode] = []
+    rules = [ParentRule(), NamingRule(), ExtraAttributeRule(("e2",))]
+    findings = validate(root, rules, deleted)
+
+    assert [node.get_fqn() for node in deleted] == ["A.Gone"]
+    assert [(f.rule, f.fqn) for f in findings] == [
+        ("name-style", "A.isOpen"),
+        ("name-style", "A.isOpen"),
+        ("unknown-attribute", "A.isOpen"),
+        ("parent", "A.B.C"),
+    ]
+    assert report(rules, findings)
+
+
+def test_validate_without_deletion(make_tree) -> None:
+    findings = validate(make_tree(DATA), [ExtraAttributeRule()])
+    assert {(f.fqn, f.msg) for f in findings} == {
+        ("A.isOpen", "Unknown extra attribute: 'A.isOpen':'e1'"),
+        ("A.Gone.x", "Unknown extra attribute: 'A.Gone.x':'e2'"),
+    }
+    assert not report([ExtraAttributeRule()], findings)
+
+
+def test_get_rules() -> None:
+    assert [r.name for r in get_rules(False, (), ())] == ["parent", "unknown-attribute"]
+    assert [r.name for r in get_rules(False, ("name-style",), ())] == ["parent", "name-style", "unknown-attribute"]
+    assert [r.name for r in get_rules(True, (), ())] == ["parent", "name-style", "unknown-attribute"]
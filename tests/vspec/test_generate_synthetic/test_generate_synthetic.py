@@ -0,0 +1,53 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import filecmp
+import json
+import subprocess
+from pathlib import Path
+
+
+def generate(output: Path, seed: int, include_depth: int = 2) -> None:
+    cmd = f"vspec generate-synthetic -o {output} --nodes 300 --overlays 2 --include-depth {include_depth} --seed {seed}"
+    subprocess.run(cmd.split(), check=True)
+
+
+def assert_same_dirs(dcmp: filecmp.dircmp) -> None:
+    assert not (dcmp.diff_files or dcmp.left_only or dcmp.right_only)
+    for sub in dcmp.subdirs.values():
+        assert_same_dirs(sub)
+
+
+def count_nodes(node: dict) -> int:
+    return 1 + sum(count_nodes(child) for child in node.get("children", {}).values())
+
+
+def test_generate_synthetic(tmp_path):
+    spec = tmp_path / "spec"
+    generate(spec, 3)
+    assert list(spec.glob("*/*.vspec"))
+
+    output = tmp_path / "out.json"
+    cmd = f"vspec export json --strict -s {spec / 'main.vspec'} -u {spec / 'units.yaml'} -q {spec / 'quantities.yaml'}"
+    cmd += f" -t {spec / 'types.vspec'} -l {spec / 'overlay_1.vspec'} -l {spec / 'overlay_2.vspec'} -o {output}"
+    subprocess.run(cmd.split(), check=True)
+    assert count_nodes(json.loads(output.read_text())["Vehicle"]) >= 300
+
+
+def test_generate_synthetic_deterministic(tmp_path):
+    generate(tmp_path / "a", 1)
+    generate(tmp_path / "b", 1)
+    generate(tmp_path / "c", 2)
+    assert_same_dirs(filecmp.dircmp(tmp_path / "a", tmp_path / "b"))
+    assert (tmp_path / "a" / "types.vspec").read_text() != (tmp_path / "c" / "types.vspec").read_text()
+
+
+def test_generate_synthetic_without_includes(tmp_path):
+    generate(tmp_path, 1, include_depth=0)
+    assert not list(tmp_path.glob("*/*.vspec"))
+    assert "#include" not in (tmp_path / "main.vspec").read_text()
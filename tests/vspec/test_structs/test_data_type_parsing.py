@@ -7,6 +7,7 @@
 # SPDX-License-Identifier: MPL-2.0
 
 import filecmp
+import json
 import subprocess
 from pathlib import Path
 
@@ -206,6 +207,58 @@ def test_data_types_export_to_proto(
         assert process.returncode == 0
 
 
+def test_data_types_export_to_proto_shared_import(tmp_path):
+    """
+    Test that a package is imported only once, even if several structs of a package use it
+    """
+    cmd = (
+        f"vspec export protobuf --types {HERE / 'VehicleDataTypesSharedImport.vspec'} -u {TEST_UNITS} -q {TEST_QUANT}"
+        f" --types-out-dir {tmp_path} --vspec {HERE / 'test2.vspec'} --output {tmp_path / 'out.proto'}"
+    )
+    subprocess.run(cmd.split(), cwd=tmp_path, check=True)
+
+    result = (tmp_path / "VehicleDataTypes" / "TestBranch2" / "TestBranch2.proto").read_text()
+    assert result.count('import "VehicleDataTypes/TestBranch3/TestBranch3.proto";') == 1
+    assert "message ParentStruct" in result
+    assert "message SecondStruct" in result
+
+
+def test_data_types_export_to_proto_split(tmp_path):
+    """
+    Test that split signal files are generated with a manifest and compile
+    """
+    output = tmp_path / "signals.proto"
+    types_out = tmp_path / "types"
+    cmd = (
+        f"vspec export protobuf --types {HERE / 'VehicleDataTypes2.vspec'} -u {TEST_UNITS} -q {TEST_QUANT}"
+        f" --types-out-dir {types_out} --vspec {HERE / 'test2.vspec'} --output {output} --split-depth 1"
+    )
+    subprocess.run(cmd.split(), cwd=tmp_path, check=True)
+
+    manifest = json.loads((tmp_path / "signals.manifest.json").read_text())
+    assert manifest == {
+        "signals": ["signals.proto"],
+        "types_dir": str(types_out),
+        "types": ["VehicleDataTypes/TestBranch2/TestBranch2.proto", "VehicleDataTypes/TestBranch3/TestBranch3.proto"],
+    }
+    # 'A' is the root, there are no branches at depth 1
+    assert output.read_text() == (HERE / "ExpectedSignals2.proto").read_text()
+
+    cmd = (
+        f"vspec export protobuf -u {TEST_UNITS} -q {TEST_QUANT}"
+        f" --vspec {HERE / 'test_split.vspec'} --output {output} --split-depth 1"
+    )
+    subprocess.run(cmd.split(), cwd=tmp_path, check=True)
+    manifest = json.loads((tmp_path / "signals.manifest.json").read_text())
+    assert manifest["signals"] == ["signals.proto", "signals/AB.proto", "signals/AC.proto"]
+    assert 'import "signals/AB.proto";' in output.read_text()
+    assert "message ABD" in (tmp_path / "signals" / "AB.proto").read_text()
+
+    for proto_file in manifest["signals"]:
+        process = subprocess.run(f"protoc {proto_file} --cpp_out=. -I {tmp_path}".split(), cwd=tmp_path)
+        assert process.returncode == 0
+
+
 @pytest.mark.parametrize(
     "types_file,error_msg",
     [
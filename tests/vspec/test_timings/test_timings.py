@@ -0,0 +1,63 @@
+# Copyright (c) 2024 Contributors to COVESA
+#
+# This program and the accompanying materials are made available under the
+# terms of the Mozilla Public License 2.0 which is available at
+# https://www.mozilla.org/en-US/MPL/2.0/
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import json
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from vss_tools.timings import collect, stage
+
+HERE = Path(__file__).resolve().parent
+TEST_UNITS = HERE / ".." / "test_units.yaml"
+TEST_QUANT = HERE / ".." / "test_quantities.yaml"
+SPEC = HERE / ".." / "test_overlay_on_instance" / "test.vspec"
+
+
+def test_timings(tmp_path):
+    timings = tmp_path / "timings.json"
+    prof = tmp_path / "out.prof"
+    output = tmp_path / "out.json"
+    cmd = f"vspec --timings-output {timings} --timings-memory --profile {prof}"
+    cmd += f" export json -u {TEST_UNITS} -q {TEST_QUANT}"
+    cmd += f" -e my_id --vspec {SPEC} --output {output}"
+    process = subprocess.run(cmd.split(), capture_output=True, text=True, check=True)
+    assert "Timings" in process.stderr
+    assert prof.exists()
+
+    stages = {stage["name"]: stage for stage in json.loads(timings.read_text())["stages"]}
+    assert stages["export json"]["depth"] == 0
+    for name in ["load_vspec", "build_tree", "expand_instances", "resolve", "validate"]:
+        assert stages[name]["depth"] == 1
+        assert stages[name]["wall_time"] >= 0
+        assert stages[name]["peak_memory"] > 0
+    assert stages["connect_orphans"]["depth"] == 2
+    assert stages["expand_instances"]["nodes"] > stages["build_tree"]["nodes"]
+
+
+def test_timings_without_memory(tmp_path):
+    timings = tmp_path / "timings.json"
+    cmd = f"vspec --timings-output {timings} export json -u {TEST_UNITS} -q {TEST_QUANT}"
+    cmd += f" -e my_id --vspec {SPEC} --output {tmp_path / 'out.json'}"
+    subprocess.run(cmd.split(), capture_output=True, text=True, check=True)
+
+    stages = json.loads(timings.read_text())["stages"]
+    assert stages
+    assert all(stage["peak_memory"] is None for stage in stages)
+
+
+def test_collect_is_context_local():
+    def record(name: str) -> None:
+        with stage(name):
+            pass
+
+    with collect() as timings:
+        record("main")
+        with ThreadPoolExecutor() as executor:
+            executor.submit(record, "thread").result()
+    assert [timing.name for timing in timings.report.stages] == ["main"]